@@ -55,7 +55,7 @@ from .core.table import (
     PebbleTableLoader,
 )
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
     "Pebble",
     "PebbleBooleanField",
     "PebbleChoiceConstraint",
@@ -97,6 +97,6 @@ __all__: Final[list[str]] = [
     "PebbleTypeConstraint",
     "PebbleUniqueConstraint",
     "PebbleUUIDField",
-]
+)
 
 __version__: Final[Literal["0.1.0"]] = "0.1.0"
@@ -6,12 +6,14 @@ Date: 2025-09-13
 import os
 
 from pathlib import Path
-from typing import Final, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal, Optional
 
-from core.utils import PebbleCommitService
+if TYPE_CHECKING:
+    # Import the PebbleCommitService class for type checkers only (i.e. the import stays lazy at runtime)
+    from .utils import PebbleCommitService
 
 
-__all__: Final[list] = [
+__all__: Final[tuple[str, ...]] = (
     "BOOLEAN",
     "CUSTOM",
     "CWD",
@@ -34,7 +36,7 @@ __all__: Final[list] = [
     "TIME",
     "TUPLE",
     "UUID",
-]
+)
 
 
 # Initialize the boolean field type as a module constant
@@ -82,9 +84,6 @@ NULL: Final[Literal["null"]] = "null"
 # Initialize the path field type as a module constant
 PATH: Final[Literal["path"]] = "path"
 
-# Initialize the PebbleCommitService instance as a module constant
-PEBBLE_COMMIT_SERVICE: Final[PebbleCommitService] = PebbleCommitService()
-
 # Initialize the regex field type as a module constant
 REGEX: Final[Literal["regex"]] = "regex"
 
@@ -102,3 +101,49 @@ TUPLE: Final[Literal["tuple"]] = "tuple"
 
 # Initialize the UUID field type as a module constant
 UUID: Final[Literal["uuid"]] = "uuid"
+
+# Initialize the lazily created PebbleCommitService instance (i.e. created on first access)
+_PEBBLE_COMMIT_SERVICE: Optional[Any] = None
+
+# Check if a type checker is running
+if TYPE_CHECKING:
+    # Declare the PebbleCommitService instance that __getattr__ creates on first access
+    # (i.e. the exported name is known to type checkers and linters without an assignment at runtime)
+    PEBBLE_COMMIT_SERVICE: PebbleCommitService
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Return the lazily created module attribute associated with the passed name.
+
+    The PebbleCommitService instance is only imported and created on first access
+    of PEBBLE_COMMIT_SERVICE, so importing this module does not pay for it.
+
+    Args:
+        name (str): The name of the attribute to return.
+
+    Returns:
+        Any: The attribute associated with the passed name.
+
+    Raises:
+        AttributeError: If the passed name is not a lazily created attribute.
+    """
+
+    # Declare the PebbleCommitService instance as global
+    global _PEBBLE_COMMIT_SERVICE
+
+    # Check if the passed name is not the PebbleCommitService instance
+    if name != "PEBBLE_COMMIT_SERVICE":
+        # Raise an AttributeError if the passed name is not a lazily created attribute
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Check if the PebbleCommitService instance has not been created yet
+    if _PEBBLE_COMMIT_SERVICE is None:
+        # Import the PebbleCommitService class (i.e. only when first needed)
+        from .utils import PebbleCommitService
+
+        # Create the PebbleCommitService instance
+        _PEBBLE_COMMIT_SERVICE = PebbleCommitService()
+
+    # Return the PebbleCommitService instance
+    return _PEBBLE_COMMIT_SERVICE
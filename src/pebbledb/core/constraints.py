@@ -3,12 +3,24 @@ Author: Louis Goodnews
 Date: 2025-09-20
 """
 
+import array
 import re
 
-from typing import override, Any, Final, Optional, Set, Union
+from functools import lru_cache
+from types import CodeType
+from typing import override, Any, Callable, Final, Iterable, Optional, Sequence, Set, Union
 
+try:
+    # Import the linear time RE2 regex engine (i.e. the optional google-re2 package)
+    import re2 as _re2
+except ImportError:
+    # Fall back to the backtracking regex engine of the standard library
+    _re2 = None
 
-__all__: Final[list[str]] = [
+from .constants import MISSING
+
+
+__all__: Final[tuple[str, ...]] = (
     "PebbleConstraint",
     "PebbleChoiceConstraint",
     "PebbleMaxLengthConstraint",
@@ -16,9 +28,56 @@ __all__: Final[list[str]] = [
     "PebbleNotNullConstraint",
     "PebbleRangeConstraint",
     "PebbleRegexConstraint",
+    "PebbleRegexSet",
     "PebbleTypeConstraint",
     "PebbleUniqueConstraint",
-]
+    "compile_schema_validator",
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile(
+    pattern: str,
+    flags: int = 0,
+    use_re2: bool = False,
+) -> Any:
+    """
+    Compile the passed regex pattern with the passed flags.
+
+    The compiled patterns are cached in a bounded cache, so regex constraints
+    constructed repeatedly with the same pattern share one compiled pattern.
+
+    If RE2 is requested and the google-re2 package is installed, patterns without
+    flags are compiled with RE2, which matches in linear time (i.e. is not prone to
+    ReDoS). RE2 is opt-in, as it does not match the same strings as the re module:
+    '$' does not match before a trailing newline (i.e. r"^\\d+$" rejects "123\\n")
+    and \\d, \\w and \\s only match ASCII characters. Patterns RE2 does not support
+    (e.g. backreferences or lookarounds) and patterns with flags are compiled with
+    the re module.
+
+    Args:
+        pattern (str): The regex pattern to compile.
+        flags (int, optional): The regex flags. Defaults to 0.
+        use_re2 (bool, optional): Whether to compile the pattern with RE2 if it is installed. Defaults to False.
+
+    Returns:
+        Any: The compiled regex pattern.
+    """
+
+    # Check if RE2 is requested, the RE2 regex engine is available and no flags are passed
+    if use_re2 and _re2 is not None and not flags:
+        try:
+            # Compile and return the passed pattern with the RE2 regex engine
+            return _re2.compile(pattern)
+        except _re2.error:
+            # Fall back to the re module if the pattern is not supported by RE2
+            pass
+
+    # Compile and return the passed pattern
+    return re.compile(
+        pattern,
+        flags,
+    )
 
 
 class PebbleConstraint:
@@ -26,6 +85,44 @@ class PebbleConstraint:
     A class representing a constraint in the PebbleDB library
     """
 
+    __slots__ = ()
+
+    # The slots shown in the string representation (cached per subclass)
+    __repr_fields__: tuple[str, ...] = ()
+
+    # The template of the string representation (cached per subclass)
+    __repr_template__: str = "<PebbleConstraint()>"
+
+    def __init_subclass__(cls) -> None:
+        """
+        Initialize the subclass.
+
+        Args:
+            cls (Type): The subclass to initialize.
+
+        Returns:
+            None
+        """
+
+        # Call the parent class' __init_subclass__ method
+        super().__init_subclass__()
+
+        # Cache the slots shown in the string representation (i.e. including the inherited ones, without the cached dictionary)
+        cls.__repr_fields__ = tuple(
+            slot
+            for klass in reversed(cls.__mro__)
+            for slot in klass.__dict__.get(
+                "__slots__",
+                (),
+            )
+            if slot != "_dict_cache"
+        )
+
+        # Precompute the template of the string representation (e.g. '<Constraint(field={!r}, ...)>')
+        cls.__repr_template__ = (
+            f"<{cls.__name__}({', '.join(f'{slot.lstrip('_')}={{!r}}' for slot in cls.__repr_fields__)})>"
+        )
+
     def __repr__(self) -> str:
         """
         Return a string representation of the instance.
@@ -34,8 +131,16 @@ class PebbleConstraint:
             str: The string representation of the instance.
         """
 
-        # Return a string representation of the instance
-        return f"<{self.__class__.__name__}({', '.join([f'{key.lstrip('_')}={value!r}' for key, value in self.__dict__.items()])})>"
+        # Return a string representation of the instance by filling in the precomputed template
+        return self.__repr_template__.format(
+            *[
+                getattr(
+                    self,
+                    slot,
+                )
+                for slot in self.__repr_fields__
+            ]
+        )
 
     def __str__(self) -> str:
         """
@@ -65,6 +170,30 @@ class PebbleConstraint:
         # Raise a NotImplementedError exception
         raise NotImplementedError
 
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Subclasses override this method to hoist their invariants out of the loop.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is valid, False otherwise.
+        """
+
+        # Return the validation result of each value
+        return list(
+            map(
+                self.validate,
+                values,
+            )
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the instance to a dictionary.
@@ -82,6 +211,12 @@ class PebbleChoiceConstraint(PebbleConstraint):
     A class representing a choice constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_choice_set",
+        "_choices",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         choices: list[Any],
@@ -99,6 +234,18 @@ class PebbleChoiceConstraint(PebbleConstraint):
         # Store the passed choices in an instance variable
         self._choices: Final[list[Any]] = choices
 
+        try:
+            # Store the choices as a frozenset for constant time membership tests
+            self._choice_set: Final[Union[frozenset[Any], list[Any]]] = frozenset(choices)
+        except TypeError:
+            # Fall back to the choices list if one of the choices is unhashable
+            self._choice_set: Final[Union[frozenset[Any], list[Any]]] = choices
+
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "choices": self._choices,
+        }
+
     @property
     def choices(self) -> list[Any]:
         """
@@ -126,8 +273,46 @@ class PebbleChoiceConstraint(PebbleConstraint):
             bool: True if the value is one of the choices, False otherwise.
         """
 
-        # Return True if the value is one of the choices
-        return value in self._choices
+        try:
+            # Return True if the value is one of the choices
+            return value in self._choice_set
+        except TypeError:
+            # Fall back to a linear scan of the choices list if the value is unhashable
+            return value in self._choices
+
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is one of the choices, False otherwise.
+        """
+
+        # Get the choices and the choices set once (i.e. outside of the loop)
+        choices: list[Any] = self._choices
+        choice_set: Union[frozenset[Any], list[Any]] = self._choice_set
+
+        # Initialize the result list
+        result: list[bool] = []
+
+        # Iterate over the passed values
+        for value in values:
+            try:
+                # Add whether the current value is one of the choices
+                result.append(value in choice_set)
+            except TypeError:
+                # Fall back to a linear scan of the choices list if the value is unhashable
+                result.append(value in choices)
+
+        # Return the result list
+        return result
 
     @override
     def to_dict(self) -> dict[str, Any]:
@@ -138,10 +323,8 @@ class PebbleChoiceConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "choices": self._choices,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleIsNullConstraint(PebbleConstraint):
@@ -149,6 +332,10 @@ class PebbleIsNullConstraint(PebbleConstraint):
     A class representing a null constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+    )
+
     def __init__(
         self,
     ) -> None:
@@ -159,8 +346,10 @@ class PebbleIsNullConstraint(PebbleConstraint):
             None
         """
 
-        # Do nothing
-        pass
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "is_null": True,
+        }
 
     @override
     def validate(
@@ -180,6 +369,24 @@ class PebbleIsNullConstraint(PebbleConstraint):
         # Return True if the value is null
         return value is None
 
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is null, False otherwise.
+        """
+
+        # Return for each value whether it is null
+        return [value is None for value in values]
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -189,10 +396,8 @@ class PebbleIsNullConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "is_null": True,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleMaxLengthConstraint(PebbleConstraint):
@@ -200,6 +405,11 @@ class PebbleMaxLengthConstraint(PebbleConstraint):
     A class representing a maximum length constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+        "_length",
+    )
+
     def __init__(
         self,
         length: int,
@@ -217,6 +427,11 @@ class PebbleMaxLengthConstraint(PebbleConstraint):
         # Store the passed length in an instance variable
         self._length: Final[int] = length
 
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "max_length": self._length,
+        }
+
     @property
     def length(self) -> int:
         """
@@ -247,6 +462,27 @@ class PebbleMaxLengthConstraint(PebbleConstraint):
         # Return True if the value is at most the maximum length
         return len(value) <= self._length
 
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is at most the maximum length, False otherwise.
+        """
+
+        # Get the maximum length once (i.e. outside of the loop)
+        maximum: int = self._length
+
+        # Return for each value whether it is at most the maximum length
+        return [length <= maximum for length in map(len, values)]
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -256,10 +492,8 @@ class PebbleMaxLengthConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "max_length": self._length,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleMinLengthConstraint(PebbleConstraint):
@@ -267,6 +501,11 @@ class PebbleMinLengthConstraint(PebbleConstraint):
     A class representing a minimum length constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+        "_length",
+    )
+
     def __init__(
         self,
         length: int,
@@ -284,6 +523,11 @@ class PebbleMinLengthConstraint(PebbleConstraint):
         # Store the passed length in an instance variable
         self._length: Final[int] = length
 
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "min_length": self._length,
+        }
+
     @property
     def length(self) -> int:
         """
@@ -314,6 +558,27 @@ class PebbleMinLengthConstraint(PebbleConstraint):
         # Return True if the value is at least the minimum length
         return len(value) >= self._length
 
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is at least the minimum length, False otherwise.
+        """
+
+        # Get the minimum length once (i.e. outside of the loop)
+        minimum: int = self._length
+
+        # Return for each value whether it is at least the minimum length
+        return [length >= minimum for length in map(len, values)]
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -323,10 +588,8 @@ class PebbleMinLengthConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "min_length": self._length,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleNotNullConstraint(PebbleConstraint):
@@ -334,6 +597,10 @@ class PebbleNotNullConstraint(PebbleConstraint):
     A class representing a not null constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+    )
+
     def __init__(
         self,
     ) -> None:
@@ -344,8 +611,10 @@ class PebbleNotNullConstraint(PebbleConstraint):
             None
         """
 
-        # Do nothing
-        pass
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "not_null": True,
+        }
 
     @override
     def validate(
@@ -365,6 +634,24 @@ class PebbleNotNullConstraint(PebbleConstraint):
         # Return True if the value is not null
         return value is not None
 
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is not null, False otherwise.
+        """
+
+        # Return for each value whether it is not null
+        return [value is not None for value in values]
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -374,10 +661,8 @@ class PebbleNotNullConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "not_null": True,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleRangeConstraint(PebbleConstraint):
@@ -385,6 +670,12 @@ class PebbleRangeConstraint(PebbleConstraint):
     A class representing a range constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+        "_maximum",
+        "_minimum",
+    )
+
     def __init__(
         self,
         maximum: Union[float, int],
@@ -407,6 +698,12 @@ class PebbleRangeConstraint(PebbleConstraint):
         # Store the passed minimum value in an instance variable
         self._minimum: Final[Union[float, int]] = minimum
 
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "maximum": self._maximum,
+            "minimum": self._minimum,
+        }
+
     @property
     def maximum(self) -> Union[float, int]:
         """
@@ -449,19 +746,85 @@ class PebbleRangeConstraint(PebbleConstraint):
             TypeError: If the passed value is not a float or an int.
         """
 
-        # Check, if the passed value is a float or an int
-        if not isinstance(
-            value,
-            (
-                float,
-                int,
-            ),
+        try:
+            # Return True if the value is within the range
+            # (the comparison itself rejects values that are not numbers, so no isinstance check is needed)
+            return self._minimum <= value <= self._maximum
+        except TypeError:
+            # Raise a TypeError exception
+            raise TypeError(f"Value must be a float or int, got {type(value)} instead") from None
+
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is within the range, False otherwise.
+
+        Raises:
+            TypeError: If one of the passed values is not a float or an int.
+        """
+
+        # Get the range boundaries once (i.e. outside of the loop)
+        maximum: Union[float, int] = self._maximum
+        minimum: Union[float, int] = self._minimum
+
+        # Initialize the result list
+        result: list[bool] = []
+
+        # Iterate over the passed values
+        for value in values:
+            try:
+                # Add whether the current value is within the range
+                result.append(minimum <= value <= maximum)
+            except TypeError:
+                # Raise a TypeError exception
+                raise TypeError(f"Value must be a float or int, got {type(value)} instead") from None
+
+        # Return the result list
+        return result
+
+    def validate_array(
+        self,
+        values: array.array,
+    ) -> list[bool]:
+        """
+        Validate the passed numeric array in a single batch.
+
+        The typecode of an array guarantees that all of its items are floats or ints,
+        so the per-value type check of validate_many is checked once for the array.
+
+        Args:
+            values (array.array): The numeric array to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is within the range, False otherwise.
+
+        Raises:
+            TypeError: If the passed array is not a numeric array.
+        """
+
+        # Check, if the passed array is a unicode character array
+        if values.typecode in (
+            "u",
+            "w",
         ):
             # Raise a TypeError exception
-            raise TypeError(f"Value must be a float or int, got {type(value)} instead")
+            raise TypeError(f"Array must be a numeric array, got typecode {values.typecode!r} instead")
+
+        # Get the range boundaries once (i.e. outside of the loop)
+        maximum: Union[float, int] = self._maximum
+        minimum: Union[float, int] = self._minimum
 
-        # Return True if the value is within the range
-        return self._minimum <= value <= self._maximum
+        # Return for each value whether it is within the range
+        return [minimum <= value <= maximum for value in values]
 
     @override
     def to_dict(self) -> dict[str, Any]:
@@ -472,11 +835,8 @@ class PebbleRangeConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "maximum": self._maximum,
-            "minimum": self._minimum,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleRegexConstraint(PebbleConstraint):
@@ -484,23 +844,79 @@ class PebbleRegexConstraint(PebbleConstraint):
     A class representing a regex constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_compiled",
+        "_dict_cache",
+        "_flags",
+        "_pattern",
+        "_use_re2",
+    )
+
     def __init__(
         self,
         pattern: str,
+        flags: int = 0,
+        ascii_only: bool = False,
+        use_re2: bool = False,
     ) -> None:
         """
         Initialize the instance.
 
         Args:
             pattern (str): The regex pattern.
+            flags (int, optional): The regex flags. Defaults to 0.
+            ascii_only (bool, optional): Whether the validated values are ASCII-only. Defaults to False.
+                If True, the pattern is compiled with re.ASCII, so character classes like \\w or \\d
+                skip the Unicode character database lookups.
+            use_re2 (bool, optional): Whether to compile the pattern with RE2 if it is installed. Defaults to False.
+                RE2 matches in linear time, but '$' does not match before a trailing newline and
+                \\d, \\w and \\s only match ASCII characters (i.e. unlike the re module).
 
         Returns:
             None
         """
 
+        # Check if the validated values are ASCII-only
+        if ascii_only:
+            # Add the ASCII flag to the passed flags (i.e. restrict character classes to ASCII)
+            flags |= re.ASCII
+
         # Store the passed pattern in an instance variable
         self._pattern: Final[str] = pattern
 
+        # Store the passed flags in an instance variable
+        self._flags: Final[int] = flags
+
+        # Store whether the pattern is compiled with RE2 in an instance variable
+        self._use_re2: Final[bool] = use_re2
+
+        # Compile the passed pattern once (i.e. instead of on every validation)
+        # (the compiled pattern is shared between constraints with the same pattern, flags and engine)
+        self._compiled: Final[Any] = _compile(
+            pattern,
+            flags,
+            use_re2,
+        )
+
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "flags": self._flags,
+            "pattern": self._pattern,
+            "use_re2": self._use_re2,
+        }
+
+    @property
+    def flags(self) -> int:
+        """
+        Get the regex flags.
+
+        Returns:
+            int: The regex flags.
+        """
+
+        # Return the flags
+        return self._flags
+
     @property
     def pattern(self) -> str:
         """
@@ -528,8 +944,29 @@ class PebbleRegexConstraint(PebbleConstraint):
             bool: True if the value matches the regex, False otherwise.
         """
 
-        # Return True if the value matches the regex
-        return re.match(self._pattern, value) is not None
+        # Return True if the value matches the precompiled regex
+        return self._compiled.match(value) is not None
+
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it matches the regex, False otherwise.
+        """
+
+        # Get the match method of the precompiled regex once (i.e. outside of the loop)
+        match: Any = self._compiled.match
+
+        # Return for each value whether it matches the precompiled regex
+        return [match(value) is not None for value in values]
 
     @override
     def to_dict(self) -> dict[str, Any]:
@@ -540,23 +977,237 @@ class PebbleRegexConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
+
+
+class PebbleRegexSet(PebbleConstraint):
+    """
+    A class representing a set of regex constraints in the PebbleDB library
+
+    The patterns are combined into a single regex of lookaheads (i.e. one match
+    call tests all patterns), provided they share the same flags, none of them
+    opted into RE2 (which does not support lookaheads) and their capturing groups
+    are not renumbered by the combination. Otherwise, each regex constraint is
+    tested on its own.
+    """
+
+    __slots__ = (
+        "_combined",
+        "_constraints",
+        "_dict_cache",
+    )
+
+    def __init__(
+        self,
+        constraints: list[PebbleRegexConstraint],
+    ) -> None:
+        """
+        Initialize the instance.
+
+        Args:
+            constraints (list[PebbleRegexConstraint]): The regex constraints to combine.
+
+        Returns:
+            None
+        """
+
+        # Store the passed constraints in an instance variable
+        self._constraints: Final[tuple[PebbleRegexConstraint, ...]] = tuple(constraints)
+
+        # Store the combined regex in an instance variable (i.e. None if the patterns cannot be combined)
+        self._combined: Final[Optional[Any]] = self._combine(self._constraints)
+
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "patterns": [constraint.to_dict() for constraint in self._constraints],
+        }
+
+    @staticmethod
+    def _combine(constraints: tuple[PebbleRegexConstraint, ...]) -> Optional[Any]:
+        """
+        Combine the patterns of the passed constraints into a single regex.
+
+        Args:
+            constraints (tuple[PebbleRegexConstraint, ...]): The regex constraints to combine.
+
+        Returns:
+            Optional[Any]: The combined regex or None if the patterns cannot be combined.
+        """
+
+        # Check if there are no patterns to combine or the patterns do not share the same flags
+        if not constraints or len({constraint._flags for constraint in constraints}) != 1:
+            # Return None as the patterns cannot be combined
+            return None
+
+        # Check if any pattern opted into RE2
+        # (RE2 rejects lookaheads, and combining with the re module would give up its linear time matching)
+        if any(constraint._use_re2 for constraint in constraints):
+            # Return None as the patterns are tested on their own
+            return None
+
+        # Sort the constraints, so that a pattern with capturing groups comes first
+        # (i.e. the numbering of its groups, which backreferences rely on, is preserved)
+        ordered: list[PebbleRegexConstraint] = sorted(
+            constraints,
+            key=lambda constraint: constraint._compiled.groups == 0,
+        )
+
+        # Check if more than one pattern has capturing groups
+        if sum(1 for constraint in ordered if constraint._compiled.groups) > 1:
+            # Return None as the combination would renumber the capturing groups
+            return None
+
+        try:
+            # Compile the patterns as a sequence of lookaheads with the re module (i.e. all patterns match at the start)
+            return _compile(
+                "".join(f"(?=(?:{constraint._pattern}))" for constraint in ordered),
+                constraints[0]._flags,
+            )
+        except re.error:
+            # Return None as the patterns cannot be combined (e.g. duplicate group names)
+            return None
+
+    @property
+    def constraints(self) -> tuple[PebbleRegexConstraint, ...]:
+        """
+        Get the regex constraints.
+
+        Returns:
+            tuple[PebbleRegexConstraint, ...]: The regex constraints.
+        """
+
+        # Return the constraints
+        return self._constraints
+
+    @override
+    def validate(
+        self,
+        value: Any,
+    ) -> bool:
+        """
+        Validate the passed value.
+
+        Args:
+            value (Any): The value to validate.
+
+        Returns:
+            bool: True if the value matches all regexes, False otherwise.
+        """
+
+        # Check if the patterns have been combined
+        if self._combined is not None:
+            # Return True if the value matches the combined regex
+            return self._combined.match(value) is not None
+
+        # Return True if the value matches each regex
+        return all(constraint._compiled.match(value) is not None for constraint in self._constraints)
+
+    def matches(
+        self,
+        value: Any,
+    ) -> set[int]:
+        """
+        Return the indices of the regex constraints the passed value matches.
+
+        Args:
+            value (Any): The value to match.
+
+        Returns:
+            set[int]: The indices of the matching regex constraints.
+        """
+
+        # Check if the value matches the combined regex (i.e. all regexes match)
+        if self._combined is not None and self._combined.match(value) is not None:
+            # Return the indices of all regex constraints
+            return set(range(len(self._constraints)))
+
+        # Return the indices of the regex constraints the value matches
         return {
-            "pattern": self._pattern,
+            index
+            for (
+                index,
+                constraint,
+            ) in enumerate(self._constraints)
+            if constraint._compiled.match(value) is not None
         }
 
+    @override
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the instance to a dictionary.
+
+        Returns:
+            dict[str, Any]: The dictionary representation of the instance.
+        """
+
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
+
 
 class PebbleRequiredConstraint(PebbleConstraint):
-    """ """
+    """
+    A class representing a required constraint in the PebbleDB library
+    """
+
+    __slots__ = (
+        "_allow_null",
+        "_dict_cache",
+        "_field",
+    )
 
     def __init__(
         self,
         field: str,
+        allow_null: bool = False,
     ) -> None:
-        """ """
+        """
+        Initialize the instance.
 
+        Args:
+            field (str): The field to validate.
+            allow_null (bool, optional): Whether a present field with a null value is valid. Defaults to False.
+
+        Returns:
+            None
+        """
+
+        # Store the passed field in an instance variable
         self._field: Final[str] = field
 
+        # Store the passed allow null flag in an instance variable
+        self._allow_null: Final[bool] = allow_null
+
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "allow_null": self._allow_null,
+            "required": self._field,
+        }
+
+    @property
+    def allow_null(self) -> bool:
+        """
+        Get the allow null flag.
+
+        Returns:
+            bool: True if a present field with a null value is valid, False otherwise.
+        """
+
+        # Return the allow null flag
+        return self._allow_null
+
+    @property
+    def field(self) -> str:
+        """
+        Get the field.
+
+        Returns:
+            str: The field.
+        """
+
+        # Return the field
+        return self._field
+
     @override
     def validate(
         self,
@@ -572,8 +1223,16 @@ class PebbleRequiredConstraint(PebbleConstraint):
             bool: True if the entry is valid, False otherwise.
         """
 
+        # Check if a present field with a null value is valid
+        if self._allow_null:
+            # Return True if the field is present (i.e. the missing sentinel tells absent from null)
+            return entry.get(
+                self._field,
+                MISSING,
+            ) is not MISSING
+
         # Return True if the field is not None
-        return entry.get(self._field, None) is not None
+        return entry.get(self._field) is not None
 
     @override
     def to_dict(self) -> dict[str, Any]:
@@ -584,10 +1243,8 @@ class PebbleRequiredConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "required": self._field,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleTypeConstraint(PebbleConstraint):
@@ -595,6 +1252,11 @@ class PebbleTypeConstraint(PebbleConstraint):
     A class representing a type constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+        "_type_",
+    )
+
     def __init__(
         self,
         type_: type,
@@ -612,6 +1274,11 @@ class PebbleTypeConstraint(PebbleConstraint):
         # Store the passed type in an instance variable
         self._type_: Final[type] = type_
 
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "type": self._type_.__name__,
+        }
+
     @property
     def type_(self) -> type:
         """
@@ -639,6 +1306,27 @@ class PebbleTypeConstraint(PebbleConstraint):
         # Return True if the value is of the correct type
         return isinstance(value, self._type_)
 
+    @override
+    def validate_many(
+        self,
+        values: Iterable[Any],
+    ) -> list[bool]:
+        """
+        Validate the passed values in a single batch.
+
+        Args:
+            values (Iterable[Any]): The values to validate.
+
+        Returns:
+            list[bool]: For each value, True if it is of the correct type, False otherwise.
+        """
+
+        # Get the type once (i.e. outside of the loop)
+        type_: type = self._type_
+
+        # Return for each value whether it is of the correct type
+        return [isinstance(value, type_) for value in values]
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -648,10 +1336,8 @@ class PebbleTypeConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "type": self._type_.__name__,
-        }
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
 
 
 class PebbleUniqueConstraint(PebbleConstraint):
@@ -659,6 +1345,11 @@ class PebbleUniqueConstraint(PebbleConstraint):
     A class representing a unique constraint in the PebbleDB library
     """
 
+    __slots__ = (
+        "_dict_cache",
+        "_field",
+    )
+
     def __init__(
         self,
         field: str,
@@ -676,6 +1367,11 @@ class PebbleUniqueConstraint(PebbleConstraint):
         # Store the passed field in an instance variable
         self._field: Final[str] = field
 
+        # Cache the dictionary representation of the instance (i.e. all of its state is final)
+        self._dict_cache: Final[dict[str, Any]] = {
+            "unique": self._field,
+        }
+
     @property
     def field(self) -> str:
         """
@@ -703,30 +1399,65 @@ class PebbleUniqueConstraint(PebbleConstraint):
             bool: True if the entries are valid, False otherwise.
         """
 
+        # Get the field once (i.e. outside of the loop)
+        field: str = self._field
+
         # Initialize an empty set to store the field values
         seen: Set[Any] = set()
 
+        # Get the add method of the store once (i.e. outside of the loop)
+        add: Callable[[Any], None] = seen.add
+
         # Iterate over the entries
         for entry in entries:
             # Get the field value
-            value: Optional[Any] = entry.get(self._field, None)
+            value: Optional[Any] = entry.get(field)
 
             # Check if the field value is None
             if value is None:
                 # Skip the entry if the field value is None
                 continue
 
-            # Check if the field value is already in the store
-            if value in seen:
-                # Return False if the field value is already in the store
-                return False
+            # Get the size of the store before adding the field value
+            size: int = len(seen)
 
             # Add the field value to the store
-            seen.add(value)
+            add(value)
+
+            # Check if the store did not grow (i.e. the field value is already in the store)
+            if len(seen) == size:
+                # Return False if the field value is already in the store
+                return False
 
         # Return True if the entries are valid
         return True
 
+    def validate_array(
+        self,
+        values: Sequence[Any],
+    ) -> bool:
+        """
+        Validate the passed values of the field (i.e. an already extracted column).
+
+        The uniqueness is determined by comparing the size of the set of the values
+        with the number of values, so the deduplication runs in a single C-level call.
+        Null values are ignored, as in validate.
+
+        Args:
+            values (Sequence[Any]): The values of the field to validate.
+
+        Returns:
+            bool: True if the non-null values are unique, False otherwise.
+        """
+
+        # Check if the passed values contain null values
+        if None in values:
+            # Remove the null values from the passed values
+            values = [value for value in values if value is not None]
+
+        # Return True if no value occurs more than once
+        return len(set(values)) == len(values)
+
     @override
     def to_dict(self) -> dict[str, Any]:
         """
@@ -736,7 +1467,486 @@ class PebbleUniqueConstraint(PebbleConstraint):
             dict[str, Any]: The dictionary representation of the instance.
         """
 
-        # Return the dictionary representation of the instance
-        return {
-            "unique": self._field,
+        # Return a copy of the cached dictionary representation of the instance
+        return self._dict_cache.copy()
+
+
+@lru_cache(maxsize=256)
+def _compile_source(source: str) -> CodeType:
+    """
+    Compile the passed source of a validator factory function.
+
+    The source only contains field names and the names of the bound local variables
+    (i.e. not the constraint parameters), so schemas of the same shape share one
+    code object and are not parsed and compiled again.
+
+    Args:
+        source (str): The source to compile.
+
+    Returns:
+        CodeType: The compiled code object.
+    """
+
+    # Compile and return the passed source
+    return compile(
+        source,
+        "<validator>",
+        "exec",
+    )
+
+
+def _emit_length(
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+    length: int,
+) -> list[str]:
+    """
+    Bind the passed length and return the line computing the length of the value.
+
+    The length of the value is computed once per field, so the line is only
+    returned for the first length constraint of the field.
+
+    Args:
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+        length (int): The length to bind.
+
+    Returns:
+        list[str]: The line computing the length of the value, if it has not been computed yet.
+    """
+
+    # Bind the length as a local variable
+    local_vars[f"_length_{index}"] = length
+
+    # Check if the length of the value has already been computed
+    if state["has_length"]:
+        # Return no line
+        return []
+
+    # Update the flag indicating whether the length of the value has been computed
+    state["has_length"] = True
+
+    # Return the line that computes the length of the value once per field
+    return ["    length = len(value)"]
+
+
+def _emit_choice(
+    constraint: PebbleChoiceConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the lines testing the passed choice constraint.
+
+    Args:
+        constraint (PebbleChoiceConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The lines testing the constraint.
+    """
+
+    # Bind the choices set and the choices list as local variables
+    local_vars[f"_choice_set_{index}"] = constraint._choice_set
+    local_vars[f"_choices_{index}"] = constraint._choices
+
+    # Return the lines that test the membership (i.e. falling back to the list for unhashable values)
+    return [
+        "    try:",
+        f"        if value not in _choice_set_{index}: return False",
+        "    except TypeError:",
+        f"        if value not in _choices_{index}: return False",
+    ]
+
+
+def _emit_is_null(
+    constraint: PebbleIsNullConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line testing the passed null constraint.
+
+    Args:
+        constraint (PebbleIsNullConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint.
+    """
+
+    # Return the line that tests for null
+    return ["    if value is not None: return False"]
+
+
+def _emit_max_length(
+    constraint: PebbleMaxLengthConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the lines testing the passed maximum length constraint.
+
+    Args:
+        constraint (PebbleMaxLengthConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The lines testing the constraint.
+    """
+
+    # Return the lines that compute the length of the value and test the maximum length
+    return _emit_length(
+        index=index,
+        length=constraint._length,
+        local_vars=local_vars,
+        state=state,
+    ) + [f"    if length > _length_{index}: return False"]
+
+
+def _emit_min_length(
+    constraint: PebbleMinLengthConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the lines testing the passed minimum length constraint.
+
+    Args:
+        constraint (PebbleMinLengthConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The lines testing the constraint.
+    """
+
+    # Return the lines that compute the length of the value and test the minimum length
+    return _emit_length(
+        index=index,
+        length=constraint._length,
+        local_vars=local_vars,
+        state=state,
+    ) + [f"    if length < _length_{index}: return False"]
+
+
+def _emit_not_null(
+    constraint: PebbleNotNullConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line testing the passed not null constraint.
+
+    Args:
+        constraint (PebbleNotNullConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint.
+    """
+
+    # Return the line that tests for not null
+    return ["    if value is None: return False"]
+
+
+def _emit_range(
+    constraint: PebbleRangeConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the lines testing the passed range constraint.
+
+    Args:
+        constraint (PebbleRangeConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The lines testing the constraint.
+    """
+
+    # Bind the range boundaries as local variables
+    local_vars[f"_maximum_{index}"] = constraint._maximum
+    local_vars[f"_minimum_{index}"] = constraint._minimum
+
+    # Return the lines that test the range of the value (i.e. the comparison rejects non-numbers)
+    return [
+        "    try:",
+        f"        if not _minimum_{index} <= value <= _maximum_{index}: return False",
+        "    except TypeError:",
+        "        raise TypeError(f'Value must be a float or int, got {type(value)} instead') from None",
+    ]
+
+
+def _emit_regex(
+    constraint: PebbleRegexConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line testing the passed regex constraint.
+
+    The regex constraints of a field with multiple regex constraints are tested
+    at once through a regex set, in place of the first of them.
+
+    Args:
+        constraint (PebbleRegexConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint, if it is not part of an already tested regex set.
+    """
+
+    # Get the regex set of the current field
+    regex_set: Optional[PebbleRegexSet] = state["regex_set"]
+
+    # Check if the current field has no regex set
+    if regex_set is None:
+        # Bind the match method of the precompiled regex as a local variable
+        local_vars[f"_match_{index}"] = constraint._compiled.match
+
+        # Return the line that tests the regex
+        return [f"    if _match_{index}(value) is None: return False"]
+
+    # Check if the regex set has already been tested
+    if constraint is not state["regexes"][0]:
+        # Skip the regex constraint as it is part of the regex set
+        return []
+
+    # Bind the validate method of the regex set as a local variable
+    local_vars[f"_validate_{index}"] = regex_set.validate
+
+    # Return the line that tests all regexes of the current field at once
+    return [f"    if not _validate_{index}(value): return False"]
+
+
+def _emit_required(
+    constraint: PebbleRequiredConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line testing the passed required constraint.
+
+    Args:
+        constraint (PebbleRequiredConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint.
+    """
+
+    # Check if a present field with a null value is valid
+    if constraint._allow_null:
+        # Return the line that tests the presence of the required field (i.e. its own field, not the current one)
+        return [f"    if {constraint._field!r} not in entry: return False"]
+
+    # Return the line that tests the required field (i.e. its own field, not the current one)
+    return [f"    if entry.get({constraint._field!r}) is None: return False"]
+
+
+def _emit_type(
+    constraint: PebbleTypeConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line testing the passed type constraint.
+
+    Args:
+        constraint (PebbleTypeConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint.
+    """
+
+    # Bind the type as a local variable
+    local_vars[f"_type_{index}"] = constraint._type_
+
+    # Return the line that tests the type
+    return [f"    if not isinstance(value, _type_{index}): return False"]
+
+
+def _emit_validate(
+    constraint: PebbleConstraint,
+    local_vars: dict[str, Any],
+    state: dict[str, Any],
+    index: int,
+) -> list[str]:
+    """
+    Return the line calling the validate method of the passed constraint of an unknown type.
+
+    Args:
+        constraint (PebbleConstraint): The constraint to test.
+        local_vars (dict[str, Any]): The local variables of the generated validator function.
+        state (dict[str, Any]): The state of the current field.
+        index (int): The index of the current constraint.
+
+    Returns:
+        list[str]: The line testing the constraint.
+
+    Raises:
+        ValueError: If the passed constraint is a unique constraint.
+    """
+
+    # Check if the passed constraint is a unique constraint (e.g. of a subclass)
+    if isinstance(
+        constraint,
+        PebbleUniqueConstraint,
+    ):
+        # Raise a ValueError as a unique constraint validates all entries at once
+        raise ValueError(
+            f"Cannot compile {constraint!r} for field {state['field']!r}: unique constraints validate all entries at once"
+        )
+
+    # Bind the validate method of the unknown constraint as a local variable
+    local_vars[f"_validate_{index}"] = constraint.validate
+
+    # Return the line that calls the validate method of the unknown constraint
+    return [f"    if not _validate_{index}(value): return False"]
+
+
+# The emitters of the source lines of the known constraint types
+# (constraints of other types fall back to _emit_validate)
+_EMITTERS: Final[dict[type, Callable[..., list[str]]]] = {
+    PebbleChoiceConstraint: _emit_choice,
+    PebbleIsNullConstraint: _emit_is_null,
+    PebbleMaxLengthConstraint: _emit_max_length,
+    PebbleMinLengthConstraint: _emit_min_length,
+    PebbleNotNullConstraint: _emit_not_null,
+    PebbleRangeConstraint: _emit_range,
+    PebbleRegexConstraint: _emit_regex,
+    PebbleRequiredConstraint: _emit_required,
+    PebbleTypeConstraint: _emit_type,
+}
+
+
+def compile_schema_validator(
+    constraints_by_field: dict[str, list[PebbleConstraint]],
+) -> Callable[[dict[str, Any]], bool]:
+    """
+    Compile the passed constraints into a single validator function.
+
+    The checks of the known constraint types are inlined as straight-line code,
+    so validating an entry does not dispatch to each constraint's validate method.
+    The lines of each check are emitted by the emitter of its constraint type (see
+    _EMITTERS). Constraints of unknown types are called through their validate method.
+
+    Args:
+        constraints_by_field (dict[str, list[PebbleConstraint]]): The constraints per field.
+
+    Returns:
+        Callable[[dict[str, Any]], bool]: A function returning True if the passed entry is valid, False otherwise.
+
+    Raises:
+        ValueError: If one of the passed constraints is a unique constraint.
+    """
+
+    # Initialize the local variables of the generated validator function
+    local_vars: dict[str, Any] = {
+        "float": float,
+        "int": int,
+        "isinstance": isinstance,
+        "len": len,
+        "type": type,
+        "TypeError": TypeError,
+    }
+
+    # Initialize the source lines of the generated validator function
+    lines: list[str] = ["def __validator__(entry):"]
+
+    # Initialize the index of the current constraint
+    index: int = 0
+
+    # Iterate over the field constraints pairs
+    for (
+        field,
+        constraints,
+    ) in constraints_by_field.items():
+        # Add the line that fetches the value of the current field
+        lines.append(f"    value = entry.get({field!r})")
+
+        # Get the regex constraints of the current field
+        regexes: list[PebbleRegexConstraint] = [
+            constraint for constraint in constraints if type(constraint) is PebbleRegexConstraint
+        ]
+
+        # Initialize the state of the current field shared by its emitters
+        # (the regex set is only created if the field has multiple regex constraints)
+        state: dict[str, Any] = {
+            "field": field,
+            "has_length": False,
+            "regex_set": PebbleRegexSet(constraints=regexes) if len(regexes) > 1 else None,
+            "regexes": regexes,
         }
+
+        # Iterate over the constraints of the current field
+        for constraint in constraints:
+            # Increment the index of the current constraint
+            index += 1
+
+            # Add the lines emitted by the emitter of the current constraint's type
+            lines.extend(
+                _EMITTERS.get(
+                    type(constraint),
+                    _emit_validate,
+                )(
+                    constraint=constraint,
+                    index=index,
+                    local_vars=local_vars,
+                    state=state,
+                )
+            )
+
+    # Add the line that returns True if all constraints are satisfied
+    lines.append("    return True")
+
+    # Wrap the generated validator function in a factory function,
+    # turning the local variables into closure variables of the generated validator function
+    source: str = "\n".join(
+        [f"def __create_validator__({', '.join(local_vars)}):"]
+        + [f"    {line}" for line in lines]
+        + ["    return __validator__"]
+    )
+
+    # Initialize the namespace the factory function is executed in
+    namespace: dict[str, Any] = {}
+
+    # Execute the compiled factory function (i.e. compiled once per distinct source)
+    exec(
+        _compile_source(source),
+        namespace,
+    )
+
+    # Create and return the generated validator function by calling the factory function
+    return namespace["__create_validator__"](**local_vars)
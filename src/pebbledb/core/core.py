@@ -3,22 +3,23 @@ Author: Louis Goodnews
 Date: 2025-09-13
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Final, Optional, Union
+from typing import Any, Final, Optional, Type, Union
 
-from core.database import (
+from .database import (
     PebbleDatabase,
     PebbleDatabaseBuilder,
     PebbleDatabaseLoader,
 )
-from core.table import (
+from .table import (
     PebbleTable,
     PebbleTableBuilder,
     PebbleTableLoader,
 )
 
 
-__all__: Final[list[str]] = ["Pebble"]
+__all__: Final[tuple[str, ...]] = ("Pebble",)
 
 
 class Pebble:
@@ -32,6 +33,139 @@ class Pebble:
     # The table instance
     TABLE: Optional[PebbleTable] = None
 
+    # The maximum number of cached database and table instances
+    _CACHE_SIZE: Final[int] = 32
+
+    # The cached database instances (i.e. least recently used first)
+    _DATABASE_CACHE: Final[OrderedDict[str, PebbleDatabase]] = OrderedDict()
+
+    # The cached table instances (i.e. least recently used first)
+    _TABLE_CACHE: Final[OrderedDict[str, PebbleTable]] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(name_or_path: Union[Path, str]) -> str:
+        """
+        Return the cache key of the passed name or path.
+
+        Args:
+            name_or_path (Union[Path, str]): The name or path of the database or table.
+
+        Returns:
+            str: The name or the canonicalized (i.e. absolute and resolved) path.
+        """
+
+        # Check if the passed name_or_path is a Path object
+        if isinstance(
+            name_or_path,
+            Path,
+        ):
+            # Return the canonicalized path
+            return str(name_or_path.resolve())
+
+        # Return the name
+        return name_or_path
+
+    @classmethod
+    def _cache_get(
+        cls,
+        cache: OrderedDict[str, Any],
+        key: str,
+    ) -> Optional[Any]:
+        """
+        Return the cached instance associated with the passed key.
+
+        Args:
+            cache (OrderedDict[str, Any]): The cache to search.
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached instance or None if the key is not cached.
+        """
+
+        # Get the cached instance associated with the passed key
+        value: Optional[Any] = cache.get(key)
+
+        # Check if the passed key is cached
+        if value is not None:
+            # Mark the cached instance as most recently used
+            cache.move_to_end(key)
+
+        # Return the cached instance
+        return value
+
+    @classmethod
+    def _cache_put(
+        cls,
+        cache: OrderedDict[str, Any],
+        key: str,
+        value: Any,
+    ) -> None:
+        """
+        Cache the passed instance with the passed key.
+        Will evict the least recently used instance if the cache is full.
+
+        Args:
+            cache (OrderedDict[str, Any]): The cache to update.
+            key (str): The cache key.
+            value (Any): The instance to cache.
+
+        Returns:
+            None
+        """
+
+        # Cache the passed instance as most recently used
+        cache[key] = value
+        cache.move_to_end(key)
+
+        # Check if the cache exceeds its maximum size
+        if len(cache) > cls._CACHE_SIZE:
+            # Evict the least recently used instance
+            cache.popitem(last=False)
+
+    @classmethod
+    def _build_default(
+        cls,
+        builder_cls: Type[Union[PebbleDatabaseBuilder, PebbleTableBuilder]],
+        name: str,
+    ) -> Union[PebbleDatabase, PebbleTable]:
+        """
+        Build a default PebbleDatabase or PebbleTable instance with the passed name.
+
+        Args:
+            builder_cls (Type[Union[PebbleDatabaseBuilder, PebbleTableBuilder]]): The builder class to use.
+            name (str): The name of the database or table.
+
+        Returns:
+            Union[PebbleDatabase, PebbleTable]: The built PebbleDatabase or PebbleTable instance.
+        """
+
+        # Create a new builder, update it with the passed name and build the instance
+        # (a builder per call, so concurrent calls never share its configuration)
+        return (
+            builder_cls()
+            .with_created_at(value=None)
+            .with_data(value={})
+            .with_identifier(value=None)
+            .with_name(value=name)
+            .with_path(value=None)
+            .build()
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear the cached database and table instances.
+
+        Returns:
+            None
+        """
+
+        # Clear the cached database instances
+        cls._DATABASE_CACHE.clear()
+
+        # Clear the cached table instances
+        cls._TABLE_CACHE.clear()
+
     @classmethod
     def get_database_builder(cls) -> PebbleDatabaseBuilder:
         """
@@ -68,45 +202,56 @@ class Pebble:
             # Return the database object
             return cls.DATABASE
 
-        # Check if the passed name_or_path is a Path object
-        if isinstance(
+        # Check if the passed name_or_path is a Path object (i.e. normalize the dispatch once)
+        is_path: bool = isinstance(
             name_or_path,
             Path,
-        ):
-            # Check if the path exists
-            if not name_or_path.exists():
-                # Raise a FileNotFoundError exception if the path does not exist
-                raise FileNotFoundError(name_or_path)
+        )
+
+        # Get the cache key of the passed name_or_path (i.e. the canonicalized path or the name)
+        key: str = cls._cache_key(name_or_path=name_or_path)
 
-            # Load the database instance
-            result: PebbleDatabase = PebbleDatabaseLoader.load(path=name_or_path)
+        # Get the cached database instance associated with the cache key
+        cached: Optional[PebbleDatabase] = cls._cache_get(
+            cache=cls._DATABASE_CACHE,
+            key=key,
+        )
 
+        # Check if a cached database instance exists
+        if cached is not None:
             # Update the class variable
-            cls.DATABASE = result
-
-            # Return the database instance
-            return result
-        else:
-            # Initialize the builder
-            builder: PebbleDatabaseBuilder = PebbleDatabaseBuilder()
-
-            # Update the builder with the passed name_or_path
-            (
-                builder.with_created_at(value=None)
-                .with_data(value={})
-                .with_identifier(value=None)
-                .with_name(value=name_or_path)
-                .with_path(value=None)
+            cls.DATABASE = cached
+
+            # Return the cached database instance
+            return cached
+
+        # Check if the passed path does not exist
+        if is_path and not name_or_path.exists():
+            # Raise a FileNotFoundError exception if the path does not exist
+            raise FileNotFoundError(name_or_path)
+
+        # Load the database instance from the passed path or build the default database instance
+        result: PebbleDatabase = (
+            PebbleDatabaseLoader.load(path=name_or_path)
+            if is_path
+            else cls._build_default(
+                builder_cls=PebbleDatabaseBuilder,
+                name=name_or_path,
             )
+        )
 
-            # Build the database instance
-            result: PebbleDatabase = builder.build()
+        # Update the class variable
+        cls.DATABASE = result
 
-            # Update the class variable
-            cls.DATABASE = result
+        # Cache the database instance
+        cls._cache_put(
+            cache=cls._DATABASE_CACHE,
+            key=key,
+            value=result,
+        )
 
-            # Return the database instance
-            return result
+        # Return the database instance
+        return result
 
     @classmethod
     def get_table_builder(cls) -> PebbleTableBuilder:
@@ -144,45 +289,56 @@ class Pebble:
             # Return the table object
             return cls.TABLE
 
-        # Check if the passed name_or_path is a Path object
-        if isinstance(
+        # Check if the passed name_or_path is a Path object (i.e. normalize the dispatch once)
+        is_path: bool = isinstance(
             name_or_path,
             Path,
-        ):
-            # Check if the path exists
-            if not name_or_path.exists():
-                # Raise a FileNotFoundError exception if the path does not exist
-                raise FileNotFoundError(name_or_path)
+        )
+
+        # Get the cache key of the passed name_or_path (i.e. the canonicalized path or the name)
+        key: str = cls._cache_key(name_or_path=name_or_path)
 
-            # Load the table instance
-            result: PebbleTable = PebbleTableLoader.load(path=name_or_path)
+        # Get the cached table instance associated with the cache key
+        cached: Optional[PebbleTable] = cls._cache_get(
+            cache=cls._TABLE_CACHE,
+            key=key,
+        )
 
+        # Check if a cached table instance exists
+        if cached is not None:
             # Update the class variable
-            cls.TABLE = result
-
-            # Return the table instance
-            return result
-        else:
-            # Initialize the builder
-            builder: PebbleTableBuilder = PebbleTableBuilder()
-
-            # Update the builder with the passed name_or_path
-            (
-                builder.with_created_at(value=None)
-                .with_data(value={})
-                .with_identifier(value=None)
-                .with_name(value=name_or_path)
-                .with_path(value=None)
+            cls.TABLE = cached
+
+            # Return the cached table instance
+            return cached
+
+        # Check if the passed path does not exist
+        if is_path and not name_or_path.exists():
+            # Raise a FileNotFoundError exception if the path does not exist
+            raise FileNotFoundError(name_or_path)
+
+        # Load the table instance from the passed path or build the default table instance
+        result: PebbleTable = (
+            PebbleTableLoader.load(path=name_or_path)
+            if is_path
+            else cls._build_default(
+                builder_cls=PebbleTableBuilder,
+                name=name_or_path,
             )
+        )
 
-            # Build the table instance
-            result: PebbleTable = builder.build()
+        # Update the class variable
+        cls.TABLE = result
 
-            # Update the class variable
-            cls.TABLE = result
+        # Cache the table instance
+        cls._cache_put(
+            cache=cls._TABLE_CACHE,
+            key=key,
+            value=result,
+        )
 
-            # Return the table instance
-            return result
+        # Return the table instance
+        return result
 
     @classmethod
     def load_database(
@@ -205,6 +361,13 @@ class Pebble:
         # Update the class variable
         cls.DATABASE = result
 
+        # Replace the cached database instance (i.e. an explicit load invalidates the cache entry)
+        cls._cache_put(
+            cache=cls._DATABASE_CACHE,
+            key=cls._cache_key(name_or_path=Path(path)),
+            value=result,
+        )
+
         # Return the database instance
         return result
 
@@ -229,5 +392,12 @@ class Pebble:
         # Update the class variable
         cls.TABLE = result
 
+        # Replace the cached table instance (i.e. an explicit load invalidates the cache entry)
+        cls._cache_put(
+            cache=cls._TABLE_CACHE,
+            key=cls._cache_key(name_or_path=Path(path)),
+            value=result,
+        )
+
         # Return the table instance
         return result
@@ -3,29 +3,562 @@ Author: Louis Goodnews
 Date: 2025-09-13
 """
 
-import uuid
+import secrets
+import sys
 
-from collections.abc import ItemsView, KeysView, ValuesView
+from collections.abc import ItemsView, KeysView, Mapping, MutableMapping, ValuesView
 from datetime import datetime
+from itertools import chain, compress, repeat
+from operator import is_not
 from pathlib import Path
-from typing import Any, Final, Iterable, Iterator, Optional, Self, Union
+from types import MappingProxyType
+from typing import Any, ClassVar, Final, Iterable, Iterator, Optional, Self, Union
 
-from core.constants import CWD, PEBBLE_COMMIT_SERVICE
-from core.files import read_file_if_not_exists
-from core.table import PebbleTable, PebbleTableBuilder
+from . import constants
+from .constants import CWD, MISSING
+from .files import delete_file
+from .table import PebbleTable, PebbleTableBuilder
+from .utils import _deserialize, _deserialize_line, _serialize_bytes
 
-from utils.utils import run_async
+from ..utils.utils import merge_dicts, run_async
 
-from datautils import DataConversionUtils
 from logger import Logger
 
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
     "PebbleDatabase",
     "PebbleDatabaseFactory",
     "PebbleDatabaseBuilder",
     "PebbleDatabaseLoader",
-]
+)
+
+
+# The default of PebbleEntries.pop (i.e. distinguishes "no default" from a passed MISSING default)
+_RAISE: Final[object] = object()
+
+# The number of tombstones PebbleEntries pads its list with at least before a key counts as far
+# (i.e. a key further past the end of the list than this or the list's length is kept in the overflow dictionary)
+_PAD_LIMIT: Final[int] = 1024
+
+
+class PebbleEntries(MutableMapping):
+    """
+    A mapping of storage keys to entries that stores integer keys in a list.
+
+    Storage keys are handed out contiguously, so the entry with key n lives at index n
+    of a list (i.e. one pointer per entry instead of a hash table slot) and inserting
+    appends to it. Removed entries leave a MISSING tombstone behind, so the keys of
+    the remaining entries never shift. Non-integer (and negative) keys are kept in an
+    overflow dictionary, as are integer keys far past the end of the list (e.g. a date
+    such as 20250101), so a single such key does not pad the list with millions of
+    tombstones. Integer keys in the overflow dictionary are always past the end of the
+    list; they are moved into it once the list reaches them.
+    """
+
+    __slots__ = (
+        "_extra",
+        "_rows",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        items: Iterable[tuple[Union[int, str], Any]] = (),
+    ) -> None:
+        """
+        Initialize the PebbleEntries instance with the passed key value pairs.
+
+        Args:
+            items (Iterable[tuple[Union[int, str], Any]], optional): The key value pairs to store. Defaults to ().
+
+        Returns:
+            None
+        """
+
+        # Initialize the overflow dictionary of the non-integer keys
+        self._extra: dict[Union[int, str], Any] = {}
+
+        # Initialize the list of entries indexed by their integer keys
+        self._rows: list[Any] = []
+
+        # Initialize the number of stored entries
+        self._size: int = 0
+
+        # Iterate over the passed key value pairs
+        for (
+            key,
+            value,
+        ) in items:
+            # Store the current value with the current key
+            self[key] = value
+
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        """
+        Check if an entry is stored with the passed key.
+
+        Args:
+            key (object): The key to be checked.
+
+        Returns:
+            bool: True if an entry is stored with the passed key, False otherwise.
+        """
+
+        # Check if the passed key is the index of a slot of the list
+        if type(key) is int and 0 <= key < len(self._rows):
+            # Return True if the slot is not a tombstone
+            return self._rows[key] is not MISSING
+
+        # Return True if the passed key is contained in the overflow dictionary
+        return key in self._extra
+
+    def __delitem__(
+        self,
+        key: Union[int, str],
+    ) -> None:
+        """
+        Remove the entry stored with the passed key.
+
+        Args:
+            key (Union[int, str]): The key of the entry to be removed.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If no entry is stored with the passed key.
+        """
+
+        # Check if the pop returned the MISSING sentinel (i.e. the key does not exist)
+        if self.pop(key, MISSING) is MISSING:
+            # Raise a KeyError exception if the key does not exist
+            raise KeyError(key)
+
+    def __getitem__(
+        self,
+        key: Union[int, str],
+    ) -> Any:
+        """
+        Return the entry stored with the passed key.
+
+        Args:
+            key (Union[int, str]): The key of the entry.
+
+        Returns:
+            Any: The entry stored with the passed key.
+
+        Raises:
+            KeyError: If no entry is stored with the passed key.
+        """
+
+        # Check if the passed key is the index of a slot of the list
+        if type(key) is int and 0 <= key < len(self._rows):
+            # Get the entry stored in the slot
+            value: Any = self._rows[key]
+
+            # Check if the slot is not a tombstone
+            if value is not MISSING:
+                # Return the entry
+                return value
+
+            # Raise a KeyError exception if the key does not exist
+            raise KeyError(key)
+
+        # Return the entry stored in the overflow dictionary
+        # Will raise a KeyError exception if the key does not exist
+        return self._extra[key]
+
+    def __iter__(self) -> Iterator[Union[int, str]]:
+        """
+        Return an iterator over the stored keys.
+
+        The keys of the list come first in ascending order, followed by the keys of the
+        overflow dictionary in insertion order.
+
+        Returns:
+            Iterator[Union[int, str]]: An iterator over the stored keys.
+        """
+
+        # Return an iterator over the indices of the live slots and the overflow keys
+        # (compress and map skip the tombstones in C, without a Python-level loop)
+        return chain(
+            compress(
+                range(len(self._rows)),
+                map(
+                    is_not,
+                    self._rows,
+                    repeat(MISSING),
+                ),
+            ),
+            self._extra,
+        )
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored entries.
+
+        Returns:
+            int: The number of stored entries.
+        """
+
+        # Return the number of stored entries
+        return self._size
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the PebbleEntries instance.
+
+        Returns:
+            str: A string representation of the PebbleEntries instance.
+        """
+
+        # Return the string representation of the stored entries as a dictionary
+        return repr(self.copy())
+
+    def __setitem__(
+        self,
+        key: Union[int, str],
+        value: Any,
+    ) -> None:
+        """
+        Store the passed entry with the passed key.
+
+        Args:
+            key (Union[int, str]): The key of the entry.
+            value (Any): The entry to be stored.
+
+        Returns:
+            None
+        """
+
+        # Get the list of entries once
+        rows: list[Any] = self._rows
+
+        # Check if the passed key is not a non-negative integer, is already stored in the
+        # overflow dictionary or lies too far past the end of the list to pad it with tombstones
+        if (
+            type(key) is not int
+            or key < 0
+            or (key >= len(rows) and key in self._extra)
+            or key - len(rows) > max(len(rows), _PAD_LIMIT)
+        ):
+            # Check if the passed key is new
+            if key not in self._extra:
+                # Increment the number of stored entries
+                self._size += 1
+
+            # Store the passed entry in the overflow dictionary
+            self._extra[key] = value
+
+            # Return early
+            return
+
+        # Check if the passed key lies past the end of the list
+        if key >= len(rows):
+            # Move the overflow entries the list is about to reach into it
+            self._absorb(stop=key)
+
+            # Pad the list with tombstones up to the passed key
+            rows.extend(repeat(MISSING, key - len(rows) + 1))
+
+        # Check if the slot is a tombstone (i.e. the key is new)
+        if rows[key] is MISSING:
+            # Increment the number of stored entries
+            self._size += 1
+
+        # Store the passed entry in the slot
+        rows[key] = value
+
+    def _absorb(
+        self,
+        stop: int,
+    ) -> None:
+        """
+        Move the integer keys of the overflow dictionary below the passed stop into the list.
+
+        The keys are moved in ascending order and the gaps between them are padded with
+        tombstones (i.e. only keys the list is about to reach are moved, so the padding
+        is bounded by the growth of the list).
+
+        Args:
+            stop (int): The key up to which (exclusive) overflow entries are moved.
+
+        Returns:
+            None
+        """
+
+        # Get the overflow dictionary once
+        extra: dict[Union[int, str], Any] = self._extra
+
+        # Check if the overflow dictionary is empty
+        if not extra:
+            # Return early as there are no entries to move
+            return
+
+        # Get the list of entries once
+        rows: list[Any] = self._rows
+
+        # Iterate over the integer keys past the end of the list and below the passed stop in ascending order
+        for key in sorted(
+            key for key in extra if type(key) is int and len(rows) <= key < stop
+        ):
+            # Pad the list with tombstones up to the current key
+            rows.extend(repeat(MISSING, key - len(rows)))
+
+            # Move the entry of the current key into the list
+            rows.append(extra.pop(key))
+
+    def append(
+        self,
+        value: Any,
+    ) -> int:
+        """
+        Append the passed entry and return its key.
+
+        Args:
+            value (Any): The entry to be appended.
+
+        Returns:
+            int: The key of the appended entry.
+        """
+
+        # Get the list of entries and the key of the appended entry
+        rows: list[Any] = self._rows
+        key: int = len(rows)
+
+        # Iterate as long as the key is taken by an entry in the overflow dictionary
+        while key in self._extra:
+            # Move the entry into the list (i.e. the list has reached its key)
+            rows.append(self._extra.pop(key))
+
+            # Continue with the next key
+            key += 1
+
+        # Append the passed entry to the list
+        rows.append(value)
+
+        # Increment the number of stored entries
+        self._size += 1
+
+        # Return the key of the appended entry
+        return key
+
+    def compact(self) -> None:
+        """
+        Remove the tombstones at the end of the list.
+
+        The tombstones between entries are kept (i.e. the keys of the remaining entries
+        never shift), so the keys of the removed trailing entries are handed out again.
+
+        Returns:
+            None
+        """
+
+        # Get the list of entries once
+        rows: list[Any] = self._rows
+
+        # Iterate as long as the last slot is a tombstone
+        while rows and rows[-1] is MISSING:
+            # Remove the tombstone
+            rows.pop()
+
+    def copy(self) -> dict[Union[int, str], Any]:
+        """
+        Return a dictionary with the stored keys and entries.
+
+        Returns:
+            dict[Union[int, str], Any]: A dictionary with the stored keys and entries.
+        """
+
+        # Return a dictionary with the stored keys and entries (i.e. both iterators share their order)
+        return dict(
+            zip(
+                self,
+                self.iter_values(),
+            )
+        )
+
+    def extend(
+        self,
+        values: list[Any],
+    ) -> range:
+        """
+        Append the passed entries with a single list resize and return their keys.
+
+        Args:
+            values (list[Any]): The entries to be appended.
+
+        Returns:
+            range: The keys of the appended entries.
+        """
+
+        # Move the overflow entries the appended entries would reach into the list
+        # (every move may reach further overflow entries, so the keys are moved until none is reached)
+        while self._extra:
+            # Get the number of slots before the move
+            size: int = len(self._rows)
+
+            # Move the overflow entries below the end of the appended entries into the list
+            self._absorb(stop=size + len(values))
+
+            # Check if no overflow entry has been moved
+            if len(self._rows) == size:
+                # Stop moving overflow entries
+                break
+
+        # Get the keys of the appended entries
+        keys: range = range(
+            len(self._rows),
+            len(self._rows) + len(values),
+        )
+
+        # Append the passed entries to the list
+        self._rows.extend(values)
+
+        # Increment the number of stored entries
+        self._size += len(values)
+
+        # Return the keys of the appended entries
+        return keys
+
+    def get(
+        self,
+        key: Union[int, str],
+        default: Any = None,
+    ) -> Any:
+        """
+        Return the entry stored with the passed key or the passed default value.
+
+        Args:
+            key (Union[int, str]): The key of the entry.
+            default (Any, optional): The value to be returned if the key does not exist. Defaults to None.
+
+        Returns:
+            Any: The entry stored with the passed key or the passed default value.
+        """
+
+        # Check if the passed key is the index of a slot of the list
+        if type(key) is int and 0 <= key < len(self._rows):
+            # Get the entry stored in the slot
+            value: Any = self._rows[key]
+
+            # Return the entry or the passed default value if the slot is a tombstone
+            # (i.e. without raising and catching a KeyError exception as the mixin does)
+            return default if value is MISSING else value
+
+        # Return the entry stored in the overflow dictionary or the passed default value
+        return self._extra.get(
+            key,
+            default,
+        )
+
+    def iter_values(self) -> Iterator[Any]:
+        """
+        Return an iterator over the stored entries (i.e. in the order of the keys returned by __iter__).
+
+        Returns:
+            Iterator[Any]: An iterator over the stored entries.
+        """
+
+        # Return an iterator over the entries of the live slots and the overflow entries
+        # (compress and map skip the tombstones in C, without a Python-level loop)
+        return chain(
+            compress(
+                self._rows,
+                map(
+                    is_not,
+                    self._rows,
+                    repeat(MISSING),
+                ),
+            ),
+            self._extra.values(),
+        )
+
+    def missing(
+        self,
+        keys: Iterable[Union[int, str]],
+    ) -> list[Union[int, str]]:
+        """
+        Return the passed keys that no entry is stored with (i.e. in the passed order).
+
+        Validates a whole batch of keys with a single call, so the rows list, its length
+        and the overflow dictionary are bound once instead of once per key.
+
+        Args:
+            keys (Iterable[Union[int, str]]): The keys to be checked.
+
+        Returns:
+            list[Union[int, str]]: The keys that no entry is stored with.
+        """
+
+        # Bind the rows list, its length and the overflow dictionary once (i.e. outside of the loop)
+        rows: list[Any] = self._rows
+        size: int = len(rows)
+        extra: dict[Union[int, str], Any] = self._extra
+
+        # Return the keys that neither address a live slot nor an overflow entry
+        return [
+            key
+            for key in keys
+            if not (
+                rows[key] is not MISSING
+                if type(key) is int and 0 <= key < size
+                else key in extra
+            )
+        ]
+
+    def pop(
+        self,
+        key: Union[int, str],
+        default: Any = _RAISE,
+    ) -> Any:
+        """
+        Remove the entry stored with the passed key and return it.
+        Leaves a tombstone behind, so the keys of the other entries do not change.
+
+        Args:
+            key (Union[int, str]): The key of the entry to be removed.
+            default (Any, optional): The value to be returned if the key does not exist.
+
+        Returns:
+            Any: The removed entry or the passed default value.
+
+        Raises:
+            KeyError: If the key does not exist and no default value has been passed.
+        """
+
+        # Check if the passed key is the index of a slot of the list
+        if type(key) is int and 0 <= key < len(self._rows):
+            # Get the entry stored in the slot
+            value: Any = self._rows[key]
+
+            # Check if the slot holds an entry
+            if value is not MISSING:
+                # Replace the entry with a tombstone
+                self._rows[key] = MISSING
+
+                # Decrement the number of stored entries
+                self._size -= 1
+
+                # Return the removed entry
+                return value
+        # Check if the passed key is contained in the overflow dictionary
+        elif key in self._extra:
+            # Decrement the number of stored entries
+            self._size -= 1
+
+            # Remove and return the entry stored in the overflow dictionary
+            return self._extra.pop(key)
+
+        # Check if no default value has been passed
+        if default is _RAISE:
+            # Raise a KeyError exception if the key does not exist
+            raise KeyError(key)
+
+        # Return the passed default value
+        return default
 
 
 class PebbleDatabase:
@@ -33,6 +566,28 @@ class PebbleDatabase:
     A class that represents a table in a database.
     """
 
+    __slots__ = (
+        "_created_at",
+        "_data",
+        "_dirty",
+        "_entries",
+        "_id_index",
+        "_identifier",
+        "_journal_size",
+        "_metadata",
+        "_name",
+        "_path",
+        "_tombstones",
+        "_updated_at",
+        "_values",
+    )
+
+    # The number of journal records after which a commit writes a full snapshot instead
+    _JOURNAL_LIMIT: Final[int] = 1000
+
+    # The Logger instance shared by all PebbleDatabase instances (i.e. constructed once per class)
+    _logger: ClassVar[Logger] = Logger(name="PebbleDatabase")
+
     def __init__(
         self,
         data: dict[str, Any],
@@ -59,10 +614,16 @@ class PebbleDatabase:
             None
         """
 
+        # Get the current datetime once if either timestamp has not been passed
+        # (i.e. a new instance is created and updated at the same instant)
+        now: Optional[datetime] = (
+            datetime.now() if created_at is None or updated_at is None else None
+        )
+
         # Check if the passed created_at value is None
         if created_at is None:
             # Update the created_at value with the current datetime
-            created_at = datetime.now()
+            created_at = now
 
         # Set the '_created_at' date to the passed value or now
         self._created_at: Final[datetime] = created_at
@@ -70,12 +631,47 @@ class PebbleDatabase:
         # Store the passed data dictionary in a final instance variable
         self._data: Final[dict[str, Any]] = data
 
+        # Ensure the 'entries' dictionary exists once
+        # (i.e. the methods rely on this invariant instead of checking on every call)
+        self._ensure_entries()
+
+        # Bind the 'entries' dictionary once (i.e. it is never replaced after this point)
+        self._entries: Final[dict[str, Any]] = self._data["entries"]
+
+        # Get the entries dictionary once
+        values: Mapping[Union[int, str], Any] = self._entries["values"]
+
+        # Check if the entries are not stored in a PebbleEntries instance yet (e.g. the data was loaded from a file)
+        if not isinstance(
+            values,
+            PebbleEntries,
+        ):
+            # Replace the entries dictionary with a PebbleEntries instance keyed by integers
+            # (i.e. numeric string keys are converted once at the boundary)
+            self._entries["values"] = PebbleEntries(
+                items=((self._storage_key(key=key), entry) for (key, entry) in values.items())
+            )
+
+        # Bind the entries once (i.e. the 'values' dictionary is never replaced after this point)
+        # (the hot paths read a slot instead of walking the nested data dictionaries)
+        self._values: Final[PebbleEntries] = self._entries["values"]
+
+        # Initialize the hash index of table identifiers to storage keys to None (i.e. built on the first lookup)
+        self._id_index: Optional[dict[str, Union[int, str]]] = None
+
+        # Initialize the storage keys of the entries added or changed since the last commit
+        self._dirty: set[Union[int, str]] = set()
+
+        # Initialize the storage keys of the entries removed since the last commit
+        self._tombstones: set[Union[int, str]] = set()
+
+        # Initialize the number of records in the journal file to None
+        # (i.e. this instance has not been loaded from or committed to its file yet)
+        self._journal_size: Optional[int] = None
+
         # Storet the passed identifier string in a final instance variable
         self._identifier: Final[str] = identifier
 
-        # Initialize the Logger instance
-        self._logger: Logger = Logger(name=self.__class__.__name__)
-
         # Check if the passed metadata is None
         if metadata is None:
             # Update the metadata with an empty dictionary
@@ -91,24 +687,25 @@ class PebbleDatabase:
         self._path: Final[Path] = path
 
         # Set the '_updated_at' date to the passed value or now
-        self._updated_at: datetime = updated_at or datetime.now()
+        self._updated_at: datetime = updated_at or now
 
     def __contains__(
         self,
-        key: str,
+        key: Union[int, str],
     ) -> bool:
         """
         Check if the passed key is contained in the data dictionary instance variable.
 
         Args:
-            key (str): The key to be checked.
+            key (Union[int, str]): The key to be checked.
 
         Returns:
             bool: True if the key is contained in the data dictionary instance variable, False otherwise.
         """
 
         # Return True if the passed key is contained in the data dictionary instance variable
-        return key in self._data["entries"]["values"]
+        # (integer keys are already storage keys, so the conversion call is skipped for them)
+        return (key if type(key) is int else self._storage_key(key=key)) in self._values
 
     def __eq__(
         self,
@@ -137,14 +734,14 @@ class PebbleDatabase:
 
     def __getitem__(
         self,
-        key: str,
+        key: Union[int, str],
     ) -> Any:
         """
         Return the value associated with the passed key.
         Will raise a KeyError exception is the key does not exist.
 
         Args:
-            key (str): The key to be checked.
+            key (Union[int, str]): The key to be checked.
 
         Returns:
             Any: The value associated with the passed key.
@@ -153,20 +750,28 @@ class PebbleDatabase:
             KeyError: If the passed key does not exist in the data dictionary instance variable.
         """
 
-        # Return the value associated with the passed key.
+        # Get the storage key of the passed key
+        # (integer keys are already storage keys, so the conversion call is skipped for them)
+        key = key if type(key) is int else self._storage_key(key=key)
+
+        # Get the value associated with the passed key.
         # Will raise a KeyError exception is the key does not exist
-        return self._data["entries"]["values"][key]
+        value: Any = self._values[key]
+
+        # Return the value associated with the passed key
+        return value
 
     def __iter__(self) -> Iterable[Any]:
         """
-        Return an iterator over the copy of the data dictionary instance variable.
+        Return an iterator over the keys of the entries dictionary (i.e. without copying it).
+        Use snapshot() to iterate while mutating this PebbleDatabase instance.
 
         Returns:
-            Iterable[Any]: An iterator over the copy of the data dictionary instance variable.
+            Iterable[Any]: An iterator over the keys of the entries dictionary.
         """
 
-        # Return an iterator over the copy of the data dictionary instance variable
-        return iter(self._data["entries"]["values"].copy())
+        # Return an iterator over the keys of the entries dictionary
+        return iter(self._values)
 
     def __len__(self) -> int:
         """
@@ -177,7 +782,7 @@ class PebbleDatabase:
         """
 
         # Return the size of the data dictionary instance variable
-        return len(self._data["entries"]["values"])
+        return len(self._values)
 
     def __repr__(self) -> str:
         """
@@ -188,26 +793,40 @@ class PebbleDatabase:
         """
 
         # Return a string representation of this PebbleDatabase instance
-        return f"<{self.__class__.__name__}(entries={self.total}, identifier={self.identifier}, metadata={self.metadata}, name={self.name}, path={self.path})>"
+        # (the instance variables are read directly, so no copies are made and no state is written)
+        return f"<{self.__class__.__name__}(entries={len(self._values)}, identifier={self._identifier}, metadata={self._metadata}, name={self._name}, path={self._path})>"
 
     def __setitem__(
         self,
-        key: str,
+        key: Union[int, str],
         value: Any,
     ) -> Any:
         """
         Update the data dictionary instance variable with the passed value associated to the passed key.
 
         Args:
-            key (str): The key to be checked.
+            key (Union[int, str]): The key to be checked.
             value (Any): The value to be associated with the passed key.
 
         Returns:
             Any: The value associated with the passed key.
         """
 
+        # Get the storage key of the passed key
+        key = self._storage_key(key=key)
+
         # Update the data dictionary instance variable with the passed value associated to the passed key
-        self._data["entries"]["values"][key] = value
+        self._values[key] = value
+
+        # Mark the passed key as changed since the last commit
+        self._dirty.add(key)
+        self._tombstones.discard(key)
+
+        # Update the total count of the data dictionary instance variable
+        self._sync_total()
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
     def __str__(self) -> str:
         """
@@ -233,24 +852,17 @@ class PebbleDatabase:
         return self._created_at
 
     @property
-    def entries(self) -> dict[str, Any]:
+    def entries(self) -> Mapping[Union[int, str], Any]:
         """
-        Return a copy of the dictionary to the caller.
+        Return a read-only view of the entries dictionary to the caller (i.e. without copying it).
+        Use snapshot() to get a copy of the entries dictionary.
 
         Returns:
-            dict[str, Any]: A copy of the dictionary to the caller.
+            Mapping[Union[int, str], Any]: A read-only view of the entries dictionary.
         """
 
-        # Check if 'entries' exists in the data dictionary instance variable
-        if "entries" not in self._data:
-            # Initialize the 'entries' dictionary to a dictionary with a 'total' key and a 'values' key
-            self._data["entries"] = {
-                "total": 0,
-                "values": {},
-            }
-
-        # Return a copy of the dictionary to the caller
-        return self._data["entries"]["values"].copy()
+        # Return a read-only view of the entries dictionary to the caller
+        return MappingProxyType(self._values)
 
     @property
     def identifier(self) -> str:
@@ -322,125 +934,198 @@ class PebbleDatabase:
     def total(self) -> int:
         """
         Return the total count to the caller.
+        Does not write to the data dictionary instance variable (see _sync_total).
 
         Returns:
             int: The total count to the caller.
         """
 
-        # Check if 'entries' exists in the data dictionary instance variable
-        if "entries" not in self._data:
-            # Initialize the 'entries' dictionary to a dictionary with a 'total' key and a 'values' key
-            self._data["entries"] = {
-                "total": 0,
-                "values": {},
-            }
+        # Return the number of entries
+        return len(self._values)
+
+    @property
+    def updated_at(self) -> datetime:
+        """
+        Return the updated at datetime of the PebbleDatabase instance to the caller.
 
-        # Check if 'total' exists in the data dictionary instance variable
-        if "total" not in self._data["entries"]:
-            # Initialize the 'total' count to 0
-            self._data["entries"]["total"] = 0
-        else:
-            # Update the 'total' count to the size of the 'values' dictionary
-            self._data["entries"]["total"] = len(self._data["entries"]["values"])
+        Returns:
+            datetime: The updated at datetime of the PebbleDatabase instance to the caller.
+        """
 
-        # Return the total count to the caller
-        return self._data["entries"]["total"]
+        # Return the updated at datetime of the PebbleDatabase instance to the caller
+        return self._updated_at
 
-    @total.setter
-    def total(
+    @updated_at.setter
+    def updated_at(
         self,
-        value: int,
+        value: datetime,
     ) -> None:
         """
-        Update the total count with the passed value.
+        Update the updated at datetime of the PebbleDatabase instance with the passed value.
 
         Args:
-            value (int): The value to be associated with the passed key.
+            value (datetime): The value to be associated with the passed key.
 
         Returns:
             None
         """
 
-        # Check if 'entries' exists in the data dictionary instance variable
-        if "entries" not in self._data:
-            # Initialize the 'entries' dictionary to a dictionary with a 'total' key and a 'values' key
-            self._data["entries"] = {
-                "total": 0,
-                "values": {},
-            }
+        # Update the updated at datetime of the PebbleDatabase instance with the passed value
+        self._updated_at = value
+
+    def _build_id_index(self) -> dict[str, Union[int, str]]:
+        """
+        Return the hash index of table identifiers to storage keys.
+
+        The index is built on the first lookup and dropped on every mutation made through
+        the PebbleDatabase instance. Reads keep the index; a hit is validated against its
+        entry instead (see _lookup_keys), since entries may have been changed in place.
+
+        Returns:
+            dict[str, Union[int, str]]: The storage keys of the entries keyed by table identifier.
+        """
+
+        # Check if the identifier index has already been built
+        if self._id_index is not None:
+            # Return the identifier index
+            return self._id_index
+
+        # Initialize the identifier index to an empty dictionary
+        id_index: dict[str, Union[int, str]] = {}
+
+        # Get the entries dictionary once (i.e. outside of the loop)
+        values: PebbleEntries = self._values
+
+        # Iterate over the storage keys and the entries in storage order
+        for (
+            key,
+            entry,
+        ) in zip(
+            values,
+            values.iter_values(),
+        ):
+            # Check if the current entry has an identifier
+            if "identifier" in entry:
+                # Index the storage key of the entry (i.e. the first entry with an identifier wins)
+                id_index.setdefault(
+                    entry["identifier"],
+                    key,
+                )
+
+        # Store the identifier index
+        self._id_index = id_index
+
+        # Return the identifier index
+        return id_index
+
+
+    def _lookup_keys(
+        self,
+        identifiers: list[str],
+    ) -> list[Optional[Union[int, str]]]:
+        """
+        Return the storage keys of the passed table identifiers (None for missing identifiers).
+
+        Every hit in the identifier index is validated against the identifier of its entry.
+        The index is rebuilt once and the lookup repeated if an identifier is missing
+        or stale (i.e. an entry has been changed in place since the index was built).
+
+        Args:
+            identifiers (list[str]): The table identifiers to be looked up.
+
+        Returns:
+            list[Optional[Union[int, str]]]: The storage keys of the passed identifiers.
+        """
+
+        # Check if the identifier index is about to be built (i.e. it cannot be stale)
+        fresh: bool = self._id_index is None
 
-        # Check if 'total' exists in the data dictionary instance variable
-        if "total" not in self._data["entries"]:
-            # Initialize the 'total' count to 0
-            self._data["entries"]["total"] = 0
+        # Get the identifier index and the entries dictionary once (i.e. outside of the loop)
+        id_index: dict[str, Union[int, str]] = self._build_id_index()
+        values: PebbleEntries = self._values
 
-        # Update the total count with the passed value
-        self._data["entries"]["total"] = value
+        # Look up every passed identifier in the identifier index
+        # (a hit only counts if its entry still holds the identifier)
+        keys: list[Optional[Union[int, str]]] = [
+            key
+            if (key := id_index.get(identifier)) is not None
+            and values.get(key, {}).get("identifier") == identifier
+            else None
+            for identifier in identifiers
+        ]
 
-    @property
-    def updated_at(self) -> datetime:
-        """
-        Return the updated at datetime of the PebbleDatabase instance to the caller.
+        # Check if an identifier was not found in an index that may be stale
+        if not fresh and None in keys:
+            # Drop the identifier index (i.e. it is rebuilt from the current entries)
+            self._id_index = None
 
-        Returns:
-            datetime: The updated at datetime of the PebbleDatabase instance to the caller.
-        """
+            # Repeat the lookup with the rebuilt identifier index
+            return self._lookup_keys(identifiers=identifiers)
 
-        # Return the updated at datetime of the PebbleDatabase instance to the caller
-        return self._updated_at
+        # Return the storage keys of the passed identifiers
+        return keys
 
-    @updated_at.setter
-    def updated_at(
-        self,
-        value: datetime,
-    ) -> None:
+    def _ensure_entries(self) -> None:
         """
-        Update the updated at datetime of the PebbleDatabase instance with the passed value.
-
-        Args:
-            value (datetime): The value to be associated with the passed key.
+        Ensure the 'entries' dictionary with its 'total' and 'values' keys exists in the data dictionary instance variable.
 
         Returns:
             None
         """
 
-        # Update the updated at datetime of the PebbleDatabase instance with the passed value
-        self._updated_at = value
+        # Get or initialize the 'entries' dictionary
+        entries: dict[str, Any] = self._data.setdefault(
+            "entries",
+            {},
+        )
+
+        # Initialize the 'total' count to 0 if it does not exist
+        entries.setdefault(
+            "total",
+            0,
+        )
+
+        # Initialize the 'values' dictionary to an empty dictionary if it does not exist
+        entries.setdefault(
+            "values",
+            {},
+        )
 
     def _get(
         self,
-        identifier: str,
+        identifier: Union[int, str],
     ) -> Any:
         """
         Return the value associated with the passed key.
         Will raise a KeyError exception is the key does not exist.
 
         Args:
-            identifier (str): The identifier to be checked.
+            identifier (Union[int, str]): The identifier to be checked.
 
         Returns:
             Any: The value associated with the passed key.
         """
 
-        # Check if 'values' exists in the data dictionary instance variable
-        if "values" not in self._data:
-            # Initialize the 'values' dictionary to an empty dictionary
-            self._data["entries"]["values"] = {}
+        # Get the storage key of the passed identifier
+        identifier = self._storage_key(key=identifier)
 
-        # Return the value associated with the passed key.
+        # Get the value associated with the passed key.
         # Will raise a KeyError exception is the key does not exist
-        return self._data["entries"]["values"][identifier]
+        value: Any = self._values[identifier]
+
+        # Return the value associated with the passed key
+        return value
 
     def _get_in_bulk(
         self,
-        identifiers: list[str],
+        identifiers: list[Union[int, str]],
     ) -> list[Any]:
         """
         Return the values associated with the passed identifiers.
         Will raise a KeyError exception is the key does not exist.
 
         Args:
-            identifiers (list[str]): The identifiers to be checked.
+            identifiers (list[Union[int, str]]): The identifiers to be checked.
 
         Returns:
             list[Any]: The values associated with the passed identifiers.
@@ -452,16 +1137,17 @@ class PebbleDatabase:
         # Initialize the errors list to an empty list
         errors: list[KeyError] = []
 
-        # Check if 'values' exists in the data dictionary instance variable
-        if "values" not in self._data["entries"]:
-            # Initialize the 'values' dictionary to an empty dictionary
-            self._data["entries"]["values"] = {}
+        # Get the entries dictionary once (i.e. outside of the loop)
+        values: PebbleEntries = self._values
 
-        # Iterate over the passed idenfifiers
-        for identifier in identifiers:
+        # Get the storage keys of the passed identifiers
+        keys: list[Union[int, str]] = list(map(self._storage_key, identifiers))
+
+        # Iterate over the storage keys of the passed idenfifiers
+        for key in keys:
             try:
                 # Attempt to append the value associated to the current identifier
-                result.append(self._data["entries"]["values"][identifier])
+                result.append(values[key])
             except KeyError as e:
                 # Append the excepted KeyError exception to the errors list
                 errors.append(e)
@@ -490,41 +1176,35 @@ class PebbleDatabase:
             int: The identifier of the inserted entry.
         """
 
-        # Check if 'entries' exists in the data dictionary instance variable
-        if "entries" not in self._data:
-            # Initialize the 'entries' dictionary to a dictionary with a 'total' key and a 'values' key
-            self._data["entries"] = {
-                "total": 0,
-                "values": {},
-            }
-
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
-
-        # Get the identifier that the passed entry shuld be associated with
-        identifier: str = str(self.total)
+        # Check if no timestamp has been passed
+        # (an identity test, instead of re-annotating the parameter with an 'or' fallback)
+        if timestamp is None:
+            # Get the current timestamp
+            timestamp = datetime.now()
 
         # Set the '_added_at' date to now
         entry["_added_at"] = timestamp.isoformat()
 
-        # Check if 'values' exists in the data dictionary instance variable
-        if "values" not in self._data["entries"]:
-            # Initialize the 'values' dictionary to an empty dictionary
-            self._data["entries"]["values"] = {}
+        # Append the passed entry dictionary to the entries and get the identifier it is associated with
+        identifier: int = self._values.append(entry)
 
-        # Add the passed entry dictionary to the data dictionary instance variable
-        self._data["entries"]["values"][identifier] = entry
+        # Mark the inserted entry as changed since the last commit
+        self._dirty.add(identifier)
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
         # Update the total count of the data dictionary instance variable
-        self.total = self.total + 1
+        self._sync_total()
 
         # Check if the operation is not a bulk operation
         if not is_bulk_operation:
             # Update the updated at datetime of the PebbleDatabase instance with the passed value
-            self.updated_at = timestamp
+            # (the slot is written directly, i.e. without the property setter call)
+            self._updated_at = timestamp
 
-        # Return the identifier converted to an integer
-        return int(identifier)
+        # Return the identifier to the caller
+        return identifier
 
     def _insert_in_bulk(
         self,
@@ -543,19 +1223,68 @@ class PebbleDatabase:
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the result to an empty list
-        result: list[int] = []
+        # Format the current timestamp once (i.e. it is shared by all inserted entries)
+        added_at: str = timestamp.isoformat()
 
         # Iterate over the passed entries
         for entry in entries:
-            # Insert the current entry into the data dictionary instance variable
-            result.append(self._insert(entry=entry, is_bulk_operation=True, timestamp=timestamp))
+            # Set the '_added_at' date of the current entry to the shared timestamp
+            entry["_added_at"] = added_at
+
+        # Append the passed entries to the entries with a single list resize and get their storage keys
+        keys: range = self._values.extend(entries)
+
+        # Mark the inserted entries as changed since the last commit
+        self._dirty.update(keys)
+
+        # Update the total count of the data dictionary instance variable once
+        self._sync_total()
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
         # Update the updated at datetime of the PebbleDatabase instance with the passed value
-        self.updated_at = timestamp
+        # (the slot is written directly, i.e. without the property setter call)
+        self._updated_at = timestamp
 
-        # Return the result list to the caller
-        return result
+        # Return the storage keys of the inserted entries to the caller
+        return list(keys)
+
+    @staticmethod
+    def _storage_key(key: Union[int, str]) -> Union[int, str]:
+        """
+        Return the storage key of the passed key.
+
+        Entries are stored with integer keys, so numeric strings (e.g. keys read from a file
+        or passed by callers that use string keys) are converted at the boundary.
+
+        Args:
+            key (Union[int, str]): The key to be converted.
+
+        Returns:
+            Union[int, str]: The integer storage key or the passed key if it is not numeric.
+        """
+
+        # Check if the passed key is a numeric string
+        if type(key) is str and key.isdecimal():
+            # Return the key converted to an integer
+            return int(key)
+
+        # Return the passed key
+        return key
+
+    def _sync_total(self) -> None:
+        """
+        Update the stored total count of the data dictionary instance variable with the number of entries.
+        Called by the methods that add or remove entries, so reading the total stays free of side effects.
+
+        Returns:
+            None
+        """
+
+        # Update the stored total count with the number of entries
+        # (the bound 'entries' dictionary is written, i.e. without walking the data dictionary)
+        self._entries["total"] = len(self._values)
 
     def add_table(
         self,
@@ -572,9 +1301,10 @@ class PebbleDatabase:
         """
 
         # Insert the table data into the data dictionary instance variable and return the entry's ID
+        # (the identifier is interned, as it becomes a key of the identifier index)
         return self._insert(
             entry={
-                "identifier": table.identifier,
+                "identifier": sys.intern(table.identifier),
                 "name": table.name,
                 "path": table.path,
             }
@@ -594,15 +1324,13 @@ class PebbleDatabase:
             list[int]: The identifiers of the added tables.
         """
 
-        # Get the current timestamp
-        timestamp: str = DateUtil.now().isoformat()
-
         # Insert the table data into the data dictionary instance variable and return the entry's IDs
+        # (the '_added_at' timestamp is formatted once for the whole batch by _insert_in_bulk)
+        # (the identifiers are interned, as they become keys of the identifier index)
         return self._insert_in_bulk(
             entries=[
                 {
-                    "added_at": timestamp,
-                    "identifier": table.identifier,
+                    "identifier": sys.intern(table.identifier),
                     "name": table.name,
                     "path": table.path,
                 }
@@ -619,18 +1347,99 @@ class PebbleDatabase:
         """
 
         # Return a list of the values contained in this PebbleDatabase instance
-        return list(self.entries.values())
+        return list(self._values.iter_values())
 
     def commit(self) -> None:
         """
         Commit the changes to the database.
 
+        Only the entries added, changed or removed since the last commit are appended
+        as one record to the journal file next to the database file ('<name>.journal').
+        A full snapshot is written instead (and the journal file deleted) if the database
+        file does not exist yet, if the journal holds _JOURNAL_LIMIT records, or on the
+        first commit of an instance that was not loaded from its file. The latter is merged
+        into the existing file after its journal has been replayed onto it, so the journaled
+        changes are not lost with the journal file.
+        Reads do not mark entries as changed: an entry changed in place (e.g. through
+        __getitem__, entries or all()) is only written if it is passed to update() or
+        __setitem__ as well.
+
         Returns:
             None
         """
 
-        # Attempt to commit the database to a file
-        PEBBLE_COMMIT_SERVICE.commit(database_or_table=self.to_dict())
+        # Get the path of the database file and of its journal file
+        path: Path = Path(self._path)
+        journal: Path = path.with_suffix(".journal")
+
+        # Get the PebbleCommitService instance (i.e. created on first access)
+        service: Any = constants.PEBBLE_COMMIT_SERVICE
+
+        # Check if a full snapshot has to be written
+        if (
+            self._journal_size is None
+            or self._journal_size >= self._JOURNAL_LIMIT
+            or not path.exists()
+        ):
+            # Remove the tombstones at the end of the entries (i.e. they are not written to the snapshot)
+            self._values.compact()
+
+            # Get the dictionary representation of this PebbleDatabase instance
+            document: dict[str, Any] = self.to_dict()
+
+            # Check if this instance has not been loaded from its existing file
+            if self._journal_size is None and path.exists():
+                # Read and deserialize the existing database file
+                existing: dict[str, Any] = _deserialize(value=path.read_bytes())
+
+                # Replay the journal file onto the existing snapshot
+                # (i.e. the changes appended since its last snapshot are merged as well)
+                PebbleDatabaseLoader._replay_journal(
+                    data=existing,
+                    journal=journal,
+                )
+
+                # Merge this instance into the existing database
+                document = merge_dicts(
+                    new=document,
+                    old=existing,
+                )
+
+            # Attempt to commit the full database to a file
+            service.commit(
+                database_or_table=document,
+                merge=False,
+            )
+
+            # Delete the journal file (i.e. its records are contained in the snapshot)
+            run_async(
+                function=delete_file,
+                path=journal,
+            )
+
+            # Reset the number of records in the journal file
+            self._journal_size = 0
+        elif self._dirty or self._tombstones:
+            # Get the entries dictionary once
+            values: PebbleEntries = self._values
+
+            # Attempt to append the changes since the last commit to the journal file
+            service.append(
+                path=journal,
+                record={
+                    "delete": [str(key) for key in self._tombstones],
+                    "metadata": self._metadata,
+                    "updated_at": self._updated_at,
+                    "upsert": {str(key): values[key] for key in self._dirty},
+                },
+            )
+
+            # Increment the number of records in the journal file
+            self._journal_size += 1
+
+        # Clear the changes since the last commit
+        self._dirty.clear()
+        self._tombstones.clear()
 
     def create_table(
         self,
@@ -656,8 +1465,9 @@ class PebbleDatabase:
 
         # Check if the passed identifier is None
         if identifier is None:
-            # Update the identifier with a newly generated UUID
-            identifier = uuid.uuid4().hex
+            # Update the identifier with a newly generated random 128-bit hex string
+            # (read straight from os.urandom, i.e. without constructing a UUID object)
+            identifier = secrets.token_hex(16)
 
         # Check if the passed identifier is None
         if path is None:
@@ -733,32 +1543,22 @@ class PebbleDatabase:
         # TODO:
         #   - implement loading the table file from disk if possible
 
-        # Attempt to fetch the data associated with the passed identifier
-        table: Optional[dict[str, Any]] = next(
-            filter(
-                lambda table: table["identifier"] == identifier,
-                self.entries.values(),
-            ),
-            None,
-        )
+        # Look up the storage key of the passed identifier in the identifier index
+        key: Optional[Union[int, str]] = self._lookup_keys(identifiers=[identifier])[0]
 
-        # Check if the table was found
-        if table is None:
+        # Check if the table was not found
+        if key is None:
             # Raise a KeyError exception if the table was not found
             raise KeyError(identifier)
 
+        # Get the table associated with the storage key
+        table: dict[str, Any] = self._values[key]
+
         # Return the table associated with the passed identifier
-        return (
-            PebbleTableBuilder()
-            .with_created_at(value=table.get("created_at", None))
-            .with_data(value=table.get("data", {}))
-            .with_database(value=self.name)
-            .with_identifier(value=table.get("identifier", None))
-            .with_metadata(value=table.get("metadata", {}))
-            .with_name(value=table.get("name", None))
-            .with_path(value=table.get("path", None))
-            .with_updated_at(value=table.get("updated_at", None))
-            .build()
+        # (a single constructor call instead of a fresh builder and its fluent calls)
+        return PebbleTable.from_dict(
+            database=self._name,
+            value=table,
         )
 
     def get_tables(
@@ -781,32 +1581,31 @@ class PebbleDatabase:
         # TODO:
         #   - implement loading the table file from disk if possible
 
-        # Filter the entries to get the tables associated with the passed identifiers
-        tables: list[dict[str, Any]] = list(
-            filter(
-                lambda table: table["identifier"] in identifiers,
-                self.entries.values(),
-            )
-        )
+        # Get the entries dictionary once (i.e. outside of the loop)
+        values: PebbleEntries = self._values
+
+        # Look up every passed identifier once in the identifier index (i.e. duplicates are skipped)
+        tables: list[dict[str, Any]] = [
+            values[key]
+            for key in self._lookup_keys(identifiers=list(dict.fromkeys(identifiers)))
+            if key is not None
+        ]
 
         # Check if the tables were found
         if not tables:
             # Raise a KeyError exception if the tables were not found
             raise KeyError(identifiers)
 
+        # Bind the database name and the from_dict method once (i.e. outside of the loop)
+        database: str = self._name
+        from_dict = PebbleTable.from_dict
+
         # Return the tables associated with the passed identifiers
+        # (a single constructor call per table instead of a fresh builder and its fluent calls)
         return [
-            (
-                PebbleTableBuilder()
-                .with_created_at(value=table.get("created_at", None))
-                .with_data(value=table.get("data", {}))
-                .with_database(value=self.name)
-                .with_identifier(value=table.get("identifier", None))
-                .with_metadata(value=table.get("metadata", {}))
-                .with_name(value=table.get("name", None))
-                .with_path(value=table.get("path", None))
-                .with_updated_at(value=table.get("updated_at", None))
-                .build()
+            from_dict(
+                database=database,
+                value=table,
             )
             for table in tables
         ]
@@ -820,7 +1619,7 @@ class PebbleDatabase:
         """
 
         # Return the items of the PebbleDatabase's entries
-        return self.entries.items()
+        return self._values.items()
 
     def keys(self) -> KeysView[Any]:
         """
@@ -831,11 +1630,11 @@ class PebbleDatabase:
         """
 
         # Return the keys of the PebbleDatabase's entries
-        return self.entries.keys()
+        return self._values.keys()
 
     def remove(
         self,
-        identifier: str,
+        identifier: Union[int, str],
         is_bulk_operation: bool = False,
         timestamp: Optional[datetime] = None,
     ) -> bool:
@@ -843,7 +1642,7 @@ class PebbleDatabase:
         Remove the value associated with the passed identifier from the data dictionary instance variable.
 
         Args:
-            identifier (str): The identifier to be removed.
+            identifier (Union[int, str]): The identifier to be removed.
             is_bulk_operation (bool, optional): Whether the removal is part of a bulk operation. Defaults to False.
             timestamp (Optional[datetime], optional): The timestamp to be associated with the removal. Defaults to None.
 
@@ -851,32 +1650,45 @@ class PebbleDatabase:
             bool: True if the value associated with the identifier was removed successfully otherwise False.
         """
 
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
+        # Get the entries dictionary once
+        values: PebbleEntries = self._values
+
+        # Get the storage key of the passed identifier
+        identifier = self._storage_key(key=identifier)
 
         # Set the result to True if the value associated with the identifier was removed successfully otherwise False
-        result: bool = bool(self._data["entries"]["values"].pop(identifier, False))
+        result: bool = values.pop(identifier, MISSING) is not MISSING
+
+        # Check if the value associated with the identifier was removed
+        if result:
+            # Mark the passed identifier as removed since the last commit
+            self._dirty.discard(identifier)
+            self._tombstones.add(identifier)
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
         # Update the total count of the data dictionary instance variable
-        self.total = self.total + 1
+        self._sync_total()
 
         # Check if the operation is not a bulk operation
         if not is_bulk_operation:
-            # Update the updated at datetime of the PebbleDatabase instance with the passed value
-            self.updated_at = timestamp
+            # Update the updated at datetime of the PebbleDatabase instance with the passed value or now
+            # (the clock is only read here, so bulk operations that skip this branch never read it)
+            self._updated_at = timestamp or datetime.now()
 
         # Return the result to the caller
         return result
 
     def remove_in_bulk(
         self,
-        identifiers: list[str],
+        identifiers: list[Union[int, str]],
     ) -> bool:
         """
         Remove the values associated with the passed identifiers from the data dictionary instance variable.
 
         Args:
-            identifiers (list[str]): The identifiers to be removed.
+            identifiers (list[Union[int, str]]): The identifiers to be removed.
 
         Returns:
             bool: True if the values associated with the identifiers were removed successfully otherwise False.
@@ -885,40 +1697,47 @@ class PebbleDatabase:
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the total result to an empty list
-        total_result: list[Any] = []
+        # Get the entries dictionary once (i.e. outside of the loop)
+        values: PebbleEntries = self._values
 
-        # Initialize the errors list to an empty list
-        errors: list[str] = []
-
-        # Iterate over the passed idenfifiers
-        for identifier in identifiers:
-            # Attempt to remove the current identifier
-            result: bool = self.remove(
-                identifier=identifier,
-                is_bulk_operation=True,
-                timestamp=timestamp,
+        # Get the storage keys of the passed identifiers
+        keys: list[Union[int, str]] = [
+            self._storage_key(key=identifier) for identifier in identifiers
+        ]
+
+        # Bind the pop method of the entries dictionary once (i.e. outside of the loop)
+        pop = values.pop
+
+        # Remove the passed identifiers and collect the ones that could not be removed
+        errors: list[Union[int, str]] = [
+            identifier
+            for (
+                identifier,
+                key,
+            ) in zip(
+                identifiers,
+                keys,
             )
+            if pop(key, MISSING) is MISSING
+        ]
 
-            # Check if the removal was unsuccessfull
-            if not result:
-                errors.append(result)
+        # Mark the passed identifiers as removed since the last commit
+        # (removing a key that did not exist is a no-op when the journal is replayed)
+        self._dirty.difference_update(keys)
+        self._tombstones.update(keys)
 
-            # Append the result to the total result list
-            total_result.append(result)
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
-        # Check if the errors list contains any False booleans
-        if errors and not all(errors):
-            # Raise a ValueError exception
-            ValueError(
-                f"Failed to remove keys '{', '.join(errors)}' from the data dictionary. Please review your code for any mistakes before trying again."
-            )
+        # Update the total count of the data dictionary instance variable once
+        self._sync_total()
 
         # Update the updated at datetime of the PebbleDatabase instance with the passed value
-        self.updated_at = timestamp
+        # (the slot is written directly, i.e. without the property setter call)
+        self._updated_at = timestamp
 
-        # Return the result list to the caller
-        return all(total_result)
+        # Return True if all passed identifiers were removed successfully otherwise False
+        return not errors
 
     def set_metadata(
         self,
@@ -948,7 +1767,19 @@ class PebbleDatabase:
         """
 
         # Return the total count to the caller
-        return self.total
+        # (the number of entries is read directly, i.e. without the property call)
+        return len(self._values)
+
+    def snapshot(self) -> dict[Union[int, str], Any]:
+        """
+        Return a shallow copy of the entries dictionary to the caller.
+
+        Returns:
+            dict[Union[int, str], Any]: A shallow copy of the entries dictionary.
+        """
+
+        # Return a shallow copy of the entries dictionary to the caller
+        return self._values.copy()
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -958,24 +1789,52 @@ class PebbleDatabase:
             dict[str, Any]: A dictionary representation of the PebbleDatabase instance.
         """
 
+        # Get the entries dictionary once
+        values: PebbleEntries = self._values
+
         # Return a dictionary representation of the PebbleDatabase instance
+        # (the integer storage keys and the path are converted to strings at the boundary, as in the file format)
+        # (the converted keys are paired with the live entries in C, i.e. without an intermediate copy)
         return {
-            "created_at": self.created_at,
+            "created_at": self._created_at,
             "entries": {
-                "total": self.total,
-                "values": self.entries,
+                "total": len(values),
+                "values": dict(
+                    zip(
+                        map(
+                            str,
+                            values,
+                        ),
+                        values.iter_values(),
+                    )
+                ),
             },
-            "identifier": self.identifier,
-            "metadata": self.metadata,
-            "name": self.name,
-            "path": self.path,
-            "updated_at": self.updated_at,
+            "identifier": self._identifier,
+            "metadata": self._metadata,
+            "name": self._name,
+            "path": str(self._path),
+            "updated_at": self._updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Return the UTF-8 encoded JSON representation of the PebbleDatabase instance.
+
+        The dictionary representation is serialized straight to bytes (with orjson if it
+        is installed), so callers that write or send the document skip the intermediate
+        string and its re-encoding. Use to_dict() to get the dictionary itself.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of the PebbleDatabase instance.
+        """
+
+        # Return the serialized dictionary representation of the PebbleDatabase instance
+        return _serialize_bytes(value=self.to_dict())
+
     def update(
         self,
         entry: dict[str, Any],
-        identifier: str,
+        identifier: Union[int, str],
         is_bulk_operation: bool = False,
         timestamp: Optional[datetime] = None,
     ) -> bool:
@@ -984,7 +1843,7 @@ class PebbleDatabase:
 
         Args:
             entry (dict[str, Any]): The entry to be updated.
-            identifier (str): The identifier to be updated.
+            identifier (Union[int, str]): The identifier to be updated.
             is_bulk_operation (bool, optional): Whether the update is part of a bulk operation. Defaults to False.
             timestamp (Optional[datetime], optional): The timestamp to be associated with the update. Defaults to None.
 
@@ -992,21 +1851,33 @@ class PebbleDatabase:
             bool: True if the value associated with the identifier was updated successfully otherwise False.
         """
 
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
+        # Get the storage key of the passed identifier
+        identifier = self._storage_key(key=identifier)
+
+        # Get the value associated with the passed identifier
+        # (a single probe, instead of a membership test followed by a lookup)
+        value: Optional[dict[str, Any]] = self._values.get(identifier)
 
-        # Check if the passed identifier is contained within the data dictionary instance variable
-        if identifier not in self._data["entries"]["values"]:
+        # Check if the passed identifier is not contained within the data dictionary instance variable
+        if value is None:
             # Raise a KeyError exception if the passed identifier was not found in the data dictionary instance variable
             raise KeyError(identifier)
 
-        # Update the value associated with the passed identifier with the passed entry
-        self._data["entries"]["values"].update(entry)
+        # Merge the passed entry into the value associated with the passed identifier
+        # (i.e. the row keyed by the identifier, not the entries dictionary itself)
+        value.update(entry)
+
+        # Mark the passed identifier as changed since the last commit
+        self._dirty.add(identifier)
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
         # Check if the operation is not a bulk operation
         if not is_bulk_operation:
-            # Update the updated at datetime of the PebbleDatabase instance with the passed value
-            self.updated_at = timestamp
+            # Update the updated at datetime of the PebbleDatabase instance with the passed value or now
+            # (the clock is only read here, so bulk operations that skip this branch never read it)
+            self._updated_at = timestamp or datetime.now()
 
         # Return True to the caller to indicate sucess
         return True
@@ -1014,57 +1885,61 @@ class PebbleDatabase:
     def update_in_bulk(
         self,
         entries: list[dict[str, Any]],
-        identifiers: list[str],
+        identifiers: list[Union[int, str]],
     ) -> bool:
         """
         Update the values associated with the passed identifiers with the passed entries.
 
         Args:
             entries (list[Anydict[str, Any]]): The entries to be updated.
-            identifiers (list[str]): The identifiers to be updated.
+            identifiers (list[Union[int, str]]): The identifiers to be updated.
 
         Returns:
             bool: True if the values associated with the identifiers were updated successfully otherwise False.
+
+        Raises:
+            KeyError: If any of the passed identifiers was not found (i.e. no entry is updated).
         """
 
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the result to an empty list
-        result: list[Any] = []
+        # Get the entries dictionary and the storage keys of the passed identifiers once
+        values: PebbleEntries = self._values
+        keys: list[Union[int, str]] = list(map(self._storage_key, identifiers))
 
-        # Initialize the errors list to an empty list
-        errors: list[KeyError] = []
+        # Collect the storage keys that are not contained in the entries dictionary
+        # (all keys are validated up front in a single call, so either every entry is updated or none is)
+        missing: list[Union[int, str]] = values.missing(keys=keys)
+
+        # Check if any of the passed identifiers was not found
+        if missing:
+            # Raise a single KeyError exception with all missing keys
+            raise KeyError(*missing)
 
-        # Iterate over the passed entries and idenfifiers
+        # Iterate over the storage keys and the passed entries
         for (
+            key,
             entry,
-            identifier,
-        ) in zip(entries, identifiers):
-            try:
-                # Attempt to append the result of updating the value associated with the current identifier with the current value
-                result.append(
-                    self.update(
-                        entry=entry,
-                        identifier=identifier,
-                        is_bulk_operation=True,
-                        timestamp=timestamp,
-                    )
-                )
-            except KeyError as e:
-                # Append the excepted KeyError exception to the errors list
-                errors.append(e)
+        ) in zip(
+            keys,
+            entries,
+        ):
+            # Merge the current entry into the value associated with the current storage key
+            values[key].update(entry)
 
-        # Check if the errors list is not empty
-        if errors:
-            # Raise a sinlge KeyError exception with all missing keys
-            raise KeyError(*errors)
+        # Mark the passed identifiers as changed since the last commit
+        self._dirty.update(keys)
+
+        # Drop the identifier index (i.e. it is rebuilt on the next lookup)
+        self._id_index = None
 
         # Update the updated at datetime of the PebbleDatabase instance with the passed value
-        self.updated_at = timestamp
+        # (the slot is written directly, i.e. without the property setter call)
+        self._updated_at = timestamp
 
-        # Return True if all operations in the result list were successfull
-        return all(result)
+        # Return True to the caller to indicate success
+        return True
 
     def values(self) -> ValuesView[Any]:
         """
@@ -1075,7 +1950,7 @@ class PebbleDatabase:
         """
 
         # Return the values of the PebbleDatabase's entries
-        return self.entries.values()
+        return self._values.values()
 
 
 class PebbleDatabaseFactory:
@@ -1112,8 +1987,9 @@ class PebbleDatabaseFactory:
 
         # Check if the passed identifier is None
         if identifier is None:
-            # Update the identifier with a newly generated UUID
-            identifier = uuid.uuid4().hex
+            # Update the identifier with a newly generated random 128-bit hex string
+            # (read straight from os.urandom, i.e. without constructing a UUID object)
+            identifier = secrets.token_hex(16)
 
         # Check if the passed metadata is None
         if metadata is None:
@@ -1154,7 +2030,7 @@ class PebbleDatabaseFactory:
         return PebbleDatabase(
             created_at=datetime.now(),
             data={},
-            identifier=uuid.uuid4().hex,
+            identifier=secrets.token_hex(16),
             metadata={},
             name=name,
             path=CWD,
@@ -1162,11 +2038,17 @@ class PebbleDatabaseFactory:
         )
 
 
-class PebbleDatabaseBuilder:
+class PebbleDatabaseBuilder(MutableMapping):
     """
     A builder class for creating new PebbleDatabase instances.
+
+    The builder is a mutable mapping over its configuration dictionary, so the mapping
+    protocol methods are single-expression delegations and the MutableMapping mixins
+    (e.g. get, keys, items, pop) are available without copying the configuration.
     """
 
+    __slots__ = ("_configuration",)
+
     def __init__(self) -> None:
         """
         Initialize the PebbleDatabaseBuilder instance with an empty configuration dictionary instance variable.
@@ -1181,7 +2063,7 @@ class PebbleDatabaseBuilder:
     def __contains__(
         self,
         key: str,
-    ) -> None:
+    ) -> bool:
         """
         Check if the passed key is contained in the configuration dictionary instance variable.
 
@@ -1195,6 +2077,25 @@ class PebbleDatabaseBuilder:
         # Check if the passed key is contained in the configuration dictionary instance variable
         return key in self._configuration
 
+    def __delitem__(
+        self,
+        key: str,
+    ) -> None:
+        """
+        Remove the passed key from the configuration dictionary instance variable.
+        Will raise a KeyError exception is the key does not exist.
+
+        Args:
+            key (str): The key to be removed.
+
+        Returns:
+            None
+        """
+
+        # Remove the passed key from the configuration dictionary instance variable
+        # Will raise a KeyError exception is the key does not exist
+        del self._configuration[key]
+
     def __eq__(
         self,
         other: "PebbleDatabaseBuilder",
@@ -1212,13 +2113,14 @@ class PebbleDatabaseBuilder:
         # Check if the passed other object is not a PebbleDatabaseBuilder instance
         if not isinstance(
             other,
-            PebbleDatabase,
+            PebbleDatabaseBuilder,
         ):
             # Return False as a comparison between non-identical classes is not supported
             return False
 
         # Return True if the configuration dictionary instance variables of the two PebbleDatabaseBuilder instance are equal otherwise False
-        return self.configuration == other.configuration
+        # (the instance variables are compared directly, i.e. without creating views or copies)
+        return self._configuration == other._configuration
 
     def __getitem__(
         self,
@@ -1270,7 +2172,8 @@ class PebbleDatabaseBuilder:
         """
 
         # Return a string representation of the PebbleDatabaseBuilder instance
-        return f"<{self.__class__.__name__}(configuration={self.configuration})>"
+        # (the instance variable is read directly, i.e. without creating a view or a copy)
+        return f"<{self.__class__.__name__}(configuration={self._configuration})>"
 
     def __setitem__(
         self,
@@ -1303,16 +2206,16 @@ class PebbleDatabaseBuilder:
         return str(self._configuration)
 
     @property
-    def configuration(self) -> dict[str, Any]:
+    def configuration(self) -> Mapping[str, Any]:
         """
-        Return a copy of the configuration dictionary instance variable to the caller.
+        Return a read-only view of the configuration dictionary instance variable to the caller (i.e. without copying it).
 
         Returns:
-            dict[str, Any]: A copy of the configuration dictionary instance variable.
+            Mapping[str, Any]: A read-only view of the configuration dictionary instance variable.
         """
 
-        # Return a copy of the configuration dictionary instance variable to the caller
-        return self._configuration.copy()
+        # Return a read-only view of the configuration dictionary instance variable to the caller
+        return MappingProxyType(self._configuration)
 
     def build(self) -> PebbleDatabase:
         """
@@ -1325,6 +2228,20 @@ class PebbleDatabaseBuilder:
         # Attempt to create and return the PebbleDatabase instance
         return PebbleDatabaseFactory.create(**self._configuration)
 
+    def reset(self) -> Self:
+        """
+        Reset the configuration dictionary instance variable, so the builder can be reused.
+
+        Returns:
+            Self: The builder.
+        """
+
+        # Clear the configuration dictionary instance variable
+        self._configuration.clear()
+
+        # Return the builder
+        return self
+
     def with_created_at(
         self,
         value: Optional[datetime] = None,
@@ -1377,9 +2294,20 @@ class PebbleDatabaseBuilder:
         # Update the configuration with the passed value
         self._configuration["data"] = value
 
+        # Get or initialize the 'entries' dictionary of the passed value once
+        # (i.e. a data dictionary without entries no longer raises a KeyError exception)
+        entries: dict[str, Any] = value.setdefault(
+            "entries",
+            {},
+        )
+
         # Update the 'total' keyword with the total number of entries
-        self._configuration["data"]["entries"]["total"] = len(
-            self._configuration["data"]["entries"]["values"]
+        # (the length of a dictionary is stored on it, so no running counter is needed)
+        entries["total"] = len(
+            entries.setdefault(
+                "values",
+                {},
+            )
         )
 
         # Return the builder
@@ -1413,29 +2341,29 @@ class PebbleDatabaseBuilder:
                 "total": 0,
             }
 
-        # Check if the passed value is a dictionary
-        if isinstance(
+        # Get the 'entries' dictionary and its 'values' dictionary once
+        entries: dict[str, Any] = self._configuration["data"]["entries"]
+        existing: dict[Union[int, str], Any] = entries["values"]
+
+        # Check if the passed value is a list
+        # (a dictionary is merged as is, i.e. its keys and entries are kept)
+        if not isinstance(
             values,
             dict,
         ):
-            # Convert the passed value into a list
-            values = list(values)
+            # Key the passed entries by their index, continuing after the existing entries
+            values = dict(
+                enumerate(
+                    values,
+                    start=len(existing),
+                )
+            )
 
-        # Iterate over the values
-        for (
-            index,
-            value,
-        ) in enumerate(
-            iterable=values,
-            start=len(self._configuration["data"]["entries"]["values"]),
-        ):
-            # Update the 'entries' key in the configuration with the passed value
-            self._configuration["data"]["entries"]["values"][index] = value
+        # Merge the passed entries into the existing entries with a single update
+        existing.update(values)
 
         # Update the 'total' keyword with the total number of entries
-        self._configuration["data"]["entries"]["total"] = len(
-            self._configuration["data"]["entries"]["values"]
-        )
+        entries["total"] = len(existing)
 
         # Return the builder
         return self
@@ -1456,8 +2384,9 @@ class PebbleDatabaseBuilder:
 
         # Check if the passed identifier string value is None
         if value is None:
-            # Initialize a new UUID and store it in the value
-            value = uuid.uuid4().hex
+            # Initialize a new random 128-bit hex string and store it in the value
+            # (read straight from os.urandom, i.e. without constructing a UUID object)
+            value = secrets.token_hex(16)
 
         # Update the configuration with the passed value
         self._configuration["identifier"] = value
@@ -1575,6 +2504,167 @@ class PebbleDatabaseLoader:
     A class that loads a PebbleDatabase instance from a file.
     """
 
+    @classmethod
+    def _intern_columns(
+        cls,
+        values: dict[str, Any],
+    ) -> None:
+        """
+        Intern the column names and the identifiers of the passed deserialized entries in place.
+
+        The snapshot and every journal record are deserialized separately, so the entries
+        carry their own copies of the same column names. Interning them lets all entries
+        share a single string object per column name (entries built by PebbleDatabase
+        already use literal, i.e. interned, column names).
+
+        Args:
+            values (dict[str, Any]): The deserialized entries keyed by storage key.
+
+        Returns:
+            None
+        """
+
+        # Bind the intern function once (i.e. outside of the loop)
+        intern = sys.intern
+
+        # Iterate over the deserialized entries
+        for (
+            key,
+            entry,
+        ) in values.items():
+            # Check if the current entry is not a dictionary
+            if type(entry) is not dict:
+                # Skip the current entry
+                continue
+
+            # Replace the current entry with a copy keyed by the interned column names
+            # (replacing the value of an existing key does not resize the dictionary being iterated)
+            entry = values[key] = {
+                (intern(column) if type(column) is str else column): value
+                for (
+                    column,
+                    value,
+                ) in entry.items()
+            }
+
+            # Check if the current entry has a string identifier
+            if type(entry.get("identifier")) is str:
+                # Intern the identifier (i.e. it becomes a key of the identifier index)
+                entry["identifier"] = intern(entry["identifier"])
+
+    @classmethod
+    def _parse_datetime(
+        cls,
+        value: Any,
+    ) -> Any:
+        """
+        Return the passed ISO 8601 string converted to a datetime.
+
+        Datetimes are written as ISO 8601 strings, which the orjson deserializer returns as is.
+
+        Args:
+            value (Any): The deserialized value.
+
+        Returns:
+            Any: The converted datetime or the passed value if it is not a string.
+        """
+
+        # Check if the passed value is not a string
+        if not isinstance(
+            value,
+            str,
+        ):
+            # Return the passed value (e.g. None or an already converted datetime)
+            return value
+
+        # Return the passed string converted to a datetime
+        return datetime.fromisoformat(value)
+
+    @classmethod
+    def _replay_journal(
+        cls,
+        data: dict[str, Any],
+        journal: Path,
+    ) -> int:
+        """
+        Apply the records of the passed journal file to the passed snapshot dictionary in order.
+
+        A partial last record (i.e. an append that was interrupted) is skipped and truncated.
+
+        Args:
+            data (dict[str, Any]): The deserialized snapshot of the database file.
+            journal (Path): The path to the journal file.
+
+        Returns:
+            int: The number of replayed records.
+        """
+
+        # Check if the journal file does not exist
+        if not journal.exists():
+            # Return 0 as there are no records to replay
+            return 0
+
+        # Get or initialize the entries dictionary of the snapshot
+        values: dict[str, Any] = data.setdefault(
+            "entries",
+            {},
+        ).setdefault(
+            "values",
+            {},
+        )
+
+        # Initialize the number of replayed records to 0
+        records: int = 0
+
+        # Read the journal file
+        # (the file is read synchronously as bytes, as a single local read has no I/O to overlap)
+        content: bytes = journal.read_bytes()
+
+        # Split the complete records from the bytes after the last newline
+        # (i.e. a record whose append was interrupted before its newline was written)
+        (
+            complete,
+            _,
+            partial,
+        ) = content.rpartition(b"\n")
+
+        # Check if the journal file ends with a partial record
+        if partial:
+            # Truncate the partial record (i.e. the next record is appended on a line of its own)
+            with journal.open("r+b") as file:
+                file.truncate(len(content) - len(partial))
+
+        # Iterate over the complete lines of the journal file
+        for line in complete.split(b"\n"):
+            # Check if the current line is empty
+            if not line:
+                # Skip the empty line
+                continue
+
+            # Deserialize the current record
+            record: dict[str, Any] = _deserialize_line(value=line)
+
+            # Iterate over the removed storage keys of the current record
+            for key in record.get("delete", []):
+                # Remove the entry associated with the current key
+                values.pop(
+                    key,
+                    None,
+                )
+
+            # Add or replace the changed entries of the current record
+            values.update(record.get("upsert", {}))
+
+            # Replace the metadata and the updated at datetime with the ones of the current record
+            data["metadata"] = record.get("metadata", data.get("metadata", {}))
+            data["updated_at"] = record.get("updated_at", data.get("updated_at", None))
+
+            # Increment the number of replayed records
+            records += 1
+
+        # Return the number of replayed records
+        return records
+
     @classmethod
     def load(
         cls,
@@ -1595,20 +2685,45 @@ class PebbleDatabaseLoader:
             # Raise a FileNotFoundError exception if the path does not exist
             raise FileNotFoundError(path)
 
-        data: dict[str, Any] = DataConversionUtils.deserialize(
-            value=run_async(
-                function=read_file_if_not_exists,
-                path=path,
-            ),
+        # Read and deserialize the database file
+        # (the file is read synchronously as bytes, as a single local read has no I/O to overlap)
+        data: dict[str, Any] = _deserialize(value=path.read_bytes())
+
+        # Replay the journal file of the database file onto the snapshot
+        records: int = cls._replay_journal(
+            data=data,
+            journal=path.with_suffix(".journal"),
         )
 
-        # Return a new PebbleDatabase instance
-        return PebbleDatabase(
-            created_at=data.get("created_at", None),
-            data={"entries": data.get("entries", {})},
+        # Get the deserialized entries dictionary once
+        entries: dict[str, Any] = data.get("entries", {})
+
+        # Get the deserialized entries keyed by storage key
+        values: dict[str, Any] = entries.get("values", {})
+
+        # Intern the column names of the deserialized entries
+        cls._intern_columns(values=values)
+
+        # Create a new PebbleDatabase instance
+        # (the schema dictionaries are rebuilt from literal, i.e. interned, keys, so the
+        # hot lookups of 'entries', 'total' and 'values' take the identity fast path)
+        database: PebbleDatabase = PebbleDatabase(
+            created_at=cls._parse_datetime(value=data.get("created_at", None)),
+            data={
+                "entries": {
+                    "total": entries.get("total", 0),
+                    "values": values,
+                },
+            },
             identifier=data.get("identifier", None),
             metadata=data.get("metadata", {}),
             name=data.get("name", ""),
             path=data.get("path", None),
-            updated_at=data.get("updated_at", None),
+            updated_at=cls._parse_datetime(value=data.get("updated_at", None)),
         )
+
+        # Store the number of records in the journal file (i.e. the instance is in sync with its file)
+        database._journal_size = records
+
+        # Return the new PebbleDatabase instance
+        return database
@@ -3,12 +3,28 @@ Author: Louis Goodnews
 Date: 2025-09-13
 """
 
-import json
-
-from typing import Any, Callable, Final, Iterator, Literal, Optional, Self, Type
-from uuid import UUID
+import uuid
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from types import UnionType
+from typing import (
+    get_args,
+    get_origin,
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    Literal,
+    NoReturn,
+    Optional,
+    Self,
+    Type,
+    Union,
+)
 
-from core.constants import (
+from .constants import (
     BOOLEAN,
     CUSTOM,
     DATE,
@@ -30,11 +46,10 @@ from core.constants import (
     TUPLE,
     UUID,
 )
-
-from utils.utils import analyze_typing
+from .utils import _deserialize
 
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
     "PebbleField",
     "PebbleBooleanField",
     "PebbleCustomField",
@@ -57,12 +72,289 @@ __all__: Final[list[str]] = [
     "PebbleUUIDField",
     "PebbleFieldFactory",
     "PebbleFieldBuilder",
-]
+)
 
 from datautils import DataIdentificationUtils
 
 
-class PebbleField:
+# The flag of classes that can be subclassed (i.e. CPython's Py_TPFLAGS_BASETYPE)
+_TPFLAGS_BASETYPE: Final[int] = 1 << 10
+
+
+def _is_final_type(field_type: Any) -> bool:
+    """
+    Check if the passed type cannot be subclassed (e.g. bool or NoneType).
+
+    For such types an exact type comparison is equivalent to an isinstance check.
+
+    Args:
+        field_type (Any): The resolved type to check.
+
+    Returns:
+        bool: True if the passed type cannot be subclassed, False otherwise.
+    """
+
+    # Return True if the passed type is a class without the base type flag otherwise False
+    return isinstance(
+        field_type,
+        type,
+    ) and not (field_type.__flags__ & _TPFLAGS_BASETYPE)
+
+
+def _make_type_check(field_type: Any) -> Callable[[Any], bool]:
+    """
+    Return a callable checking values against the passed resolved type.
+
+    The exact type comparison short-circuits the isinstance check for the common case,
+    and replaces it entirely for types that cannot be subclassed.
+
+    Args:
+        field_type (Any): The resolved type or tuple of types to check against.
+
+    Returns:
+        Callable[[Any], bool]: A callable returning True if the passed value matches the type.
+    """
+
+    # Check if the passed type admits any value
+    if field_type is object:
+        # Return a check that accepts every value
+        return lambda value: True
+
+    # Check if the passed type cannot be subclassed
+    if _is_final_type(field_type=field_type):
+        # Return a check that compares the exact type only
+        return lambda value: type(value) is field_type
+
+    # Check if the passed type is a tuple of types (e.g. a resolved Optional[str])
+    if isinstance(
+        field_type,
+        tuple,
+    ):
+        # Get the classes contained in the tuple of types (i.e. for a single set lookup)
+        exact: frozenset[type] = frozenset(
+            type_ for type_ in field_type if isinstance(type_, type)
+        )
+
+        # Return a check that looks up the exact type before falling back to isinstance
+        return lambda value: type(value) in exact or isinstance(value, field_type)
+
+    # Return a check that compares the exact type before falling back to isinstance
+    return lambda value: type(value) is field_type or isinstance(value, field_type)
+
+
+def _raise_type(
+    name: str,
+    expected: Any,
+    value: Any,
+) -> NoReturn:
+    """
+    Raise a TypeError over the passed field and value.
+
+    The message is only formatted here (i.e. on the failure path), which keeps the
+    validation in the generated __init__ methods and set_checked to a single branch.
+
+    Args:
+        name (str): The name of the field.
+        expected (Any): The resolved type of the field.
+        value (Any): The value that does not match the resolved type.
+
+    Returns:
+        NoReturn
+
+    Raises:
+        TypeError: Always.
+    """
+
+    # Raise a TypeError over the actual type not matching the annotated one
+    raise TypeError(f"Field '{name}' expected {expected}, got '{value}' ({type(value)}) instead")
+
+
+def _raise_unexpected(
+    name: str,
+    fields: frozenset[str],
+    kwargs: dict[str, Any],
+) -> NoReturn:
+    """
+    Raise a TypeError over the first passed keyword argument that is not a field.
+
+    The message is only formatted here (i.e. on the failure path), which keeps the
+    check in the generated __init__ methods to a single set comparison.
+
+    Args:
+        name (str): The qualified name of the field class.
+        fields (frozenset[str]): The names of the fields of the field class.
+        kwargs (dict[str, Any]): The passed keyword arguments.
+
+    Returns:
+        NoReturn
+
+    Raises:
+        TypeError: Always.
+    """
+
+    # Get the first passed keyword argument that is not a field (i.e. in the passed order)
+    unexpected: str = next(key for key in kwargs if key not in fields)
+
+    # Raise a TypeError over the unexpected keyword argument (i.e. as Python does for a misspelled one)
+    raise TypeError(f"{name}.__init__() got an unexpected keyword argument '{unexpected}'")
+
+
+def _resolve_field_type(field_type: Any) -> Any:
+    """
+    Resolve the passed annotation into a type or a tuple of types accepted by isinstance.
+
+    Args:
+        field_type (Any): The annotation to resolve (e.g. str, Optional[str] or Any).
+
+    Returns:
+        Any: The resolved type or tuple of types (i.e. object if the annotation admits any value).
+    """
+
+    # Check if the passed annotation admits any value
+    if field_type is Any:
+        # Return object, as every value is an instance of it
+        return object
+
+    # Check if the passed annotation is None (i.e. the annotation of a value that is always None)
+    if field_type is None:
+        # Return the type of None
+        return type(None)
+
+    # Get the origin of the passed annotation (e.g. Union for Optional[str])
+    origin: Any = get_origin(field_type)
+
+    # Check if the passed annotation is a plain type
+    if origin is None:
+        # Return the passed annotation
+        return field_type
+
+    # Check if the passed annotation is a union (i.e. Union, Optional or the | operator)
+    if origin is Union or origin is UnionType:
+        # Resolve the arguments of the union
+        resolved: tuple[Any, ...] = tuple(
+            _resolve_field_type(field_type=argument)
+            for argument in get_args(field_type)
+        )
+
+        # Return object if any of the arguments admits any value otherwise the resolved arguments
+        return object if object in resolved else resolved
+
+    # Check if the passed annotation is a literal
+    if origin is Literal:
+        # Return the distinct types of the literal values (i.e. in their declared order)
+        return tuple(dict.fromkeys(type(argument) for argument in get_args(field_type)))
+
+    # Return the origin of the passed annotation (e.g. list for list[str])
+    return origin
+
+
+class PebbleFieldMeta(type):
+    """
+    A metaclass for all Pebble fields.
+
+    Derives the __slots__ of a field class from its public annotations and moves the
+    class-level default values into the __field_defaults__ dictionary, as they
+    would otherwise conflict with the slot descriptors of the same name.
+    Private annotations (e.g. _field_type) remain class-level constants.
+    """
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[Type[Any], ...],
+        namespace: dict[str, Any],
+        **kwargs,
+    ) -> "PebbleFieldMeta":
+        """
+        Create the field class.
+
+        Args:
+            bases (tuple[Type[Any], ...]): The base classes of the field class.
+            name (str): The name of the field class.
+            namespace (dict[str, Any]): The namespace of the field class.
+            **kwargs: The keyword arguments to pass to the parent metaclass.
+
+        Returns:
+            PebbleFieldMeta: The field class.
+        """
+
+        # Get the annotations declared in the class body
+        annotations: dict[str, Any] = namespace.get(
+            "__annotations__",
+            {},
+        )
+
+        # Initialize the field names and defaults
+        field_names: dict[str, None] = {}
+        field_defaults: dict[str, Any] = {}
+
+        # Iterate over the base classes in reverse order (i.e. the first base wins)
+        for base in reversed(bases):
+            # Inherit the field names of the current base class
+            field_names.update(
+                dict.fromkeys(
+                    getattr(
+                        base,
+                        "__field_names__",
+                        (),
+                    )
+                )
+            )
+
+            # Inherit the field defaults of the current base class
+            field_defaults.update(
+                getattr(
+                    base,
+                    "__field_defaults__",
+                    {},
+                )
+            )
+
+        # Initialize the slots declared by this class (i.e. the fields no base class has a slot for)
+        slots: list[str] = []
+
+        # Iterate over the fields in the annotations
+        for field in annotations:
+            # Check if the current field is a private field (i.e. a class-level constant)
+            if field.startswith("_"):
+                # Skip the current field
+                continue
+
+            # Check if no base class has a slot for the current field
+            if field not in field_names:
+                # Add the current field to the slots of this class
+                slots.append(field)
+
+                # Add the current field to the field names
+                field_names[field] = None
+
+        # Iterate over the field names (i.e. including the inherited ones)
+        for field in field_names:
+            # Check if the current field has a class-level default value (i.e. even without an annotation)
+            if field in namespace:
+                # Move the default value out of the namespace
+                field_defaults[field] = namespace.pop(field)
+
+        # Store the field names in the namespace
+        namespace["__field_names__"] = tuple(field_names)
+
+        # Store the field defaults in the namespace
+        namespace["__field_defaults__"] = field_defaults
+
+        # Store the slots in the namespace
+        namespace["__slots__"] = tuple(slots)
+
+        # Create the field class
+        return super().__new__(
+            mcs,
+            name,
+            bases,
+            namespace,
+            **kwargs,
+        )
+
+
+class PebbleField(metaclass=PebbleFieldMeta):
     """
     A base class for all Pebble fields.
     """
@@ -78,6 +370,8 @@ class PebbleField:
         """
         Initialize the instance.
 
+        Subclasses receive a generated __init__ method in __init_subclass__.
+
         Args:
             **kwargs: The keyword arguments to initialize the instance with.
 
@@ -85,57 +379,8 @@ class PebbleField:
             None
         """
 
-        # Initialize the fields dictionary
-        fields: dict[str, Any] = self.__field_definitions__ | kwargs
-
-        # Iterate over the field field type pairs in the annotations
-        for (
-            key,
-            value,
-        ) in fields.items():
-            # Check if the current field is contained in the keyword arguments
-            if key in kwargs:
-                # Get the value corresponding to the current field
-                value = kwargs.get(key, MISSING)
-
-                # Get the field type corresponding to the current field
-                field_type: Type[Any] = value.__class__
-            else:
-                # Get the default value corresponding to the current field
-                value = self.__field_definitions__.get(key, MISSING)
-
-                # Get the field type corresponding to the current field
-                field_type: Type[Any] = value[0]
-
-                # Get the value corresponding to the current field
-                value = value[1]
-
-                # Analyze the field type in order to process typing-Module annotations
-                field_type = analyze_typing(typing=field_type)
-
-                print(field_type)
-
-            # Check if the current field is missing (i.e. the generic missing value)
-            if value is MISSING:
-                # Raise a ValueError over the missing field
-                raise ValueError(f"Missing required field: {key}")
-
-            # Check if the current field's type corresponds to the current field type
-            if not isinstance(
-                value,
-                field_type,
-            ):
-                # Raise a TypeError if the actual type does not match the annotated one
-                raise TypeError(
-                    f"Field '{key}' expected {field_type}, got '{value}' ({type(value)}) instead",
-                )
-
-            # Set the current key value pair as attributes of this instance
-            setattr(
-                self,
-                f"_{key}",
-                value,
-            )
+        # Do nothing
+        pass
 
     def __init_subclass__(cls) -> None:
         """
@@ -148,178 +393,214 @@ class PebbleField:
             None
         """
 
-        def make_property(
-            field: str,
-            field_type: Type[Any],
-            default: Any,
-        ) -> property:
-            """
-            Make a property.
+        # Call the parent class' __init_subclass__ method
+        super().__init_subclass__()
 
-            Args:
-                default (Any): The default value of the field.
-                field (str): The field to make a property for.
-                field_type (Type): The type of the field.
+        # Initialize the annotations and default values collected from the class hierarchy
+        annotations: dict[str, Any] = {}
+        defaults: dict[str, Any] = {}
 
-            Returns:
-                property: The property.
-            """
+        # Iterate over the classes in the method resolution order in reverse (i.e. the subclass wins)
+        for cls_ in reversed(cls.__mro__):
+            # Get the namespace of the current class (i.e. without walking the MRO through getattr)
+            namespace: Any = cls_.__dict__
+
+            # Add the annotations declared in the body of the current class
+            annotations.update(
+                namespace.get(
+                    "__annotations__",
+                    {},
+                )
+            )
 
-            # Analyze the field type in order to process typing-Module annotations
-            expected_type: Type = analyze_typing(typing=field_type)
+            # Add the default values of the private fields declared in the body of the current class
+            # (the default values of the public fields have been moved out of the namespace by the metaclass)
+            defaults.update(
+                {
+                    field: namespace[field]
+                    for field in annotations
+                    if field.startswith("_") and field in namespace
+                }
+            )
 
-            def deleter(
-                self,
-                key: str = field,
-                default: Optional[Any] = default,
-            ) -> None:
-                """
-                Delete the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to delete. Defaults to field.
-
-                Returns:
-                    None
-                """
-
-                # Check if the default value is not None and not MISSING
-                if default is not None and default is not MISSING:
-                    # Set the default value
-                    setattr(
-                        self,
-                        f"_{key}",
-                        default,
-                    )
+        # Add the default values of the public fields collected by the metaclass
+        defaults.update(cls.__field_defaults__)
 
-                    # Return
-                    return
+        # Store the field definitions (i.e. the public fields) as field type default value pairs
+        cls.__field_definitions__: dict[str, tuple[Type[Any], Any]] = {
+            field: (
+                field_type,
+                defaults.get(
+                    field,
+                    MISSING,
+                ),
+            )
+            for (
+                field,
+                field_type,
+            ) in annotations.items()
+            if not field.startswith("_")
+        }
 
-                # Delete the value associated with the passed key (i.e. the field)
-                del self.__dict__[f"_{key}"]
+        # Store the meta definitions (i.e. the private fields) as field type default value pairs
+        cls.__meta_definitions__: dict[str, tuple[Type[Any], Any]] = {
+            field: (
+                field_type,
+                defaults.get(
+                    field,
+                    MISSING,
+                ),
+            )
+            for (
+                field,
+                field_type,
+            ) in annotations.items()
+            if field.startswith("_")
+        }
 
-            def getter(
-                self,
-                key: str = field,
-                default=default,
-            ) -> Any:
-                """
-                Return the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
-
-                Returns:
-                    Any: The value associated with the passed key.
-                """
-
-                # Return the value associated with the passed key (i.e. the field)
-                return self.__dict__.get(
-                    f"_{key}",
+        # Cache the flat field spec (i.e. the name, resolved type and default value of each field)
+        # (the annotations are resolved once at class creation rather than per instance)
+        cls.__field_spec__: tuple[tuple[str, Any, Any], ...] = tuple(
+            (
+                field,
+                _resolve_field_type(field_type=field_type),
+                default,
+            )
+            for (
+                field,
+                (
+                    field_type,
                     default,
-                )
+                ),
+            ) in cls.__field_definitions__.items()
+        )
 
-            def setter(
-                self,
-                value: Any,
-                key: str = field,
-                type_: Type = expected_type,
-            ) -> None:
-                """
-                Set the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
-                type_ (Type, optional): The type of the value to set. Defaults to field_type.
-                value (Any): The value to set.
-
-                Returns:
-                    None
-                """
-
-                # Check if the values's type corresponds to the passed expected type
-                if not isinstance(
-                    value,
-                    type_,
-                ):
-                    # Raise a TypeError if the actual type does not match the annotated one
-                    raise TypeError(
-                        f"Field {key} expected {type_}, got '{value}' ({type(value)}) instead",
-                    )
+        # Cache the resolved field types (i.e. used by set_checked)
+        cls.__field_types__: dict[str, Any] = {
+            field: field_type for (field, field_type, _) in cls.__field_spec__
+        }
 
-                # Set the current key value pair as attributes of this instance
-                setattr(
-                    self,
-                    f"_{key}",
-                    value,
-                )
+        # Cache the type checks of the fields (i.e. used by set_checked)
+        cls.__field_checks__: dict[str, Callable[[Any], bool]] = {
+            field: _make_type_check(field_type=field_type)
+            for (field, field_type, _) in cls.__field_spec__
+        }
 
-            # Return the getter and setter as a property
-            return property(
-                fdel=deleter,
-                fget=getter,
-                fset=setter,
-            )
+        # Initialize the local variables of the generated __init__ method
+        # (i.e. the builtins it calls, so they need not be looked up in the builtins module)
+        local_vars: dict[str, Any] = {
+            "_field_names": frozenset(cls.__field_types__),
+            "_name": cls.__qualname__,
+            "_raise_type": _raise_type,
+            "_raise_unexpected": _raise_unexpected,
+            "isinstance": isinstance,
+            "KeyError": KeyError,
+            "type": type,
+            "ValueError": ValueError,
+        }
 
-        # Call the parent class' __init_subclass__ method
-        super().__init_subclass__()
+        # Initialize the source lines of the generated __init__ method's body
+        # with the lines that reject keyword arguments that are not fields (e.g. a misspelled field)
+        lines: list[str] = [
+            "    if not _field_names.issuperset(kwargs):",
+            "        _raise_unexpected(_name, _field_names, kwargs)",
+        ]
+
+        # Iterate over the cached field spec
+        for (
+            index,
+            (
+                field,
+                field_type,
+                default,
+            ),
+        ) in enumerate(cls.__field_spec__):
+            # Bind the resolved field type as a local variable
+            local_vars[f"_type_{index}"] = field_type
+
+            # Check if the current field is a required field (i.e. has no default value)
+            if default is MISSING:
+                # Add the lines that fetch the required field or raise a ValueError
+                lines.extend(
+                    [
+                        "    try:",
+                        f"        value = kwargs[{field!r}]",
+                        "    except KeyError:",
+                        f"        raise ValueError('Missing required field: {field}') from None",
+                    ]
+                )
+            else:
+                # Bind the default value as a local variable
+                local_vars[f"_default_{index}"] = default
 
-        # Initialize the field definitions dictionary
-        cls.__field_definitions__: dict[str, tuple[Type[Any], Any]] = {}
+                # Add the line that fetches the optional field or its default value
+                lines.append(f"    value = kwargs.get({field!r}, _default_{index})")
 
-        # Initialize the meta definitions dictionary
-        cls.__meta_definitions__: dict[str, tuple[Type[Any], Any]] = {}
+            # Initialize the condition under which the current field is invalid
+            condition: Optional[str] = None
 
-        # Iterate over the Parent classes
-        for cls_ in reversed(cls.__mro__):
-            # Check, if the current class has no annotations
-            if not hasattr(
-                cls_,
-                "__annotations__",
-            ):
-                # Skip the current iteration
-                continue
+            # Check if the current field type cannot be subclassed (i.e. the exact type comparison suffices)
+            if _is_final_type(field_type=field_type):
+                # Compare the exact type only
+                condition = f"type(value) is not _type_{index}"
 
-            # Iterate over the field field type pairs in the annotations
-            for (
-                field,
+            # Check if the current field type is a tuple of types (e.g. a resolved Optional[str])
+            elif isinstance(
                 field_type,
-            ) in cls_.__annotations__.items():
+                tuple,
+            ):
+                # Bind the classes contained in the tuple of types as a local variable
+                local_vars[f"_exact_{index}"] = frozenset(
+                    type_ for type_ in field_type if isinstance(type_, type)
+                )
 
-                # Get the default value of the field
-                default: Any = getattr(
-                    cls,
-                    field,
-                    MISSING,
+                # Look up the exact type before falling back to isinstance
+                condition = f"type(value) not in _exact_{index} and not isinstance(value, _type_{index})"
+
+            # Check if the current field type does not admit any value (i.e. otherwise the check is omitted)
+            elif field_type is not object:
+                # Compare the exact type before falling back to isinstance
+                condition = f"type(value) is not _type_{index} and not isinstance(value, _type_{index})"
+
+            # Check if the current field needs to be validated
+            if condition is not None:
+                # Add the lines that validate the current field
+                lines.extend(
+                    [
+                        f"    if {condition}:",
+                        f"        _raise_type({field!r}, _type_{index}, value)",
+                    ]
                 )
 
-                # Check if the current field is a private field
-                if field.startswith("_"):
-                    # Assuming the current field is meta field
-                    cls.__meta_definitions__[field] = (
-                        field_type,
-                        default,
-                    )
+            # Add the line that stores the current field in its slot
+            lines.append(f"    self.{field} = value")
 
-                    # Skip the current field
-                    continue
+        # Wrap the generated __init__ method in a factory function,
+        # turning the local variables into closure variables of the generated method
+        source: str = "\n".join(
+            [f"def __create_init__({', '.join(local_vars)}):"]
+            + ["    def __init__(self, **kwargs):"]
+            + [f"    {line}" for line in lines]
+            + ["    return __init__"]
+        )
 
-                # Add the field and its type to the field definitions dictionary
-                cls.__field_definitions__[field] = (
-                    field_type,
-                    default,
-                )
+        # Initialize the namespace the factory function is executed in
+        namespace: dict[str, Any] = {}
 
-                # Append the property to the subclass
-                setattr(
-                    cls,
-                    field,
-                    make_property(
-                        default=default,
-                        field=field,
-                        field_type=field_type,
-                    ),
-                )
+        # Compile the factory function
+        exec(
+            source,
+            namespace,
+        )
+
+        # Create the generated __init__ method by calling the factory function
+        init: Callable[..., None] = namespace["__create_init__"](**local_vars)
+
+        # Update the qualified name of the generated __init__ method
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+
+        # Append the generated __init__ method to the subclass
+        cls.__init__ = init
 
     def __getitem__(
         self,
@@ -327,18 +608,28 @@ class PebbleField:
     ) -> Any:
         """
         Return the value associated with the passed key.
-        Will raise a KeyError exception if the passed key does not exist in the dictionary representation of this object.
+        Will raise a KeyError exception if the passed key is not a field of this PebbleField.
 
         Args:
             key (str): The key to retrieve.
 
         Returns:
             Any: The value associated with the passed key.
+
+        Raises:
+            KeyError: If the passed key is not a field of this PebbleField.
         """
 
-        # Return the value associated with the passed key
-        # Will raise a KeyError exception if the passed key does not exist in the dictionary representation of this object
-        return self.__dict__[key]
+        # Check if the passed key is not a field of this PebbleField
+        if key not in self.__field_types__:
+            # Raise a KeyError exception if the passed key is not a field of this PebbleField
+            raise KeyError(key)
+
+        # Return the value stored in the slot associated with the passed key
+        return getattr(
+            self,
+            key,
+        )
 
     def __repr__(self) -> str:
         """
@@ -349,7 +640,7 @@ class PebbleField:
         """
 
         # Return a string representation of the PebbleField instance
-        return f"<{self.__class__.__name__}({', '.join(f'{key.lstrip("_")}={value}' for key, value in self.__dict__.items())})>"
+        return f"<{self.__class__.__name__}({', '.join(f'{key}={getattr(self, key)}' for key in self.__field_names__)})>"
 
     def __setitem__(
         self,
@@ -357,17 +648,31 @@ class PebbleField:
         value: Any,
     ) -> None:
         """
-        Update the dictionary representation of this object with the passed key value pair.
-        Will update the existing key with the passed value.
+        Update the field associated with the passed key with the passed value.
+        Will raise a KeyError exception if the passed key is not a field of this PebbleField.
 
         Args:
             key (str): The key to update.
             value (Any): The value to update.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the passed key is not a field of this PebbleField.
         """
 
-        # Update the dictionary representation of this object with the passed key value pair
-        # Will update the existing key with the passed value
-        self.__dict__[key] = value
+        # Check if the passed key is not a field of this PebbleField
+        if key not in self.__field_types__:
+            # Raise a KeyError exception if the passed key is not a field of this PebbleField
+            raise KeyError(key)
+
+        # Store the passed value in the slot associated with the passed key
+        setattr(
+            self,
+            key,
+            value,
+        )
 
     def __str__(self) -> str:
         """
@@ -386,64 +691,121 @@ class PebbleField:
         dictionary: dict[str, Any],
     ) -> "PebbleField":
         """
-        Return a dictionary representation of the PebbleField instance.
+        Return a new instance of this PebbleField subclass created from the passed dictionary.
 
         Args:
             dictionary (dict[str, Any]): The dictionary to convert to a PebbleField instance.
 
         Returns:
-            PebbleField: A dictionary representation of the PebbleField instance.
+            PebbleField: A new instance of this PebbleField subclass.
         """
 
-        # Return a dictionary representation of the PebbleField instance
-        return PebbleField(**dictionary)
+        # Return a new instance of this PebbleField subclass (i.e. through its generated __init__ method)
+        return cls(**dictionary)
 
     @classmethod
     def from_json(
         cls,
-        string: str,
+        string: Union[bytes, str],
     ) -> "PebbleField":
         """
-        Return a dictionary representation of the PebbleField instance.
+        Return a new instance of this PebbleField subclass created from the passed JSON.
 
         Args:
-            string (str): The string to convert to a PebbleField instance.
+            string (Union[bytes, str]): The JSON bytes or string to convert to a PebbleField instance.
 
         Returns:
-            PebbleField: A dictionary representation of the PebbleField instance.
+            PebbleField: A new instance of this PebbleField subclass.
         """
 
-        # Return a dictionary representation of the PebbleField instance
-        return PebbleField(**json.loads(string))
+        # Return a new instance of this PebbleField subclass (i.e. through its generated __init__ method)
+        # (the JSON is parsed by orjson if it is installed, so bytes need not be decoded first)
+        return cls(**_deserialize(value=string))
+
+    def set_checked(
+        self,
+        name: str,
+        value: Any,
+    ) -> None:
+        """
+        Set the field associated with the passed name to the passed value after validating its type.
+
+        Plain attribute assignment is not validated; this is the explicit, type checked alternative.
+
+        Args:
+            name (str): The name of the field to set.
+            value (Any): The value to set.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the passed name is not a field of this PebbleField.
+            TypeError: If the actual type does not match the annotated one.
+        """
+
+        # Check if the values's type does not correspond to the field type
+        # Will raise a KeyError exception if the passed name is not a field of this PebbleField
+        if not self.__field_checks__[name](value):
+            # Raise a TypeError if the actual type does not match the annotated one
+            _raise_type(
+                expected=self.__field_types__[name],
+                name=name,
+                value=value,
+            )
+
+        # Set the passed value as an attribute of this instance
+        setattr(
+            self,
+            name,
+            value,
+        )
 
     def to_dict(
         self,
-        exclude: Optional[list[str]] = None,
+        exclude: Optional[Union[frozenset[str], list[str]]] = None,
     ) -> dict[str, Any]:
         """
         Return a dictionary representation of the PebbleField instance.
 
         Args:
-            exclude (Optional[list[str]], optional): The keys to exclude from the dictionary representation. Defaults to None.
+            exclude (Optional[Union[frozenset[str], list[str]]], optional): The keys to exclude from the dictionary representation. Defaults to None.
 
         Returns:
             dict[str, Any]: A dictionary representation of the PebbleField instance.
         """
 
-        # Check if there are keys to exclude
-        if exclude is not None:
-            # Return the dictionary representation of this instance without the excluded keys
+        # Get the cached field names of this PebbleField subclass
+        names: tuple[str, ...] = self.__field_names__
+
+        # Check if there are no keys to exclude
+        if not exclude:
+            # Return the dictionary representation of this instance
             return {
-                key: value
-                for (
-                    key,
-                    value,
-                ) in self.__dict__.items()
-                if key not in exclude
+                name: getattr(
+                    self,
+                    name,
+                )
+                for name in names
             }
 
-        # Return a copy of the dictionary representation of this instance
-        return self.__dict__.copy()
+        # Check if the passed keys to exclude are not a frozenset already
+        if not isinstance(
+            exclude,
+            frozenset,
+        ):
+            # Convert the keys to exclude into a frozenset (i.e. constant time membership tests)
+            exclude = frozenset(exclude)
+
+        # Return the dictionary representation of this instance without the excluded keys
+        return {
+            name: getattr(
+                self,
+                name,
+            )
+            for name in names
+            if name not in exclude
+        }
 
     def validate(
         self,
@@ -519,137 +881,232 @@ class PebbleField:
 
 
 class PebbleBooleanField(PebbleField):
-    """ """
+    """
+    A Pebble field holding boolean values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["boolean"]] = BOOLEAN
 
+    # Define the default value as an optional boolean value (i.e. it is type checked on initialization)
+    default: Optional[bool] = None
+
 
 class PebbleCustomField(PebbleField):
-    """ """
+    """
+    A Pebble field holding custom values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["custom"]] = CUSTOM
 
+    # Define the default value as an optional custom value (i.e. it is type checked on initialization)
+    default: Optional[Any] = None
+
 
 class PebbleDateField(PebbleField):
-    """ """
+    """
+    A Pebble field holding date values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["date"]] = DATE
 
+    # Define the default value as an optional date value (i.e. it is type checked on initialization)
+    default: Optional[date] = None
+
 
 class PebbleDateTimeField(PebbleField):
-    """ """
+    """
+    A Pebble field holding datetime values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["datetime"]] = DATETIME
 
+    # Define the default value as an optional datetime value (i.e. it is type checked on initialization)
+    default: Optional[datetime] = None
+
 
 class PebbleDecimalField(PebbleField):
-    """ """
+    """
+    A Pebble field holding decimal values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["decimal"]] = DECIMAL
 
+    # Define the default value as an optional decimal value (i.e. it is type checked on initialization)
+    default: Optional[Decimal] = None
+
 
 class PebbleDictionaryField(PebbleField):
-    """ """
+    """
+    A Pebble field holding dictionary values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["dictionary"]] = DICTIONARY
 
+    # Define the default value as an optional dictionary value (i.e. it is type checked on initialization)
+    default: Optional[dict] = None
+
 
 class PebbleFloatField(PebbleField):
-    """ """
+    """
+    A Pebble field holding float values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["float"]] = FLOAT
 
+    # Define the default value as an optional float value (i.e. it is type checked on initialization)
+    default: Optional[float] = None
+
 
 class PebbleFrozendictField(PebbleField):
-    """ """
+    """
+    A Pebble field holding frozendict values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["frozendict"]] = FROZENDICT
 
+    # Define the default value as an optional frozendict value (i.e. it is type checked on initialization)
+    default: Optional[Any] = None
+
 
 class PebbleFrozensetField(PebbleField):
-    """ """
+    """
+    A Pebble field holding frozenset values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["frozenset"]] = FROZENSET
 
+    # Define the default value as an optional frozenset value (i.e. it is type checked on initialization)
+    default: Optional[frozenset] = None
+
 
 class PebbleIntegerField(PebbleField):
-    """ """
+    """
+    A Pebble field holding integer values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["integer"]] = INTEGER
 
+    # Define the default value as an optional integer value (i.e. it is type checked on initialization)
+    default: Optional[int] = None
+
 
 class PebbleListField(PebbleField):
-    """ """
+    """
+    A Pebble field holding list values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["list"]] = LIST
 
+    # Define the default value as an optional list value (i.e. it is type checked on initialization)
+    default: Optional[list] = None
+
 
 class PebbleNullField(PebbleField):
-    """ """
+    """
+    A Pebble field holding null values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["null"]] = NULL
 
+    # Define the default value as an optional null value (i.e. it is type checked on initialization)
+    default: None = None
+
 
 class PebblePathField(PebbleField):
-    """ """
+    """
+    A Pebble field holding path values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["path"]] = PATH
 
+    # Define the default value as an optional path value (i.e. it is type checked on initialization)
+    default: Optional[Path] = None
+
 
 class PebbleRegexField(PebbleField):
-    """ """
+    """
+    A Pebble field holding regex values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["regex"]] = REGEX
 
+    # Define the default value as an optional regex value (i.e. it is type checked on initialization)
+    default: Optional[Any] = None
+
 
 class PebbleSetField(PebbleField):
-    """ """
+    """
+    A Pebble field holding set values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["set"]] = SET
 
+    # Define the default value as an optional set value (i.e. it is type checked on initialization)
+    default: Optional[set] = None
+
 
 class PebbleStringField(PebbleField):
-    """ """
+    """
+    A Pebble field holding string values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["string"]] = STRING
 
+    # Define the default value as an optional string value (i.e. it is type checked on initialization)
+    default: Optional[str] = None
+
 
 class PebbleTimeField(PebbleField):
-    """ """
+    """
+    A Pebble field holding time values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["time"]] = TIME
 
+    # Define the default value as an optional time value (i.e. it is type checked on initialization)
+    default: Optional[time] = None
+
 
 class PebbleTupleField(PebbleField):
-    """ """
+    """
+    A Pebble field holding tuple values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["tuple"]] = TUPLE
 
+    # Define the default value as an optional tuple value (i.e. it is type checked on initialization)
+    default: Optional[tuple] = None
+
 
 class PebbleUUIDField(PebbleField):
-    """ """
+    """
+    A Pebble field holding uuid values.
+    """
 
     # Define the field type as a final literal (i.e. the field type cannot be changed)
     _field_type: Final[Literal["uuid"]] = UUID
 
+    # Define the default value as an optional uuid value (i.e. it is type checked on initialization)
+    default: Optional[uuid.UUID] = None
+
 
 class PebbleFieldFactory:
     """ """
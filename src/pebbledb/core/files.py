@@ -10,7 +10,8 @@ from pathlib import Path
 from typing import Final, Optional
 
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
+    "append_file",
     "create_file",
     "create_file_if_not_exists",
     "delete_file",
@@ -18,7 +19,7 @@ __all__: Final[list[str]] = [
     "read_file_if_not_exists",
     "write_file",
     "write_file_if_not_exists",
-]
+)
 
 
 # Initialize the asyncio.Lock object to None
@@ -45,6 +46,41 @@ def _lock() -> asyncio.Lock:
     return _LOCK
 
 
+async def append_file(
+    path: Path,
+    content: str,
+) -> bool:
+    """
+    Append to a file at the passed path.
+    Will create the file if it does not exist.
+
+    Args:
+        path (Path): The path to the file to append to.
+        content (str): The content to append to the file.
+
+    Returns:
+        bool: True if the content was appended, False otherwise.
+    """
+
+    # Acquire the lock
+    async with _lock():
+        try:
+            # Open the file
+            async with aiofiles.open(
+                path.as_posix(),
+                encoding="utf-8",
+                mode="a",
+            ) as file:
+                # Append the content to the file
+                await file.write(content)
+
+            # Return True if the content was appended
+            return True
+        except Exception:
+            # Return False if the content was not appended
+            return False
+
+
 async def create_file(
     path: Path,
 ) -> bool:
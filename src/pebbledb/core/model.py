@@ -3,83 +3,185 @@ Author: Louis Goodnews
 Date: 2025-09-13
 """
 
-from typing import Any, Optional, Type, TypeVar
+import sys
 
-from core.constants import MISSING
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Type, Union
 
+from .constants import MISSING
+from .fields import _raise_type, _raise_unexpected
 
-# Define a type variable
-T = TypeVar("T")
 
+@lru_cache(maxsize=256)
+def _retained_keys(
+    cls: Type[Any],
+    exclude: frozenset[str],
+) -> tuple[str, ...]:
+    """
+    Return the field names of the passed model class that are not excluded.
+
+    The result is cached per model class and keys to exclude, so repeated
+    calls with the same arguments do not test each field name again.
+
+    Args:
+        cls (Type[Any]): The model class to return the field names of.
+        exclude (frozenset[str]): The keys to exclude.
 
-class PebbleModel(T):
+    Returns:
+        tuple[str, ...]: The field names that are not excluded.
     """
-    A base class for all Pebble models.
+
+    # Return the field names of the passed model class that are not excluded
+    return tuple(key for key in cls.__field_names__ if key not in exclude)
+
+
+class PebbleModelMeta(type):
     """
+    A metaclass for all Pebble models.
 
-    def __init__(
-        self,
+    Derives the __slots__ of a model class from its annotations and moves the
+    class-level default values into the __field_defaults__ dictionary, as they
+    would otherwise conflict with the slot descriptors of the same name.
+    The slot descriptors are then collected in the __slot_map__ dictionary.
+    """
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[Type[Any], ...],
+        namespace: dict[str, Any],
         **kwargs,
-    ) -> None:
+    ) -> "PebbleModelMeta":
         """
-        Initialize the instance.
+        Create the model class.
 
         Args:
-            **kwargs: The keyword arguments to initialize the instance with.
+            bases (tuple[Type[Any], ...]): The base classes of the model class.
+            name (str): The name of the model class.
+            namespace (dict[str, Any]): The namespace of the model class.
+            **kwargs: The keyword arguments to pass to the parent metaclass.
 
         Returns:
-            None
+            PebbleModelMeta: The model class.
         """
 
+        # Get the annotations declared in the class body
+        annotations: dict[str, Any] = namespace.get(
+            "__annotations__",
+            {},
+        )
+
+        # Initialize the field types and defaults dictionaries
+        field_types: dict[str, Any] = {}
+        field_defaults: dict[str, Any] = {}
+
+        # Iterate over the base classes in reverse order (i.e. the first base wins)
+        for base in reversed(bases):
+            # Inherit the field types of the current base class
+            field_types.update(
+                getattr(
+                    base,
+                    "__field_types__",
+                    {},
+                )
+            )
+
+            # Inherit the field defaults of the current base class
+            field_defaults.update(
+                getattr(
+                    base,
+                    "__field_defaults__",
+                    {},
+                )
+            )
+
         # Iterate over the field field type pairs in the annotations
         for (
             field,
             field_type,
-        ) in self.__annotations__.items():
-            # Check if the current field is contained in the keyword arguments
-            if field in kwargs:
-                # Get the value corresponding to the current fied
-                value: Any = kwargs.get(
-                    field,
-                    getattr(
-                        self.__class__,
-                        field,
-                    ),
-                )
-            else:
-                # Get the value corresponding to the current fied
-                value: Any = getattr(
-                    self.__class__,
-                    field,
-                    MISSING,
-                )
+        ) in annotations.items():
+            # Intern the field name (i.e. dictionary lookups take the identity fast path)
+            field = sys.intern(field)
+
+            # Add the field and its type to the field types dictionary
+            field_types[field] = field_type
+
+            # Check if the current field has a class-level default value
+            if field in namespace:
+                # Move the default value out of the namespace
+                field_defaults[field] = namespace.pop(field)
+
+        # Store the field names in the namespace
+        namespace["__field_names__"] = tuple(field_types)
+
+        # Store the field types in the namespace
+        namespace["__field_types__"] = field_types
+
+        # Store the field defaults in the namespace
+        namespace["__field_defaults__"] = field_defaults
+
+        # Precompute the template of the string representation (e.g. '<Model(field={}, ...)>')
+        namespace["__repr_template__"] = (
+            f"<{name}({', '.join(f'{field}={{}}' for field in field_types)})>"
+        )
+
+        # Derive the slots from the annotations declared in the class body
+        namespace["__slots__"] = tuple(annotations)
+
+        # Create the model class
+        cls: PebbleModelMeta = super().__new__(
+            mcs,
+            name,
+            bases,
+            namespace,
+            **kwargs,
+        )
+
+        # Map the field names to their slot descriptors (i.e. including the inherited ones)
+        cls.__slot_map__ = {
+            field: getattr(
+                cls,
+                field,
+            )
+            for field in field_types
+        }
 
-            # Check if the current field is missing (i.e. the generic missing value)
-            if value is MISSING:
-                # Raise a ValueError over the missing field
-                raise ValueError(f"Missing required field: {field}")
+        # Return the model class
+        return cls
 
-            # Check if the current field's type corresponds to the current field type
-            if not isinstance(
-                value,
-                field_type,
-            ):
-                # Raise a TypeError if the actual type does not match the annotated one
-                raise TypeError(
-                    f"Field {field} expected {field_type}, got {type(value)}"
-                )
 
-            # Set the current key value pair as attributes of this instance
-            setattr(
-                self,
-                field,
-                value,
-            )
+class PebbleModel(metaclass=PebbleModelMeta):
+    """
+    A base class for all Pebble models.
+    """
+
+    def __init__(
+        self,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the instance.
+
+        Subclasses receive a generated __init__ method in __init_subclass__.
+
+        Args:
+            **kwargs: The keyword arguments to initialize the instance with.
+
+        Returns:
+            None
+        """
+
+        # Do nothing
+        pass
 
     def __init_subclass__(cls) -> None:
         """
         Initialize the subclass.
 
+        Generates an __init__ and a __from_record__ method specialized to the fields
+        of the subclass, with each field's lookup, validation and assignment inlined
+        as straight-line code (i.e. without looping over the fields at runtime).
+
         Args:
             cls (Type): The subclass to initialize.
 
@@ -90,77 +192,129 @@ class PebbleModel(T):
         # Call the parent class' __init_subclass__ method
         super().__init_subclass__()
 
-        # Iterate over the field field type pairs in the annotations
+        # Initialize the local variables of the generated __init__ method
+        # (i.e. the builtins it calls, so they need not be looked up in the builtins module)
+        local_vars: dict[str, Any] = {
+            "_field_names": frozenset(cls.__field_types__),
+            "_name": cls.__qualname__,
+            "_raise_type": _raise_type,
+            "_raise_unexpected": _raise_unexpected,
+            "isinstance": isinstance,
+            "KeyError": KeyError,
+            "type": type,
+            "ValueError": ValueError,
+        }
+
+        # Initialize the source lines of the body shared by the generated methods
+        # with the lines that reject keyword arguments that are not fields (e.g. a misspelled field)
+        lines: list[str] = [
+            "    if not _field_names.issuperset(kwargs):",
+            "        _raise_unexpected(_name, _field_names, kwargs)",
+        ]
+
+        # Iterate over the field field type pairs in the field types
         for (
-            field,
-            field_type,
-        ) in cls.__annotations__.items():
-
-            def getter(
-                self,
-                key: str = field,
-            ) -> Any:
-                """
-                Return the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
+            index,
+            (
+                field,
+                field_type,
+            ),
+        ) in enumerate(cls.__field_types__.items()):
+            # Bind the field type as a local variable
+            local_vars[f"_type_{index}"] = field_type
+
+            # Bind the __set__ method of the field's slot descriptor as a local variable
+            # (i.e. the already validated value bypasses the validating __setattr__ method)
+            local_vars[f"_set_{index}"] = getattr(
+                cls,
+                field,
+            ).__set__
+
+            # Check if the current field is a required field (i.e. has no default value)
+            if field not in cls.__field_defaults__:
+                # Add the lines that fetch the required field or raise a ValueError
+                lines.extend(
+                    [
+                        "    try:",
+                        f"        value = kwargs[{field!r}]",
+                        "    except KeyError:",
+                        f"        raise ValueError('Missing required field: {field}') from None",
+                    ]
+                )
+            else:
+                # Bind the default value as a local variable
+                local_vars[f"_default_{index}"] = cls.__field_defaults__[field]
+
+                # Add the line that fetches the optional field or its default value
+                lines.append(f"    value = kwargs.get({field!r}, _default_{index})")
+
+            # Check if the current field type admits any value (i.e. the check can be omitted)
+            if field_type is not object:
+                # Add the lines that validate the current field
+                lines.extend(
+                    [
+                        f"    if type(value) is not _type_{index} and not isinstance(value, _type_{index}):",
+                        f"        _raise_type({field!r}, _type_{index}, value)",
+                    ]
+                )
 
-                Returns:
-                    Any: The value associated with the passed key.
+            # Add the line that assigns the current field
+            lines.append(f"    _set_{index}(self, value)")
+
+        # Wrap the generated __init__ and __from_record__ methods in a factory function,
+        # turning the local variables into closure variables of the generated methods
+        # (__from_record__ receives the record itself, so no keyword arguments are unpacked)
+        source: str = "\n".join(
+            [f"def __create_methods__({', '.join(local_vars)}):"]
+            + ["    def __init__(self, **kwargs):"]
+            + [f"    {line}" for line in lines]
+            + ["    def __from_record__(self, kwargs):"]
+            + [f"    {line}" for line in lines]
+            + ["    return __init__, __from_record__"]
+        )
+
+        # Initialize the namespace the factory function is executed in
+        namespace: dict[str, Any] = {}
+
+        # Compile the factory function
+        exec(
+            source,
+            namespace,
+        )
+
+        # Create the generated methods by calling the factory function
+        (
+            init,
+            from_record,
+        ) = namespace["__create_methods__"](**local_vars)
+
+        # Update the qualified names of the generated methods
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+        from_record.__qualname__ = f"{cls.__qualname__}.__from_record__"
+
+        # Append the generated methods to the subclass
+        cls.__init__ = init
+        cls.__from_record__ = from_record
+
+    def __from_record__(
+        self,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Initialize the instance from the passed record.
 
-                Raises:
-                    KeyError: If the passed key does not exist in the dictionary representation of this object.
-                """
+        Subclasses receive a generated __from_record__ method in __init_subclass__,
+        sharing its body with the generated __init__ method.
 
-                # Return the value associated with the passed key (i.e. the field)
-                return self.__dict__[key]
+        Args:
+            kwargs (dict[str, Any]): The record to initialize the instance with.
 
-            def setter(
-                self,
-                value: Any,
-                key: str = field,
-                type_: Type = field_type,
-            ) -> None:
-                """
-                Set the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
-                    type_ (Type, optional): The type of the value to set. Defaults to field_type.
-                    value (Any): The value to set.
-
-                Returns:
-                    None
-
-                Raises:
-                    TypeError: If the actual type does not match the annotated one.
-                """
-
-                # Check if the values's type corresponds to the passed expected type
-                if not isinstance(
-                    value,
-                    type_,
-                ):
-                    # Raise a TypeError if the actual type does not match the annotated one
-                    raise TypeError(f"Field {key} expected {type_}, got {type(value)}")
-
-                # Set the current key value pair as attributes of this instance
-                setattr(
-                    self,
-                    key,
-                    value,
-                )
+        Returns:
+            None
+        """
 
-            # Append the property to the subclass
-            setattr(
-                cls,
-                field,
-                property(
-                    getter,
-                    setter,
-                ),
-            )
+        # Do nothing
+        pass
 
     def __getitem__(
         self,
@@ -168,7 +322,7 @@ class PebbleModel(T):
     ) -> Any:
         """
         Return the value associated with the passed key.
-        Will raise a KeyError exception if the passed key does not exist in the dictionary representation of this object.
+        Will raise a KeyError exception if the passed key is not a field of this model.
 
         Args:
             key (str): The key to retrieve.
@@ -177,12 +331,12 @@ class PebbleModel(T):
             Any: The value associated with the passed key.
 
         Raises:
-            KeyError: If the passed key does not exist in the dictionary representation of this object.
+            KeyError: If the passed key is not a field of this model.
         """
 
-        # Return the value associated with the passed key
-        # Will raise a KeyError exception if the passed key does not exist in the dictionary representation of this object
-        return self.__dict__[key]
+        # Return the value associated with the passed key by reading its slot descriptor directly
+        # Will raise a KeyError exception if the passed key is not a field of this model
+        return self.__slot_map__[key].__get__(self)
 
     def __repr__(self) -> str:
         """
@@ -192,8 +346,66 @@ class PebbleModel(T):
             str: A string representation of the PebbleModel instance.
         """
 
-        # Return a string representation of the PebbleModel instance
-        return f"<{self.__class__.__name__}({', '.join(f'{key}={value}' for key, value in self.__dict__.items())})>"
+        # Return a string representation of the PebbleModel instance by filling in the precomputed template
+        return self.__repr_template__.format(
+            *[
+                getattr(
+                    self,
+                    key,
+                )
+                for key in self.__field_names__
+            ]
+        )
+
+    def __setattr__(
+        self,
+        key: str,
+        value: Any,
+    ) -> None:
+        """
+        Set the attribute associated with the passed key to the passed value.
+        Will validate the type of the passed value if the passed key is a field of this model.
+
+        Args:
+            key (str): The key to set.
+            value (Any): The value to set.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If the actual type does not match the annotated one.
+        """
+
+        # Get the field type associated with the passed key
+        field_type: Any = self.__field_types__.get(
+            key,
+            MISSING,
+        )
+
+        # Check if the passed key is a field and the values's type does not correspond to its type
+        # (the exact type comparison short-circuits the isinstance check for the common case)
+        if (
+            field_type is not MISSING
+            and type(value) is not field_type
+            and not isinstance(
+                value,
+                field_type,
+            )
+        ):
+            # Raise a TypeError if the actual type does not match the annotated one
+            _raise_type(
+                expected=field_type,
+                name=key,
+                value=value,
+            )
+
+        # Store the value in the slot associated with the passed key
+        object.__setattr__(
+            self,
+            key,
+            value,
+        )
 
     def __setitem__(
         self,
@@ -201,8 +413,8 @@ class PebbleModel(T):
         value: Any,
     ) -> None:
         """
-        Update the dictionary representation of this object with the passed key value pair.
-        Will update the existing key with the passed value.
+        Update the field associated with the passed key with the passed value.
+        Will raise a KeyError exception if the passed key is not a field of this model.
 
         Args:
             key (str): The key to update.
@@ -210,11 +422,37 @@ class PebbleModel(T):
 
         Returns:
             None
+
+        Raises:
+            KeyError: If the passed key is not a field of this model.
+            TypeError: If the actual type does not match the annotated one.
         """
 
-        # Update the dictionary representation of this object with the passed key value pair
-        # Will update the existing key with the passed value
-        self.__dict__[key] = value
+        # Get the slot descriptor associated with the passed key
+        # Will raise a KeyError exception if the passed key is not a field of this model
+        descriptor: Any = self.__slot_map__[key]
+
+        # Get the field type associated with the passed key
+        field_type: Any = self.__field_types__[key]
+
+        # Check if the values's type does not correspond to the field type
+        # (the exact type comparison short-circuits the isinstance check for the common case)
+        if type(value) is not field_type and not isinstance(
+            value,
+            field_type,
+        ):
+            # Raise a TypeError if the actual type does not match the annotated one
+            _raise_type(
+                expected=field_type,
+                name=key,
+                value=value,
+            )
+
+        # Update the field associated with the passed key by writing its slot descriptor directly
+        descriptor.__set__(
+            self,
+            value,
+        )
 
     def __str__(self) -> str:
         """
@@ -227,31 +465,97 @@ class PebbleModel(T):
         # Return a string representation of the PebbleModel instance
         return self.__repr__()
 
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict[str, Any]],
+    ) -> list["PebbleModel"]:
+        """
+        Create a list of PebbleModel instances from the passed records.
+
+        The class-level lookups are hoisted out of the loop and each record is passed
+        to the generated __from_record__ method as is (i.e. without unpacking it).
+
+        Args:
+            records (Iterable[dict[str, Any]]): The records to create the instances from.
+
+        Returns:
+            list[PebbleModel]: The created PebbleModel instances.
+
+        Raises:
+            TypeError: If the actual type of a field does not match the annotated one.
+            ValueError: If a required field is missing from a record.
+        """
+
+        # Look up the constructor and the initializer of the class once
+        new: Any = cls.__new__
+        from_record: Any = cls.__from_record__
+
+        # Initialize the result list
+        result: list[PebbleModel] = []
+
+        # Look up the append method of the result list once
+        append: Any = result.append
+
+        # Iterate over the passed records
+        for record in records:
+            # Create an uninitialized instance of the class
+            instance: PebbleModel = new(cls)
+
+            # Initialize the instance from the current record
+            from_record(
+                instance,
+                record,
+            )
+
+            # Append the instance to the result list
+            append(instance)
+
+        # Return the result list
+        return result
+
     def to_dict(
         self,
-        exclude: Optional[list[str]] = None,
+        exclude: Optional[Union[frozenset[str], list[str]]] = None,
     ) -> dict[str, Any]:
         """
         Return a dictionary representation of the PebbleModel instance.
 
         Args:
-            exclude (Optional[list[str]], optional): The keys to exclude from the dictionary representation. Defaults to None.
+            exclude (Optional[Union[frozenset[str], list[str]]], optional): The keys to exclude from the dictionary representation. Defaults to None.
 
         Returns:
             dict[str, Any]: A dictionary representation of the PebbleModel instance.
         """
 
-        # Check if there are keys to exclude
-        if exclude is not None:
-            # Return the dictionary representation of this instance without the excluded keys
+        # Check if there are no keys to exclude
+        if not exclude:
+            # Return the dictionary representation of this instance
             return {
-                key: value
-                for (
+                key: getattr(
+                    self,
                     key,
-                    value,
-                ) in self.__dict__.items()
-                if key not in exclude
+                )
+                for key in self.__field_names__
             }
 
-        # Return a copy of the dictionary representation of this instance
-        return self.__dict__.copy()
+        # Check if the passed keys to exclude are not a frozenset already
+        if not isinstance(
+            exclude,
+            frozenset,
+        ):
+            # Convert the keys to exclude into a frozenset (i.e. a hashable cache key)
+            exclude = frozenset(exclude)
+
+        # Return the dictionary representation of this instance without the excluded keys
+        # (the retained keys are computed once per model class and keys to exclude)
+        return {
+            key: getattr(
+                self,
+                key,
+            )
+            for key in _retained_keys(
+                type(self),
+                exclude,
+            )
+        }
@@ -3,20 +3,131 @@ Author: Louis Goodnews
 Date: 2025-09-20
 """
 
-from typing import Any, Final, TypeVar
+import sys
 
-from core.constants import MISSING
+from typing import Any, Final, Type
 
+from .constants import MISSING
+from .fields import _raise_type
 
-__all__: Final[list[str]] = ["PebbleObject"]
 
+__all__: Final[tuple[str, ...]] = ("PebbleObject",)
 
-T = TypeVar("T")
+
+class PebbleObjectAttribute:
+    """
+    A descriptor representing a typed attribute of a PebbleObject subclass.
+
+    A single instance is created per field, replacing the getter and setter
+    closures and the property object that were created per field before.
+    """
+
+    __slots__ = (
+        "_name",
+        "_type_",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        type_: Type[Any],
+    ) -> None:
+        """
+        Initialize the instance.
+
+        Args:
+            name (str): The name of the attribute (i.e. the field).
+            type_ (Type[Any]): The type of the attribute.
+
+        Returns:
+            None
+        """
+
+        # Store the passed name in an instance variable
+        self._name: Final[str] = name
+
+        # Store the passed type in an instance variable
+        self._type_: Final[Type[Any]] = type_
+
+    def __get__(
+        self,
+        instance: Any,
+        owner: Type[Any],
+    ) -> Any:
+        """
+        Return the value of the attribute stored in the passed instance.
+
+        Args:
+            instance (Any): The instance to retrieve the value from.
+            owner (Type[Any]): The class of the passed instance.
+
+        Returns:
+            Any: The value of the attribute or the descriptor itself if accessed on the class.
+
+        Raises:
+            AttributeError: If the attribute has not been set on the passed instance.
+        """
+
+        # Check if the attribute is accessed on the class
+        if instance is None:
+            # Return the descriptor itself
+            return self
+
+        try:
+            # Return the value stored in the instance's dictionary
+            return instance.__dict__[self._name]
+        except KeyError:
+            # Raise an AttributeError if the attribute has not been set
+            raise AttributeError(self._name) from None
+
+    def __set__(
+        self,
+        instance: Any,
+        value: Any,
+    ) -> None:
+        """
+        Set the value of the attribute stored in the passed instance.
+
+        Args:
+            instance (Any): The instance to store the value in.
+            value (Any): The value to set.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If the actual type does not match the annotated one.
+        """
+
+        # Check if the values's type corresponds to the expected type
+        # (the exact type comparison short-circuits the isinstance check for the common case)
+        if type(value) is not self._type_ and not isinstance(
+            value,
+            self._type_,
+        ):
+            # Raise a TypeError if the actual type does not match the annotated one
+            _raise_type(
+                expected=self._type_,
+                name=self._name,
+                value=value,
+            )
+
+        # Store the value in the instance's dictionary
+        instance.__dict__[self._name] = value
 
 
 class PebbleObject:
     """ """
 
+    # The field names of the object (cached per subclass)
+    __field_names__: tuple[str, ...] = ()
+
+    # The field field type pairs of the object (cached per subclass)
+    __field_items__: tuple[tuple[str, Type[Any]], ...] = ()
+
+    # The field defaults of the object (cached per subclass)
+    __field_defaults__: dict[str, Any] = {}
+
     def __init__(
         self,
         **kwargs,
@@ -31,25 +142,27 @@ class PebbleObject:
             None
         """
 
-        # Iterate over the field field type pairs in the annotations
+        # Get the field defaults of this class once (i.e. outside of the loop)
+        field_defaults: dict[str, Any] = self.__field_defaults__
+
+        # Get the dictionary of this instance once (i.e. outside of the loop)
+        instance_dict: dict[str, Any] = self.__dict__
+
+        # Iterate over the field field type pairs of this class
         for (
             field,
             field_type,
-        ) in self.__annotations__.items():
-            # Check if the current field is contained in the keyword arguments
-            if field in kwargs:
-                # Get the value corresponding to the current fied
-                value: Any = kwargs.get(
-                    field,
-                    getattr(
-                        self.__class__,
-                        field,
-                    ),
-                )
-            else:
-                # Get the value corresponding to the current fied
-                value: Any = getattr(
-                    self.__class__,
+        ) in self.__field_items__:
+            # Get the value corresponding to the current field
+            value: Any = kwargs.get(
+                field,
+                MISSING,
+            )
+
+            # Check if the current field has not been passed
+            if value is MISSING:
+                # Get the default value corresponding to the current field
+                value = field_defaults.get(
                     field,
                     MISSING,
                 )
@@ -60,19 +173,21 @@ class PebbleObject:
                 raise ValueError(f"Missing required field: {field}")
 
             # Check if the current field's type corresponds to the current field type
-            if not isinstance(
+            # (the exact type comparison short-circuits the isinstance check for the common case)
+            if type(value) is not field_type and not isinstance(
                 value,
                 field_type,
             ):
                 # Raise a TypeError if the actual type does not match the annotated one
-                raise TypeError(f"Field {field} expected {field_type}, got {type(value)}")
+                _raise_type(
+                    expected=field_type,
+                    name=field,
+                    value=value,
+                )
 
-            # Set the current key value pair as attributes of this instance
-            setattr(
-                self,
-                field,
-                value,
-            )
+            # Store the already validated value in the instance's dictionary
+            # (i.e. bypassing the validating descriptor's __set__ method)
+            instance_dict[field] = value
 
     def __init_subclass__(cls) -> None:
         """
@@ -88,69 +203,40 @@ class PebbleObject:
         # Call the parent class' __init_subclass__ method
         super().__init_subclass__()
 
-        # Iterate over the field field type pairs in the annotations
+        # Cache the interned field names of the subclass
+        # (i.e. instance dictionary lookups take the identity fast path)
+        cls.__field_names__: tuple[str, ...] = tuple(
+            sys.intern(field) for field in cls.__annotations__
+        )
+
+        # Cache the field field type pairs of the subclass (i.e. a flat tuple instead of a dictionary view)
+        cls.__field_items__: tuple[tuple[str, Type[Any]], ...] = tuple(
+            zip(
+                cls.__field_names__,
+                cls.__annotations__.values(),
+            )
+        )
+
+        # Cache the field defaults declared in the subclass body (i.e. before the descriptors replace them)
+        # (the class dictionary is read directly, so no MRO walk or descriptor lookup takes place)
+        cls.__field_defaults__: dict[str, Any] = {
+            field: cls.__dict__[field]
+            for field in cls.__field_names__
+            if field in cls.__dict__
+        }
+
+        # Iterate over the cached field field type pairs
         for (
             field,
             field_type,
-        ) in cls.__annotations__.items():
-
-            def getter(
-                self,
-                key: str = field,
-            ) -> Any:
-                """
-                Return the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
-
-                Returns:
-                    Any: The value associated with the passed key.
-                """
-
-                # Return the value associated with the passed key (i.e. the field)
-                return self.__dict__[key]
-
-            def setter(
-                self,
-                value: Any,
-                key: str = field,
-                type_: Type = field_type,
-            ) -> None:
-                """
-                Set the value associated with the passed key (i.e. the field).
-
-                Args:
-                    key (str, optional): The key to retrieve. Defaults to field.
-                    type_ (Type, optional): The type of the value to set. Defaults to field_type.
-                    value (Any): The value to set.
-
-                Returns:
-                    None
-                """
-
-                # Check if the values's type corresponds to the passed expected type
-                if not isinstance(
-                    value,
-                    type_,
-                ):
-                    # Raise a TypeError if the actual type does not match the annotated one
-                    raise TypeError(f"Field {key} expected {type_}, got {type(value)}")
-
-                # Set the current key value pair as attributes of this instance
-                setattr(
-                    self,
-                    key,
-                    value,
-                )
-
-            # Append the property to the subclass
+        ) in cls.__field_items__:
+            # Append the typed attribute descriptor to the subclass
             setattr(
                 cls,
                 field,
-                property(
-                    getter,
-                    setter,
+                PebbleObjectAttribute(
+                    name=field,
+                    type_=field_type,
                 ),
             )
 
@@ -10,21 +10,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Final, Iterable, Iterator, Optional, Self, Union
 
-from core.constants import CWD, PEBBLE_COMMIT_SERVICE
-from core.files import read_file_if_not_exists
-
-from utils.utils import run_async
+from . import constants
+from .constants import CWD
 
 from datautils import DataConversionUtils
 from logger import Logger
 
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
     "PebbleTable",
     "PebbleTableFactory",
     "PebbleTableBuilder",
     "PebbleTableLoader",
-]
+)
 
 
 class PebbleTable:
@@ -538,7 +536,8 @@ class PebbleTable:
         """
 
         # Attempt to commit the table to a file
-        PEBBLE_COMMIT_SERVICE.commit(database_or_table=self.to_dict())
+        # (the PebbleCommitService instance is created on first access)
+        constants.PEBBLE_COMMIT_SERVICE.commit(database_or_table=self.to_dict())
 
     def empty(self) -> bool:
         """
@@ -551,6 +550,55 @@ class PebbleTable:
         # Return True if the PebbleTable instance is empty otherwise False
         return self.total == 0
 
+    @classmethod
+    def from_dict(
+        cls,
+        value: dict[str, Any],
+        database: str = "",
+    ) -> "PebbleTable":
+        """
+        Create a new PebbleTable instance from the passed dictionary with a single constructor call.
+
+        Unlike the PebbleTableBuilder, the stored path is taken as is (i.e. it already
+        contains the file name), so no configuration dictionary or fluent calls are involved.
+        Without a stored path, the path defaults to '<name>.json' in the current working
+        directory (i.e. as the PebbleTableBuilder derives it).
+
+        Args:
+            value (dict[str, Any]): The dictionary (e.g. a database entry) to create the PebbleTable instance from.
+            database (str, optional): The database string to be stored in the PebbleTable instance. Defaults to "".
+
+        Returns:
+            PebbleTable: The newly created PebbleTable instance.
+        """
+
+        # Get the stored path once
+        path: Optional[Union[Path, str]] = value.get("path")
+
+        # Check if no path has been stored
+        if path is None:
+            # Derive the path of the table file from its name in the current working directory
+            path = CWD / f"{value.get('name')}.json"
+
+        # Return the newly created PebbleTable instance to the caller
+        return cls(
+            created_at=value.get("created_at"),
+            data=value.get("data")
+            or {
+                "entries": {
+                    "total": 0,
+                    "values": {},
+                },
+            },
+            database=database,
+            definition=value.get("definition"),
+            identifier=value.get("identifier") or uuid.uuid4().hex,
+            metadata=value.get("metadata"),
+            name=value.get("name"),
+            path=Path(path),
+            updated_at=value.get("updated_at"),
+        )
+
     def get(
         self,
         identifier: str,
@@ -667,8 +715,11 @@ class PebbleTable:
                 "values": {},
             }
 
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
+        # Check if no timestamp has been passed
+        # (an identity test, instead of re-annotating the parameter with an 'or' fallback)
+        if timestamp is None:
+            # Get the current timestamp
+            timestamp = datetime.now()
 
         # Get the identifier that the passed entry shuld be associated with
         identifier: str = str(self.total)
@@ -707,25 +758,45 @@ class PebbleTable:
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the result to an empty list
-        result: list[int] = []
+        # Format the current timestamp once (i.e. it is shared by all inserted entries)
+        added_at: str = timestamp.isoformat()
+
+        # Get the number of existing entries and the 'values' dictionary once
+        # (the total property ensures the 'entries' dictionary exists)
+        base: int = self.total
+        values: dict[str, Any] = self._data["entries"]["values"]
+
+        # Get the identifiers of the passed entries (i.e. continuing after the existing entries, as insert does)
+        identifiers: range = range(
+            base,
+            base + len(entries),
+        )
 
         # Iterate over the passed entries
         for entry in entries:
-            # Insert the current entry into the data dictionary instance variable
-            result.append(
-                self.insert(
-                    entry=entry,
-                    is_bulk_operation=True,
-                    timestamp=timestamp,
-                )
+            # Set the '_added_at' date of the current entry to the shared timestamp
+            entry["_added_at"] = added_at
+
+        # Add the passed entries keyed by their identifiers with a single update
+        # (the keys and entries are paired in C, instead of one insert call per entry)
+        values.update(
+            zip(
+                map(
+                    str,
+                    identifiers,
+                ),
+                entries,
             )
+        )
+
+        # Update the total count of the data dictionary instance variable once
+        self._data["entries"]["total"] = len(values)
 
         # Update the updated at datetime of the PebbleTable instance with the passed value
         self.updated_at = timestamp
 
-        # Return the result list to the caller
-        return result
+        # Return the identifiers of the inserted entries to the caller
+        return list(identifiers)
 
     def items(self) -> ItemsView[Any]:
         """
@@ -767,9 +838,6 @@ class PebbleTable:
             bool: True if the value associated with the identifier was removed successfully otherwise False.
         """
 
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
-
         # Set the result to True if the value associated with the identifier was removed successfully otherwise False
         result: bool = bool(
             self._data["entries"]["values"].pop(
@@ -783,8 +851,9 @@ class PebbleTable:
 
         # Check if the operation is not a bulk operation
         if not is_bulk_operation:
-            # Update the updated at datetime of the PebbleTable instance with the passed value
-            self.updated_at = timestamp
+            # Update the updated at datetime of the PebbleTable instance with the passed value or now
+            # (the clock is only read here, so bulk operations that skip this branch never read it)
+            self.updated_at = timestamp or datetime.now()
 
         # Return the result to the caller
         return result
@@ -801,45 +870,29 @@ class PebbleTable:
 
         Returns:
             bool: True if the values associated with the identifiers were removed successfully otherwise False.
-
-        Raises:
-            ValueError: If the removal of any of the values associated with the passed identifiers failed.
         """
 
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the total result to an empty list
-        total_result: list[Any] = []
-
-        # Initialize the errors list to an empty list
-        errors: list[str] = []
+        # Initialize the result to True (i.e. AND-ed with every removal instead of collected in a list)
+        result: bool = True
 
         # Iterate over the passed idenfifiers
         for identifier in identifiers:
-            # Attempt to remove the current identifier
-            result: bool = self.remove(
-                identifier=identifier,
-                is_bulk_operation=True,
-                timestamp=timestamp,
-            )
-
-            # Check if the removal was unsuccessfull
-            if not result:
-                errors.append(result)
-
-            # Append the result to the total result list
-            total_result.append(result)
-
-        # Check if the errors list contains any False booleans
-        if errors and not all(errors):
-            # Raise a ValueError exception
-            ValueError(
-                f"Failed to remove keys '{', '.join(errors)}' from the data dictionary. Please review your code for any mistakes before trying again."
+            # Attempt to remove the current identifier and update the result
+            # (the removal is evaluated first, so it is not short-circuited after a failure)
+            result = (
+                self.remove(
+                    identifier=identifier,
+                    is_bulk_operation=True,
+                    timestamp=timestamp,
+                )
+                and result
             )
 
-        # Return the result list to the caller
-        return all(total_result)
+        # Return True if all passed identifiers were removed successfully otherwise False
+        return result
 
     def set_metadata(
         self,
@@ -920,16 +973,14 @@ class PebbleTable:
             # Raise a KeyError exception if the passed identifier was not found in the data dictionary instance variable
             raise KeyError(identifier)
 
-        # Get the current timestamp if the passed timestamp is None
-        timestamp: datetime = timestamp or datetime.now()
-
         # Update the value associated with the passed identifier with the passed entry
         self._data["entries"]["values"][identifier].update(entry)
 
         # Check if the operation is not a bulk operation
         if not is_bulk_operation:
-            # Update the updated at datetime of the PebbleTable instance with the passed value
-            self.updated_at = timestamp
+            # Update the updated at datetime of the PebbleTable instance with the passed value or now
+            # (the clock is only read here, so bulk operations that skip this branch never read it)
+            self.updated_at = timestamp or datetime.now()
 
         # Return True to the caller to indicate sucess
         return True
@@ -948,46 +999,43 @@ class PebbleTable:
 
         Returns:
             bool: True if the values associated with the identifiers were updated successfully otherwise False.
+
+        Raises:
+            KeyError: If any of the passed identifiers does not exist.
         """
 
         # Get the current timestamp
         timestamp: datetime = datetime.now()
 
-        # Initialize the result to an empty list
-        result: list[Any] = []
+        # Get the values dictionary of the entries once (i.e. outside of the merge)
+        values: dict[str, dict[str, Any]] = self._data["entries"]["values"]
 
-        # Initialize the errors list to an empty list
-        errors: list[KeyError] = []
+        # Get the passed identifiers that are not contained within the values dictionary
+        # (a single set difference in C instead of a per-row try/except)
+        missing: set[str] = set(identifiers).difference(values)
 
-        # Iterate over the passed entries and idenfifiers
+        # Check if any of the passed identifiers is missing
+        if missing:
+            # Raise a single KeyError exception with all missing identifiers (i.e. in the passed order)
+            # (no row is updated, so a failed bulk update leaves the table unchanged)
+            raise KeyError(*(identifier for identifier in identifiers if identifier in missing))
+
+        # Iterate over the passed identifiers and entries
         for (
-            entry,
             identifier,
-        ) in zip(entries, identifiers):
-            try:
-                # Attempt to append the result of updating the value associated with the current identifier with the current value
-                result.append(
-                    self.update(
-                        entry=entry,
-                        identifier=identifier,
-                        is_bulk_operation=True,
-                        timestamp=timestamp,
-                    )
-                )
-            except KeyError as e:
-                # Append the excepted KeyError exception to the errors list
-                errors.append(e)
-
-        # Check if the errors list is not empty
-        if errors:
-            # Raise a sinlge KeyError exception with all missing keys
-            raise KeyError(*errors)
+            entry,
+        ) in zip(
+            identifiers,
+            entries,
+        ):
+            # Merge the current entry into the row associated with the current identifier
+            values[identifier].update(entry)
 
         # Update the updated at datetime of the PebbleTable instance with the passed value
         self.updated_at = timestamp
 
-        # Return True if all operations in the result list were successfull
-        return all(result)
+        # Return True to the caller to indicate success
+        return True
 
     def values(self) -> ValuesView[Any]:
         """
@@ -1263,6 +1311,20 @@ class PebbleTableBuilder:
         # Attempt to create and return the PebbleTable instance
         return PebbleTableFactory.create(**self._configuration)
 
+    def reset(self) -> Self:
+        """
+        Reset the configuration dictionary instance variable, so the builder can be reused.
+
+        Returns:
+            Self: The builder.
+        """
+
+        # Clear the configuration dictionary instance variable
+        self._configuration.clear()
+
+        # Return the builder
+        return self
+
     def with_created_at(
         self,
         value: Optional[datetime] = None,
@@ -1400,29 +1462,29 @@ class PebbleTableBuilder:
                 "total": 0,
             }
 
-        # Check if the passed value is a dictionary
-        if isinstance(
+        # Get the 'entries' dictionary and its 'values' dictionary once
+        entries: dict[str, Any] = self._configuration["data"]["entries"]
+        existing: dict[Union[int, str], Any] = entries["values"]
+
+        # Check if the passed value is a list
+        # (a dictionary is merged as is, i.e. its keys and entries are kept)
+        if not isinstance(
             values,
             dict,
         ):
-            # Convert the passed value into a list
-            values = list(values)
+            # Key the passed entries by their index, continuing after the existing entries
+            values = dict(
+                enumerate(
+                    values,
+                    start=len(existing),
+                )
+            )
 
-        # Iterate over the values
-        for (
-            index,
-            value,
-        ) in enumerate(
-            iterable=values,
-            start=len(self._configuration["data"]["entries"]["values"]),
-        ):
-            # Update the 'entries' key in the configuration with the passed value
-            self._configuration["data"]["entries"]["values"][index] = value
+        # Merge the passed entries into the existing entries with a single update
+        existing.update(values)
 
         # Update the 'total' keyword with the total number of entries
-        self._configuration["data"]["entries"]["total"] = len(
-            self._configuration["data"]["entries"]["values"]
-        )
+        entries["total"] = len(existing)
 
         # Return the builder
         return self
@@ -1603,10 +1665,8 @@ class PebbleTableLoader:
             raise FileNotFoundError(path)
 
         # Read the file's content
-        content: str = run_async(
-            function=read_file_if_not_exists,
-            path=path,
-        )
+        # (the file is read synchronously, as a single local read has no I/O to overlap)
+        content: str = path.read_text(encoding="utf-8")
 
         # Deserialize the file content
         data: dict[str, Any] = DataConversionUtils.deserialize(value=content)
@@ -3,17 +3,189 @@ Author: Louis Goodnews
 Date: 2025-09-13
 """
 
+import json
+
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Final, Optional
+from typing import Any, Final, Optional, Union
+
+try:
+    # Import the fast JSON serializer (i.e. the optional orjson package)
+    import orjson as _orjson
+except ImportError:
+    # Fall back to the serializer of the datautils package
+    _orjson = None
 
-from core.files import read_file_if_not_exists, write_file_if_not_exists
+from .files import append_file, read_file_if_not_exists, write_file_if_not_exists
 
-from utils.utils import merge_dicts, run_async
+from ..utils.utils import merge_dicts, run_async
 
 from datautils import DataConversionUtils
 from logger import Logger
 
-__all__: Final[list[str]] = []
+__all__: Final[tuple[str, ...]] = ()
+
+
+def _serialize(value: dict[str, Any]) -> str:
+    """
+    Serialize the passed database or table dictionary to a JSON string.
+
+    If the orjson package is installed, the dictionary is serialized with orjson,
+    which serializes dictionaries, lists, strings, numbers and datetimes natively.
+    Other values (e.g. Path objects) are serialized as strings. Otherwise the
+    DataConversionUtils serializer is used.
+
+    Args:
+        value (dict[str, Any]): The database or table dictionary to serialize.
+
+    Returns:
+        str: The JSON string.
+    """
+
+    # Check if the orjson serializer is available
+    if _orjson is not None:
+        # Serialize the passed dictionary to bytes with orjson and decode them
+        # (i.e. the orjson call and its options are only spelled out in _serialize_bytes)
+        return _serialize_bytes(value=value).decode("utf-8")
+
+    # Serialize the passed dictionary with the DataConversionUtils serializer
+    return DataConversionUtils.serialize(value=value)
+
+
+def _deserialize(value: Union[bytes, str]) -> Any:
+    """
+    Deserialize the passed JSON bytes or string.
+
+    If the orjson package is installed, the value is deserialized with orjson
+    (i.e. bytes read from a file are parsed without decoding them first).
+    Otherwise the DataConversionUtils deserializer is used.
+
+    Args:
+        value (Union[bytes, str]): The JSON bytes or string to deserialize.
+
+    Returns:
+        Any: The deserialized value.
+    """
+
+    # Check if the orjson deserializer is available
+    if _orjson is not None:
+        # Deserialize the passed value with orjson
+        return _orjson.loads(value)
+
+    # Check if the passed value is a bytes object
+    if isinstance(
+        value,
+        bytes,
+    ):
+        # Decode the passed value as the DataConversionUtils deserializer expects a string
+        value = value.decode("utf-8")
+
+    # Deserialize the passed value with the DataConversionUtils deserializer
+    return DataConversionUtils.deserialize(value=value)
+
+
+def _json_default(value: Any) -> str:
+    """
+    Return the passed value that the json module cannot serialize as a string.
+
+    Datetimes are serialized as ISO 8601 strings (i.e. as orjson serializes them),
+    other values (e.g. Path objects) as their string representation.
+
+    Args:
+        value (Any): The value to serialize.
+
+    Returns:
+        str: The string representation of the passed value.
+    """
+
+    # Check if the passed value is a datetime
+    if isinstance(
+        value,
+        datetime,
+    ):
+        # Return the ISO 8601 string of the passed datetime
+        return value.isoformat()
+
+    # Return the string representation of the passed value
+    return str(value)
+
+
+def _serialize_line(value: dict[str, Any]) -> str:
+    """
+    Serialize the passed journal record to a compact, single-line JSON string.
+
+    The json module escapes every control character inside strings and the compact
+    separators add no whitespace, so the record never contains a newline (i.e. one
+    record per line, whichever serializer is installed).
+
+    Args:
+        value (dict[str, Any]): The journal record to serialize.
+
+    Returns:
+        str: The single-line JSON string.
+    """
+
+    # Serialize the passed record without any whitespace between its tokens
+    return json.dumps(
+        value,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(
+            ",",
+            ":",
+        ),
+    )
+
+
+def _deserialize_line(value: Union[bytes, str]) -> Any:
+    """
+    Deserialize the passed journal line.
+
+    The line is parsed with orjson if it is installed, otherwise with the json module
+    (i.e. the counterpart of _serialize_line).
+
+    Args:
+        value (Union[bytes, str]): The journal line to deserialize.
+
+    Returns:
+        Any: The deserialized journal record.
+    """
+
+    # Check if the orjson deserializer is available
+    if _orjson is not None:
+        # Deserialize the passed line with orjson
+        return _orjson.loads(value)
+
+    # Deserialize the passed line with the json module
+    return json.loads(value)
+
+
+def _serialize_bytes(value: dict[str, Any]) -> bytes:
+    """
+    Serialize the passed database or table dictionary to UTF-8 encoded JSON bytes.
+
+    If the orjson package is installed, orjson produces the bytes directly (i.e. the
+    document is not decoded to a string only to be encoded again when it is written).
+    Otherwise the DataConversionUtils serializer is used and its string is encoded.
+
+    Args:
+        value (dict[str, Any]): The database or table dictionary to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON bytes.
+    """
+
+    # Check if the orjson serializer is available
+    if _orjson is not None:
+        # Serialize the passed dictionary with orjson (i.e. non-string keys such as integers are allowed)
+        return _orjson.dumps(
+            value,
+            default=str,
+            option=_orjson.OPT_NON_STR_KEYS,
+        )
+
+    # Serialize the passed dictionary with the DataConversionUtils serializer and encode it
+    return DataConversionUtils.serialize(value=value).encode("utf-8")
 
 
 class PebbleCommitError(Exception):
@@ -53,46 +225,84 @@ class PebbleCommitService:
         # Initialize this instance's Logger object
         self._logger: Final[Logger] = Logger.get_logger(name=self.__class__.__name__)
 
+    def append(
+        self,
+        path: Path,
+        record: dict[str, Any],
+    ) -> None:
+        """
+        Append the passed record as a single line to the journal file at the passed path.
+
+        Args:
+            path (Path): The path to the journal file.
+            record (dict[str, Any]): The record to append.
+
+        Returns:
+            None
+
+        Raises:
+            PebbleCommitError: If the record could not be appended.
+        """
+
+        # Attempt to append the serialized record as a single line to the journal file
+        if not run_async(
+            content=_serialize_line(value=record) + "\n",
+            function=append_file,
+            path=path,
+        ):
+            # Log the failure
+            self._logger.info(
+                message=f"Failed to append to journal '{path}'",
+            )
+
+            # Raise a PebbleCommitError exception
+            raise PebbleCommitError(f"Failed to append to journal '{path}'")
+
     def commit(
         self,
         database_or_table: dict[str, Any],
+        merge: bool = True,
     ) -> None:
         """
         Commit the changes to the database or table.
 
         Args:
             database_or_table (dict[str, Any]): The database or table to commit.
+            merge (bool, optional): Whether to merge the database or table into the existing file.
+                Pass False to replace the file with a full snapshot. Defaults to True.
 
         Returns:
             None
         """
         try:
-            # Attempt to read the database or table from a file
-            string: str = run_async(
-                function=read_file_if_not_exists,
-                path=Path(database_or_table["path"]),
-            )
-
-            # Check if the read data is an empty string
-            if string == "":
-                # Attempt to write the database or table to a file
-                run_async(
-                    content=DataConversionUtils.serialize(value=database_or_table),
-                    function=write_file_if_not_exists,
+            # Check if the database or table should be merged into the existing file
+            if merge:
+                # Attempt to read the database or table from a file
+                string: str = run_async(
+                    function=read_file_if_not_exists,
                     path=Path(database_or_table["path"]),
                 )
 
-                # Return early
-                return
+                # Check if the read data is an empty string
+                if string == "":
+                    # Attempt to write the database or table to a file
+                    run_async(
+                        content=_serialize(value=database_or_table),
+                        function=write_file_if_not_exists,
+                        path=Path(database_or_table["path"]),
+                    )
+
+                    # Return early
+                    return
 
-            # Deserialize the read data
-            old: dict[str, Any] = DataConversionUtils.deserialize(value=string)
+                # Deserialize the read data
+                old: dict[str, Any] = _deserialize(value=string)
 
-            # Merge the old and new data
-            merged: dict[str, Any] = merge_dicts(new=database_or_table, old=old)
+                # Merge the old and new data
+                database_or_table = merge_dicts(new=database_or_table, old=old)
 
-            # Serialize the merged data
-            serialized: str = DataConversionUtils.serialize(value=merged)
+            # Serialize the merged data (or the full snapshot)
+            serialized: str = _serialize(value=database_or_table)
 
             # Create a temporary file
             temporary: Path = Path(
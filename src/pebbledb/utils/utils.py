@@ -25,13 +25,13 @@ from typing import (
 )
 
 
-__all__: Final[list[str]] = [
+__all__: Final[tuple[str, ...]] = (
     "analyze_property",
     "analyze_typing",
     "merge_dicts",
     "NotACoroutineFunctionError",
     "run_async",
-]
+)
 
 
 # Initialize the asyncio.AbstractEventLoop object to None
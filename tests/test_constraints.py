@@ -0,0 +1,124 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-13
+"""
+
+from typing import Any, Callable
+
+import pytest
+
+from pebbledb.core.constraints import (
+    PebbleChoiceConstraint,
+    PebbleConstraint,
+    PebbleIsNullConstraint,
+    PebbleMaxLengthConstraint,
+    PebbleMinLengthConstraint,
+    PebbleNotNullConstraint,
+    PebbleRangeConstraint,
+    PebbleRegexConstraint,
+    PebbleRequiredConstraint,
+    PebbleTypeConstraint,
+    PebbleUniqueConstraint,
+    compile_schema_validator,
+)
+
+VALUES: list[Any] = [
+    None,
+    "",
+    "a",
+    "abc",
+    "abcdef",
+    "a1",
+    "1a",
+    "123",
+    0,
+    5,
+    10.5,
+    11,
+    [1],
+    [1, 2, 3],
+]
+
+
+class EvenConstraint(PebbleConstraint):
+    """
+    A constraint of an unknown type accepting even integers.
+    """
+
+    def validate(self, value: Any) -> bool:
+        return isinstance(value, int) and value % 2 == 0
+
+
+def validate_or_error(validate: Callable[[Any], bool], value: Any) -> Any:
+    """
+    Return the result of the passed validate call, or the type of the raised exception.
+    """
+
+    try:
+        return validate(value)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        PebbleChoiceConstraint(choices=["a", 5, [1]]),
+        PebbleIsNullConstraint(),
+        PebbleMaxLengthConstraint(length=3),
+        PebbleMinLengthConstraint(length=2),
+        PebbleNotNullConstraint(),
+        PebbleRangeConstraint(maximum=10.5, minimum=0),
+        PebbleRegexConstraint(pattern=r"[a-z]+\d*$"),
+        PebbleTypeConstraint(type_=str),
+        EvenConstraint(),
+    ],
+    ids=type,
+)
+def test_fused_validator_agrees_with_validate(constraint: PebbleConstraint) -> None:
+    validator: Callable[[dict[str, Any]], bool] = compile_schema_validator(
+        constraints_by_field={"field": [constraint]}
+    )
+
+    for value in VALUES:
+        assert validate_or_error(
+            lambda value: validator({"field": value}), value
+        ) == validate_or_error(constraint.validate, value), value
+
+
+def test_fused_validator_agrees_with_required_validate() -> None:
+    for allow_null in (False, True):
+        constraint: PebbleRequiredConstraint = PebbleRequiredConstraint(
+            allow_null=allow_null, field="other"
+        )
+        validator: Callable[[dict[str, Any]], bool] = compile_schema_validator(
+            constraints_by_field={"field": [constraint]}
+        )
+
+        for entry in ({}, {"other": None}, {"other": 1}):
+            assert validator(entry) == constraint.validate(entry)
+
+
+def test_fused_validator_agrees_with_combined_constraints() -> None:
+    constraints: list[PebbleConstraint] = [
+        PebbleTypeConstraint(type_=str),
+        PebbleMinLengthConstraint(length=2),
+        PebbleMaxLengthConstraint(length=3),
+        PebbleRegexConstraint(pattern=r"[a-z]"),
+        PebbleRegexConstraint(pattern=r".*\d$"),
+    ]
+    validator: Callable[[dict[str, Any]], bool] = compile_schema_validator(
+        constraints_by_field={"field": constraints}
+    )
+
+    for value in VALUES:
+        expected: bool = all(constraint.validate(value) for constraint in constraints)
+
+        assert validator({"field": value}) == expected, value
+
+
+def test_unique_constraint_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        compile_schema_validator(
+            constraints_by_field={"field": [PebbleUniqueConstraint(field="field")]}
+        )
@@ -0,0 +1,171 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-13
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pebbledb.core.constants import CWD
+from pebbledb.core.database import (
+    PebbleDatabase,
+    PebbleDatabaseBuilder,
+    PebbleDatabaseLoader,
+)
+from pebbledb.core.table import PebbleTable
+from pebbledb.core.utils import _deserialize_line, _serialize_line
+
+
+def build_database(path: Path) -> PebbleDatabase:
+    """
+    Build a new, empty PebbleDatabase instance named 'test' in the passed directory.
+    """
+
+    return (
+        PebbleDatabaseBuilder()
+        .with_created_at()
+        .with_data(value={})
+        .with_identifier()
+        .with_name(value="test")
+        .with_path(value=path)
+        .build()
+    )
+
+
+@pytest.fixture
+def committed(tmp_path: Path) -> Path:
+    """
+    Return the path to a committed database file holding two tables.
+    """
+
+    database: PebbleDatabase = build_database(path=tmp_path)
+    database.create_table(data={}, identifier="a", name="alpha")
+    database.create_table(data={}, identifier="b", name="beta")
+    database.commit()
+
+    return tmp_path / "test.json"
+
+
+def test_journal_round_trip(committed: Path) -> None:
+    database: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+    database.create_table(data={}, identifier="c", name="gamma")
+    database.remove(identifier=0)
+    database.commit()
+
+    assert committed.with_suffix(".journal").exists()
+
+    loaded: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+
+    assert list(loaded) == [1, 2]
+    assert loaded.get_table(identifier="c").name == "gamma"
+
+
+def test_read_only_commit_appends_no_journal_record(committed: Path) -> None:
+    database: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+    database[0]
+    database.all()
+    database.to_dict()
+    database.get_table(identifier="a")
+    database.commit()
+
+    assert not committed.with_suffix(".journal").exists()
+
+
+def test_in_place_edit_is_committed_through_setitem(committed: Path) -> None:
+    database: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+    entry: dict = database[0]
+    entry["name"] = "inplace"
+    database[0] = entry
+    database.commit()
+
+    assert PebbleDatabaseLoader.load(path=committed)[0]["name"] == "inplace"
+
+
+def test_get_table_sees_identifier_changed_in_place(tmp_path: Path) -> None:
+    database: PebbleDatabase = build_database(path=tmp_path)
+    database.create_table(data={}, identifier="a", name="alpha")
+    database.create_table(data={}, identifier="b", name="beta")
+
+    assert database.get_table(identifier="a").name == "alpha"
+
+    database[0]["identifier"] = "c"
+    database.entries[1]["identifier"] = "a"
+
+    assert database.get_table(identifier="a").name == "beta"
+    assert database.get_table(identifier="c").name == "alpha"
+
+    with pytest.raises(KeyError):
+        database.get_table(identifier="b")
+
+
+def test_fresh_instance_keeps_journaled_changes(committed: Path) -> None:
+    database: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+    database.update(entry={"name": "journaled"}, identifier=0)
+    database.create_table(data={}, identifier="c", name="gamma")
+    database.commit()
+
+    build_database(path=committed.parent).commit()
+
+    loaded: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+
+    assert not committed.with_suffix(".journal").exists()
+    assert loaded[0]["name"] == "journaled"
+    assert loaded.get_table(identifier="c").name == "gamma"
+
+
+def test_partial_last_record_is_skipped(committed: Path) -> None:
+    database: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+    database.update(entry={"name": "journaled"}, identifier=0)
+    database.commit()
+
+    journal: Path = committed.with_suffix(".journal")
+    complete: bytes = journal.read_bytes()
+
+    with journal.open("ab") as file:
+        file.write(b'{"delete":["1"],"ups')
+
+    loaded: PebbleDatabase = PebbleDatabaseLoader.load(path=committed)
+
+    assert loaded[0]["name"] == "journaled"
+    assert 1 in loaded
+    assert journal.read_bytes() == complete
+
+    loaded.update(entry={"name": "after"}, identifier=1)
+    loaded.commit()
+
+    assert PebbleDatabaseLoader.load(path=committed)[1]["name"] == "after"
+
+
+def test_journal_record_is_a_single_line() -> None:
+    record: dict = {"upsert": {"0": {"name": "line\nbreak", "path": Path("/tmp")}}}
+
+    line: str = _serialize_line(value=record)
+
+    assert "\n" not in line
+    assert _deserialize_line(value=line.encode("utf-8")) == {
+        "upsert": {"0": {"name": "line\nbreak", "path": "/tmp"}}
+    }
+
+
+def test_update_merges_into_the_row_of_the_identifier(tmp_path: Path) -> None:
+    database: PebbleDatabase = build_database(path=tmp_path)
+    database.create_table(data={}, identifier="a", name="alpha")
+    database.create_table(data={}, identifier="b", name="beta")
+
+    assert database.update(entry={"name": "renamed"}, identifier="1") is True
+
+    assert database[1]["name"] == "renamed"
+    assert database[1]["identifier"] == "b"
+    assert database[0]["name"] == "alpha"
+    assert len(database) == 2
+
+    with pytest.raises(KeyError):
+        database.update(entry={"name": "missing"}, identifier=2)
+
+
+def test_table_from_entry_without_path_defaults_to_its_file() -> None:
+    assert PebbleTable.from_dict(value={"name": "alpha"}).path == CWD / "alpha.json"
+    assert PebbleTable.from_dict(
+        value={"name": "alpha", "path": "/tmp/stored.json"}
+    ).path == Path("/tmp/stored.json")
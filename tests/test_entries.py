@@ -0,0 +1,131 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-13
+"""
+
+import pytest
+
+from pebbledb.core.constants import MISSING
+from pebbledb.core.database import PebbleEntries
+
+FAR: int = 20250101
+
+
+@pytest.fixture
+def entries() -> PebbleEntries:
+    """
+    Return entries holding the list keys 0 and 2, a far integer key and a string key.
+    """
+
+    return PebbleEntries(
+        items=[
+            (0, "zero"),
+            (2, "two"),
+            (FAR, "far"),
+            ("name", "string"),
+        ]
+    )
+
+
+def test_far_key_does_not_pad_the_list(entries: PebbleEntries) -> None:
+    assert len(entries) == 4
+    assert list(entries) == [0, 2, FAR, "name"]
+    assert entries.append(value="three") == 3
+    assert list(entries) == [0, 2, 3, FAR, "name"]
+
+
+def test_contains(entries: PebbleEntries) -> None:
+    assert 0 in entries
+    assert 1 not in entries
+    assert 3 not in entries
+    assert FAR in entries
+    assert FAR + 1 not in entries
+    assert "name" in entries
+    assert -1 not in entries
+
+
+def test_get(entries: PebbleEntries) -> None:
+    assert entries.get(2) == "two"
+    assert entries.get(1) is None
+    assert entries.get(FAR) == "far"
+    assert entries.get(FAR + 1, "default") == "default"
+    assert entries[FAR] == "far"
+
+    with pytest.raises(KeyError):
+        entries[1]
+
+    with pytest.raises(KeyError):
+        entries[FAR + 1]
+
+
+def test_set_existing_far_key(entries: PebbleEntries) -> None:
+    entries[FAR] = "replaced"
+
+    assert entries[FAR] == "replaced"
+    assert len(entries) == 4
+    assert list(entries) == [0, 2, FAR, "name"]
+    assert entries.append(value="three") == 3
+
+
+def test_pop(entries: PebbleEntries) -> None:
+    assert entries.pop(FAR) == "far"
+    assert entries.pop(FAR, MISSING) is MISSING
+    assert entries.pop(2) == "two"
+    assert entries.pop(2, None) is None
+    assert len(entries) == 2
+
+    with pytest.raises(KeyError):
+        entries.pop(FAR)
+
+
+def test_iteration_order(entries: PebbleEntries) -> None:
+    assert list(entries) == [0, 2, FAR, "name"]
+    assert list(entries.iter_values()) == ["zero", "two", "far", "string"]
+    assert entries.copy() == {0: "zero", 2: "two", FAR: "far", "name": "string"}
+
+
+def test_missing(entries: PebbleEntries) -> None:
+    assert entries.missing(keys=[0, 1, 2, 3, FAR, FAR + 1, "name", "other"]) == [
+        1,
+        3,
+        FAR + 1,
+        "other",
+    ]
+
+
+def test_append_moves_reached_overflow_key() -> None:
+    entries: PebbleEntries = PebbleEntries(items=[(0, "zero"), (1500, "far")])
+
+    assert 1500 in entries
+    assert list(entries) == [0, 1500]
+
+    entries.extend(values=["value"] * 1499)
+
+    assert entries.append(value="appended") == 1501
+    assert entries[1500] == "far"
+    assert list(entries)[-2:] == [1500, 1501]
+    assert len(entries) == 1502
+
+
+def test_extend_skips_overflow_keys_in_its_range() -> None:
+    entries: PebbleEntries = PebbleEntries(items=[(0, "zero"), (3000, "far")])
+
+    assert entries.extend(values=["value"] * 2000) == range(1, 2001)
+    assert list(entries)[-1] == 3000
+
+    keys: range = entries.extend(values=["batch"] * 1500)
+
+    assert keys == range(3001, 4501)
+    assert entries[3000] == "far"
+    assert 2001 not in entries
+    assert entries.missing(keys=keys) == []
+    assert len(entries) == 3502
+
+
+def test_compact_removes_trailing_tombstones(entries: PebbleEntries) -> None:
+    entries.pop(2)
+    entries.compact()
+
+    assert list(entries) == [0, FAR, "name"]
+    assert entries.append(value="one") == 1
+    assert list(entries) == [0, 1, FAR, "name"]
@@ -0,0 +1,45 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-13
+"""
+
+import pytest
+
+from pebbledb.core.model import PebbleModel
+
+
+class Point(PebbleModel):
+    x: int
+
+
+class CustomPoint(PebbleModel):
+    x: int
+
+    def __repr__(self) -> str:
+        return "CUSTOM-M"
+
+
+def test_str_matches_repr() -> None:
+    point: Point = Point(x=1)
+
+    assert str(point) == repr(point)
+
+
+def test_str_follows_overridden_repr() -> None:
+    assert str(CustomPoint(x=1)) == "CUSTOM-M"
+
+
+def test_unexpected_keyword_argument_is_rejected() -> None:
+    with pytest.raises(TypeError, match="got an unexpected keyword argument 'bogus'"):
+        Point(x=1, bogus=2)
+
+    with pytest.raises(TypeError, match="unexpected keyword argument 'bogus'"):
+        Point.from_records(records=[{"x": 1, "bogus": 2}])
+
+
+def test_type_error_names_the_quoted_field() -> None:
+    with pytest.raises(TypeError, match="Field 'x' expected"):
+        Point(x="1")
+
+    with pytest.raises(TypeError, match="Field 'x' expected"):
+        Point(x=1)["x"] = "1"
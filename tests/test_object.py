@@ -0,0 +1,27 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-13
+"""
+
+from pebbledb.core.object import PebbleObject
+
+
+class Point(PebbleObject):
+    x: int
+
+
+class CustomPoint(PebbleObject):
+    x: int
+
+    def __repr__(self) -> str:
+        return "CUSTOM-O"
+
+
+def test_str_matches_repr() -> None:
+    point: Point = Point(x=1)
+
+    assert str(point) == repr(point) == "<Point(x=1)>"
+
+
+def test_str_follows_overridden_repr() -> None:
+    assert str(CustomPoint(x=1)) == "CUSTOM-O"